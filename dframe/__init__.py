@@ -2,5 +2,12 @@ from .array import Array, as_dtype
 from .array import (is_na, is_missing, is_none,
                     which, find, where,
                     unique)
-from .dataframe import DataFrame, hstack, cbind, vstack, rbind
+from .dataframe import (DataFrame, DataFrameBuilder, LazyFrame,
+                        hstack, cbind, vstack, rbind)
 from .general import identical
+from .parallel import set_num_threads, get_num_threads
+from .memory import (set_memory_budget, get_memory_budget, memory_stats,
+                     reset_memory_stats)
+from .io import (read_csv_chunks, read_csv_parallel, scan_csv, read_binary,
+                 read_parquet, read_jsonl, read_sql)
+from .parallel.partition import map_partitions
@@ -2,15 +2,20 @@ from __future__ import absolute_import
 from __future__ import print_function
 from builtins import super, range
 
+import copy
+import numbers
 import numpy as np
 import pandas as pd
 from dateutil import parser
 
-from dframe.compat import Iterable
+from dframe.compat import (Iterable, IntegerArray, BooleanArray, StringDtype,
+                           PickleBuffer)
 from dframe.dtypes import (infer_dtype, to_bool, is_string, is_float, is_bool,
                            is_integer)
 from dframe.scalar import is_scalar, get_length, is_iterable_integer
 from dframe.general import identical
+from dframe.array.index import build_index
+from dframe.memory import memory as _memory
 from dframe.missing import (__not__, __neg__, __pos__, __abs__,
                             __eq__, __ne__, __ge__, __gt__, __le__,
                             __lt__, __or__, __and__, __xor__,
@@ -71,23 +76,137 @@ def nice_str(x):
     return output
 
 
+def _object_series(values):
+    # pd.Series(values, dtype=object) tries to broadcast nested sequences
+    # (such as Array objects), so fill the object buffer element by element.
+    data = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        data[index] = value
+    return pd.Series(data)
+
+
+def _resolve_index(key, length):
+    ''' Resolve a positional key (slice, logical iterable or iterable of
+        int) for a sequence of the given length into a slice or an int64
+        numpy array of non-negative positions, so that the key can be
+        applied to many columns without being scanned again.
+
+        Returns None for keys that cannot be resolved this way; such keys
+        must be applied with Array.__getitem__.
+    '''
+    if isinstance(key, slice):
+        start, stop, step = key.indices(length)
+        if step > 0:
+            return slice(start, stop, step)
+        # A negative step can have stop = -1, which a slice would wrap
+        return np.arange(start, stop, step, dtype=np.int64)
+    if isinstance(key, Array):
+        if issubclass(key.dtype, numbers.Integral):
+            # Logical and integer Arrays are converted without a scan over
+            # the elements
+            values, missing = key._to_buffers()
+            if missing.any():
+                if key.dtype is bool:
+                    msg = 'logical index contains missing values (None)'
+                else:
+                    msg = 'index contains missing values (None)'
+                raise IndexError(msg)
+        else:
+            values = key._data.values
+    elif isinstance(key, np.ndarray):
+        values = key
+    elif isinstance(key, Iterable) and not is_string(key):
+        items = list(key)
+        values = np.asarray(items)
+        if values.dtype.kind in 'iub' and len(set(map(type, items))) > 1:
+            # np.asarray coerces mixed keys such as [True, 1] to one type;
+            # Array.__getitem__ rejects them instead
+            return None
+    else:
+        return None
+    if values.ndim != 1:
+        return None
+    if len(values) == 0:
+        return np.array([], dtype=np.int64)
+    kind = values.dtype.kind
+    if kind == 'O':
+        types = set(map(type, values))
+        if types <= {bool, type(None)} and type(None) in types:
+            msg = 'logical index contains missing values (None)'
+            raise IndexError(msg)
+        return None
+    elif kind == 'b':
+        if len(values) != length:
+            msg = 'logical index does not match array length'
+            raise IndexError(msg)
+        return np.flatnonzero(values)
+    elif kind in 'iu':
+        index = values.astype(np.int64)
+        if len(index) > 0 and (index.min() < -length or
+                               index.max() >= length):
+            msg = 'index out of range'
+            raise IndexError(msg)
+        return np.where(index < 0, index + length, index)
+    else:
+        return None
+
+
 class _ArraySlice(object):
     def __init__(self, _data):
         assert isinstance(_data, pd.Series)
         self._data = _data
 
 
+class _ArrayData(object):
+    # Object pd.Series whose missing values are already None and whose dtype
+    # is already known. Array construction skips the NaN scan and inference.
+    def __init__(self, _data, dtype):
+        assert isinstance(_data, pd.Series)
+        assert isinstance(dtype, type)
+        self._data = _data
+        self.dtype = dtype
+
+
+class _LazyArrayData(object):
+    # Data that is materialized on first access. load() must return an object
+    # pd.Series of the given length whose missing values are None.
+    def __init__(self, load, length, dtype):
+        assert callable(load)
+        assert isinstance(dtype, type)
+        self.load = load
+        self.length = length
+        self.dtype = dtype
+
+
 class Array(object):
     _print_max_n_elements = 10
+    _series = None
+    _load = None
+    _index_kind = None
+    _index = None
+    _chunks = None
+    _offsets = None
+    _shared = False
 
     def __init__(self, data=[]):
         if isinstance(data, type(self)):
-            # Data is not copied a la pd.Series
-            self._data = data._data
+            # Data is not copied a la pd.Series. Both Arrays share the data
+            # until one of them is modified (copy-on-write).
+            if data._chunks is not None:
+                self._set_chunks(list(data._chunks))
+            else:
+                self._data = data._data
+                self._shared = data._shared = True
             self.dtype = data.dtype
         elif isinstance(data, _ArraySlice):
             self._data = data._data
             self.dtype = infer_dtype(self._data)
+        elif isinstance(data, _ArrayData):
+            self._data = data._data
+            self.dtype = data.dtype
+        elif isinstance(data, _LazyArrayData):
+            self._set_lazy(data.load, data.length)
+            self.dtype = data.dtype
         else:
             self._data = pd.Series(data, dtype=object)
             # This step is really slow! Avoid this when possible.
@@ -99,6 +218,110 @@ class Array(object):
                     pass
             self.dtype = infer_dtype(self._data)
 
+    @property
+    def _data(self):
+        # Lazy data is loaded the first time it is needed.
+        series = self._series
+        if series is None:
+            series = self._series = self._load()
+            self._load = None
+        if _memory.enabled:
+            # Tracked against the memory budget (see dframe.memory). Another
+            # thread may spill the data meanwhile; series stays valid.
+            _memory.touch(self)
+        return series
+
+    @_data.setter
+    def _data(self, value):
+        if _memory.enabled:
+            _memory.release(self)
+        self._series = value
+        self._load = None
+        self._index = None
+        self._chunks = None
+        self._offsets = None
+        self._shared = False
+
+    def _share(self, other):
+        # Marks the data of other as shared with the data of self
+        other._shared = self._shared = True
+        return other
+
+    def _snapshot(self):
+        # An Array with the current elements of self that later changes to
+        # self do not affect. Data is shared (copy-on-write); lazy data is
+        # loaded once, by whichever of the two Arrays needs it first.
+        if self._is_loaded() or self._chunks is not None:
+            return type(self)(self)
+        load, loaded = self._load, []
+
+        def load_once():
+            if not loaded:
+                loaded.append(load())
+            return loaded[0]
+
+        self._set_lazy(load_once, len(self))
+        output = type(self)(_LazyArrayData(load_once, len(self), self.dtype))
+        self._shared = output._shared = True
+        return output
+
+    def _copy_on_write(self):
+        # Called before the data is modified in place. Data that is shared
+        # with other Arrays is copied first, so that they are unaffected.
+        if self._shared:
+            self._data = self._data.copy()
+
+    def _set_lazy(self, load, length):
+        if _memory.enabled:
+            _memory.release(self)
+        self._series = None
+        self._load = load
+        self._length = length
+
+    def _is_loaded(self):
+        return self._series is not None
+
+    def _set_chunks(self, chunks):
+        # The elements are the concatenation of the chunks, snapshots of
+        # Arrays (see _snapshot) that are never modified in place. The chunks
+        # are concatenated into one Series (consolidated) the first time
+        # _data is needed.
+        self._set_lazy(self._consolidate, sum(len(chunk) for chunk in chunks))
+        self._chunks = chunks
+        self._offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+
+    def _consolidate(self):
+        if len(self._chunks) == 0:
+            values = np.array([], dtype=object)
+        else:
+            values = np.concatenate([chunk._values()
+                                     for chunk in self._chunks])
+        self._chunks = None
+        self._offsets = None
+        return pd.Series(values, dtype=object)
+
+    def _spans(self, start, stop):
+        # (chunk, start, stop) within each chunk that overlaps the elements
+        # start:stop
+        start, stop, _ = slice(start, stop).indices(len(self))
+        first = int(np.searchsorted(self._offsets, start, side='right')) - 1
+        for i in range(max(first, 0), len(self._chunks)):
+            offset = self._offsets[i]
+            if offset >= stop:
+                break
+            yield (self._chunks[i], max(start - offset, 0),
+                   min(stop - offset, len(self._chunks[i])))
+
+    @property
+    def chunks(self):
+        ''' The Arrays that make up a chunked Array (see Array.from_chunks).
+            An Array that is not chunked, or that was consolidated, is its
+            own single chunk.
+        '''
+        if self._chunks is None:
+            return [self]
+        return list(self._chunks)
+
     def _is_valid_dtype_element(self, element):
         if self.dtype is type(None):
             return True
@@ -109,6 +332,60 @@ class Array(object):
         return all(self._is_valid_dtype_element(element)
                    for element in iterable)
 
+    def _create_index(self, kind):
+        # The kind is kept until the index is dropped; the index itself is
+        # rebuilt on the next lookup after the Array is modified.
+        self._index = None
+        self._index_kind = kind
+        self._get_index()
+
+    def _drop_index(self):
+        self._index_kind = None
+        self._index = None
+
+    def _get_index(self):
+        if self._index_kind is None:
+            return None
+        if self._index is None:
+            values, missing = self._to_buffers()
+            self._index = build_index(self._index_kind, values, missing)
+        return self._index
+
+    def _can_lookup(self, value):
+        # Lookups must give the same answer as comparing elements one by
+        # one, so only values of a compatible type use the index.
+        if value is None or self.dtype is type(None):
+            return False
+        elif type(value) is self.dtype:
+            return True
+        numeric = (numbers.Real, np.number)
+        return (issubclass(self.dtype, numeric) and
+                not issubclass(self.dtype, (bool, np.bool_)) and
+                isinstance(value, numeric) and
+                not isinstance(value, (bool, np.bool_)))
+
+    def _lookup(self, op, value):
+        # Sorted positions of the elements that satisfy `element op value`,
+        # or None if there is no index that can answer the lookup.
+        index = self._get_index()
+        if index is None or op not in index.ops:
+            return None
+        if op == 'in':
+            if not all(self._can_lookup(v) for v in value):
+                return None
+        elif not self._can_lookup(value):
+            return None
+        return index.lookup(op, value)
+
+    def _compare_using_index(self, op, value):
+        # Comparison result as an Array, or None if no index applies
+        positions = self._lookup(op, value)
+        if positions is None:
+            return None
+        result = np.zeros(len(self), dtype=bool)
+        result[positions] = True
+        return type(self).from_numpy(result, self._missing())
+
     def _convert_logical_index_to_int_index(self, key):
         assert infer_dtype(key) is bool
         if get_length(key) == len(self):
@@ -137,7 +414,14 @@ class Array(object):
                    'convert index to list')
             raise TypeError(msg)
         elif is_integer(key):
+            if self._chunks is not None:
+                return self._get_from_chunks(key)
             return self._data.iloc[key]
+        elif isinstance(key, slice) and self._chunks is not None:
+            return self._take(key)
+        elif isinstance(key, slice):
+            # A slice is a view of the data
+            return self._share(type(self)(_ArraySlice(self._data.iloc[key])))
         elif isinstance(key, Iterable) and infer_dtype(key) is bool:
             key = self._convert_logical_index_to_int_index(key)
             return type(self)(_ArraySlice(self._data.iloc[key]))
@@ -174,6 +458,7 @@ class Array(object):
     #         del self._data[k]
 
     def __delitem__(self, key):
+        self._index = None
         if is_float(key):
             msg = 'array index cannot be float; please cast to int'
             raise KeyError(msg)
@@ -190,6 +475,7 @@ class Array(object):
         elif is_integer(key):
             # We can only drop by pd.Series index (not using row numbers).
             # So, we ensure that the Series index is the same as row numbers.
+            self._copy_on_write()
             self._data.reset_index(drop=True, inplace=True)
             del self._data[key]
             self.dtype = infer_dtype(self._data)
@@ -206,6 +492,7 @@ class Array(object):
             raise IndexError(msg)
 
     def __setitem__(self, key, value):
+        self._index = None
         if is_float(key):
             msg = 'array index cannot be float; please cast to int'
             raise KeyError(msg)
@@ -221,29 +508,43 @@ class Array(object):
             raise TypeError(msg)
         elif is_integer(key):
                 if self._is_valid_dtype_element(value):
-                    self._data.iloc[key] = value
+                    self._copy_on_write()
+                    # Written into the object buffer directly, because
+                    # Series.iloc may convert the Series to a numeric dtype
+                    self._data.values[key] = value
                 else:
                     msg = 'value type does not match array dtype = {}'
                     raise ValueError(msg.format(self.dtype.__name__))
         else:
             if is_scalar(value):
                 if self._is_valid_dtype_element(value):
+                    self._copy_on_write()
                     self._data.iloc[key] = value
                 else:
                     msg = 'value type does not match array dtype = {}'
                     raise ValueError(msg.format(self.dtype.__name__))
             else:
                 if self._is_valid_dtype_iterable(value):
+                    self._copy_on_write()
                     self._data.iloc[key] = value
                 else:
                     msg = 'value type does not match array dtype = {}'
                     raise ValueError(msg.format(self.dtype.__name__))
-        self._data = self._data.astype(object)
+        if self._data.dtype != object:
+            self._data = self._data.astype(object)
         self.dtype = infer_dtype(self._data)
 
     def extend(self, other):
         assert isinstance(other, type(self))
         if (self.dtype == other.dtype) or (self.dtype is type(None)):
+            if self._chunks is not None:
+                # The other Array becomes one more chunk
+                self._set_chunks(self._chunks + [chunk._snapshot()
+                                                 for chunk in other.chunks])
+                self._index = None
+                if self.dtype is type(None):
+                    self.dtype = other.dtype
+                return
             self._data = self._data.append(other._data, ignore_index=True)
             self.dtype = infer_dtype(self._data)
         else:
@@ -270,28 +571,407 @@ class Array(object):
                 return False
 
     def __len__(self):
-        return len(self._data)
+        if self._series is None:
+            return self._length
+        return len(self._series)
+
+    def __copy__(self):
+        # Copy-on-write, like Array(self); __reduce_ex__ is only for pickling
+        output = type(self)(self)
+        output._index_kind = self._index_kind
+        output._index = self._index
+        return output
+
+    def __deepcopy__(self, memo):
+        values = np.empty(len(self), dtype=object)
+        values[:] = [copy.deepcopy(value, memo) for value in self._values()]
+        output = type(self)(_ArrayData(pd.Series(values, dtype=object),
+                                       self.dtype))
+        output._index_kind = self._index_kind
+        memo[id(self)] = output
+        return output
+
+    def __reduce_ex__(self, protocol):
+        # Pickled as the typed buffers of dframe.array.codec instead of a
+        # Series of boxed elements. With protocol 5 the buffers are
+        # PickleBuffers, which a buffer_callback can transfer out-of-band.
+        # The unpickled Array is decoded on first access.
+        # Imported here because dframe.array.codec imports Array
+        from dframe.array.codec import encode_array, _unpickle_array
+        kind, buffers = encode_array(self)
+        out_of_band = protocol >= 5 and PickleBuffer is not None
+        payloads = {}
+        for name, buffer in buffers.items():
+            payload = PickleBuffer(buffer) if out_of_band else buffer
+            payloads[name] = (buffer.dtype.str, payload)
+        return _unpickle_array, (kind, payloads, len(self), self._index_kind)
+
+    def _take(self, index):
+        # index is a slice or an int64 numpy array of valid, non-negative
+        # positions, as returned by _resolve_index. The dtype is carried
+        # over instead of being inferred from the selected elements again.
+        if self._chunks is not None:
+            values = self._take_from_chunks(index)
+        else:
+            values = self._data.values[index]
+        if self.dtype is type(None) or pd.isnull(values).all():
+            dtype = type(None)
+        else:
+            dtype = self.dtype
+        output = type(self)(_ArrayData(pd.Series(values, dtype=object), dtype))
+        if isinstance(index, slice) and self._chunks is None:
+            # A slice is a view of the data
+            self._share(output)
+        return output
+
+    def _get_from_chunks(self, key):
+        n = len(self)
+        position = key + n if key < 0 else key
+        if not 0 <= position < n:
+            raise IndexError('index out of bounds')
+        i = int(np.searchsorted(self._offsets, position, side='right')) - 1
+        return self._chunks[i]._values()[position - self._offsets[i]]
+
+    def _take_from_chunks(self, index):
+        if isinstance(index, slice):
+            index = np.arange(len(self))[index]
+        if np.all(index[1:] >= index[:-1]):
+            # Sorted positions, e.g. from a logical index, are split into
+            # one contiguous run per chunk
+            bounds = np.searchsorted(index, self._offsets).tolist()
+            parts = [chunk._values()[index[a:b] - offset]
+                     for chunk, offset, a, b in zip(self._chunks,
+                                                    self._offsets,
+                                                    bounds[:-1], bounds[1:])
+                     if b > a]
+            if len(parts) == 0:
+                return np.array([], dtype=object)
+            return np.concatenate(parts)
+        ids = np.searchsorted(self._offsets, index, side='right') - 1
+        # Positions are grouped by chunk, keeping their order within a chunk
+        order = np.argsort(ids, kind='mergesort')
+        counts = np.bincount(ids, minlength=len(self._chunks)).tolist()
+        values = np.empty(len(index), dtype=object)
+        stop = 0
+        for chunk, offset, count in zip(self._chunks, self._offsets, counts):
+            if count > 0:
+                start, stop = stop, stop + count
+                selected = order[start:stop]
+                values[selected] = chunk._values()[index[selected] - offset]
+        return values
+
+    def tolist(self):
+        if self._chunks is not None:
+            output = []
+            for chunk in self._chunks:
+                output.extend(chunk.tolist())
+            return output
+        return self._data.tolist()
+
+    def _values(self, start=None, stop=None):
+        # Object numpy array of the elements start:stop. Missing values are
+        # None. The result may be a view and must not be modified.
+        if self._chunks is not None:
+            parts = [chunk._values(a, b)
+                     for chunk, a, b in self._spans(start, stop)]
+            if len(parts) == 0:
+                return np.array([], dtype=object)
+            elif len(parts) == 1:
+                return parts[0]
+            return np.concatenate(parts)
+        return self._data.values[start:stop]
+
+    @classmethod
+    def from_numpy(cls, values, mask=None):
+        ''' Create an Array from a 1-dimensional numpy array.
+
+            Integer, unsigned integer, float, bool and string arrays are
+            converted with one vectorized pass instead of scanning every
+            element for NaN. NaN values in float arrays become missing values
+            (None). Other numpy dtypes go through the regular constructor.
+
+            Args
+            -----
+            values (np.ndarray): 1-dimensional numpy array.
+            mask (np.ndarray): optional bool array of the same length;
+                True marks a missing value.
+
+            Returns
+            --------
+            Array
+        '''
+        values = np.asarray(values)
+        if values.ndim != 1:
+            msg = 'numpy array dimensions must be exactly 1'
+            raise ValueError(msg)
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != values.shape:
+                msg = 'mask must have the same shape as values'
+                raise ValueError(msg)
+
+        kind = values.dtype.kind
+        if kind == 'f':
+            missing = np.isnan(values)
+        elif kind in 'iubSU':
+            missing = np.zeros(len(values), dtype=bool)
+        elif kind == 'O':
+            missing = pd.isnull(values)
+        else:
+            if mask is not None:
+                values = values.astype(object)
+                values[mask] = None
+            return cls(values)
+        if mask is not None:
+            missing = missing | mask
+
+        data = values.astype(object)
+        if missing.any():
+            data[missing] = None
+        if missing.all():
+            dtype = type(None)
+        elif kind == 'O':
+            dtype = infer_dtype(data[~missing])
+        else:
+            dtype = type(data[np.argmin(missing)])
+        return cls(_ArrayData(pd.Series(data, dtype=object), dtype))
+
+    @classmethod
+    def from_pandas(cls, series):
+        ''' Create an Array from a pandas Series without modifying it. The
+            index of the Series is ignored. Numpy-backed and nullable
+            numeric or bool columns are converted with Array.from_numpy.
+
+            Array stores Python objects, so numeric and bool columns are
+            boxed into an object Series (one vectorized astype(object) plus
+            the null mask) rather than kept in their native numpy dtype.
+
+            Args
+            -----
+            series (pd.Series)
+
+            Returns
+            --------
+            Array
+        '''
+        assert isinstance(series, pd.Series)
+        values = series.values
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind in 'iufbSUO':
+                return cls.from_numpy(values)
+        elif getattr(series.dtype, 'kind', 'O') in 'iufb':
+            # Nullable extension arrays: fill missing values so the data can
+            # be viewed as a plain numpy array and pass the null mask along.
+            missing = np.asarray(series.isna(), dtype=bool)
+            numpy_dtype = {'i': np.int64, 'u': np.uint64,
+                           'f': np.float64, 'b': bool}[series.dtype.kind]
+            values = np.asarray(series.astype(object))
+            if missing.any():
+                values = values.copy()
+                values[missing] = 0
+            return cls.from_numpy(values.astype(numpy_dtype), missing)
+        return cls(series.reset_index(drop=True))
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        ''' Create an Array that is the concatenation of a sequence of Arrays
+            (chunks) without copying them. Iteration, comparisons, isin,
+            conversion to numpy or pandas and selection of elements with
+            lists, masks or slices read the chunks one at a time. The chunks
+            are concatenated into one buffer only when the elements are
+            modified or accessed through the underlying Series.
+
+            The chunks share their data with the Arrays they came from
+            until either is modified (copy-on-write), so later changes to
+            those Arrays do not change the chunked Array.
+
+            Args
+            -----
+            chunks (list-like): Array objects of the same dtype. Arrays of
+                NoneType (empty or all None) can be mixed with any dtype.
+
+            Returns
+            --------
+            Array
+        '''
+        flat = []
+        for chunk in chunks:
+            if not isinstance(chunk, cls):
+                msg = 'chunks must be {} objects'.format(cls.__name__)
+                raise TypeError(msg)
+            flat.extend(c._snapshot() for c in chunk.chunks if len(c) > 0)
+        dtypes = set(chunk.dtype for chunk in flat).difference({type(None)})
+        if len(dtypes) > 1:
+            msg = 'chunks must have the same dtype'
+            raise TypeError(msg)
+        dtype = dtypes.pop() if dtypes else type(None)
+        output = cls(_ArrayData(pd.Series([], dtype=object), dtype))
+        output._set_chunks(flat)
+        return output
+
+    def _to_buffers(self, start=None, stop=None):
+        # Returns (values, missing) for elements start:stop: values is a numpy
+        # array in the natural dtype of the elements (int64, float64, bool,
+        # or object otherwise) and missing flags None(s). Missing positions
+        # in values are filled with 0, NaN, False or None respectively.
+        if self._chunks is not None and self.dtype is not type(None):
+            return self._chunk_buffers(start, stop)
+        values = self._values(start, stop)
+        missing = pd.isnull(values)
+        if self.dtype is type(None):
+            return values, missing
+        elif issubclass(self.dtype, (bool, np.bool_)):
+            numpy_dtype, fill = bool, False
+        elif issubclass(self.dtype, numbers.Integral):
+            numpy_dtype, fill = np.int64, 0
+        elif issubclass(self.dtype, numbers.Real):
+            numpy_dtype, fill = np.float64, np.nan
+        else:
+            return values, missing
+        if missing.any():
+            values = values.copy()
+            values[missing] = fill
+        try:
+            return values.astype(numpy_dtype), missing
+        except (OverflowError, TypeError, ValueError):
+            # For example, Python integers that do not fit into int64
+            return self._values(start, stop), missing
+
+    def _chunk_buffers(self, start, stop):
+        # _to_buffers of a chunked Array, computed chunk by chunk. Chunks of
+        # NoneType hold no values and are filled to match the other chunks.
+        spans = list(self._spans(start, stop))
+        if len(spans) == 0:
+            empty = _ArrayData(pd.Series([], dtype=object), self.dtype)
+            return type(self)(empty)._to_buffers()
+        parts = [None if chunk.dtype is type(None) else
+                 chunk._to_buffers(a, b) for chunk, a, b in spans]
+        dtypes = set(part[0].dtype for part in parts if part is not None)
+        if len(dtypes) != 1:
+            # Integers that do not fit into int64 in some chunks
+            values = self._values(start, stop)
+            return values, pd.isnull(values)
+        dtype = dtypes.pop()
+        fill = {'b': False, 'i': 0, 'f': np.nan}.get(dtype.kind)
+        values, missing = [], []
+        for part, (_, a, b) in zip(parts, spans):
+            if part is None:
+                part = np.full(b - a, fill, dtype=dtype), np.ones(b - a, bool)
+            values.append(part[0])
+            missing.append(part[1])
+        return np.concatenate(values), np.concatenate(missing)
+
+    def to_pandas(self):
+        ''' Convert the Array to a pandas Series. Integers with missing values
+            become a nullable Int64 Series, bools with missing values become
+            a nullable boolean Series and strings become a string Series when
+            the installed pandas supports these dtypes. Otherwise, missing
+            values are NaN in float Series and None in object Series.
+
+            Returns
+            --------
+            pd.Series
+        '''
+        values, missing = self._to_buffers()
+        has_missing = missing.any()
+        kind = values.dtype.kind
+        if kind == 'i' and has_missing:
+            if IntegerArray is not None:
+                return pd.Series(IntegerArray(values, missing))
+            return pd.Series(values.astype(np.float64)).where(~missing)
+        elif kind == 'b' and has_missing:
+            if BooleanArray is not None:
+                return pd.Series(BooleanArray(values, missing))
+            return pd.Series(self._values())
+        elif (kind == 'O' and StringDtype is not None and
+                self.dtype in (str, type(u''))):
+            return pd.Series(pd.array(values, dtype=StringDtype()))
+        elif kind == 'O':
+            return pd.Series(self._values())
+        else:
+            return pd.Series(values)
+
+    def _missing(self):
+        # Elements are never NaN inside an Array, so this flags None(s)
+        return pd.isnull(self._values())
+
+    def _numpy_dtype(self, missing):
+        # The narrowest numpy dtype that can hold the elements, using NaN
+        # for missing values where the dtype allows it.
+        if self.dtype is type(None):
+            return np.dtype(np.float64)
+        elif issubclass(self.dtype, (bool, np.bool_)):
+            return np.dtype(object) if missing.any() else np.dtype(bool)
+        elif issubclass(self.dtype, numbers.Integral):
+            if missing.any():
+                return np.dtype(np.float64)
+            else:
+                return np.dtype(np.int64)
+        elif issubclass(self.dtype, numbers.Real):
+            return np.dtype(np.float64)
+        else:
+            return np.dtype(object)
+
+    def to_numpy(self, dtype=None):
+        ''' Convert the Array to a 1-dimensional numpy array.
+
+            Args
+            -----
+            dtype (numpy dtype): optional dtype of the output. By default,
+                int becomes int64 (float64 if there are missing values),
+                float becomes float64, bool becomes bool (object if there
+                are missing values) and everything else becomes object.
+                Missing values become NaN for float dtypes and None for
+                object dtype.
+
+            Returns
+            --------
+            np.ndarray
+        '''
+        missing = self._missing()
+        if dtype is None:
+            dtype = self._numpy_dtype(missing)
+        dtype = np.dtype(dtype)
+        if (dtype.kind not in 'fcO') and missing.any():
+            msg = 'missing values (None) cannot be represented as {}'
+            raise ValueError(msg.format(dtype))
+        return self._values().astype(dtype)
 
     def __iter__(self):
-        for e in self._data:
-            yield e
+        if self._chunks is not None:
+            for chunk in self._chunks:
+                for e in chunk:
+                    yield e
+        else:
+            for e in self._data:
+                yield e
 
     def __str__(self):
         return self.__repr__()
 
     def __repr__(self):
-        if len(self._data) < self._print_max_n_elements:
-            output = [nice_str(e) for e in self._data]
+        if len(self) < self._print_max_n_elements:
+            output = [nice_str(e) for e in self]
             output = '[{}]'.format(', '.join(output))
         else:
             n = int(self._print_max_n_elements / 2)
-            start = [nice_str(e) for e in self._data.iloc[:n]]
-            end = [nice_str(e) for e in self._data.iloc[-n:]]
+            start = [nice_str(e) for e in self._values(None, n)]
+            end = [nice_str(e) for e in self._values(-n, None)]
             output = '[{}, ..., {}]'.format(', '.join(start), ', '.join(end))
         return output
 
     def isin(self, values):
         if isinstance(values, Iterable) and not is_string(values):
+            values = list(values)
+            # isin matches elements of exactly the same type (identical)
+            candidates = [v for v in values if type(v) is self.dtype]
+            positions = self._lookup('in', candidates)
+            if positions is not None:
+                output = np.zeros(len(self), dtype=bool)
+                output[positions] = True
+                if any(v is None for v in values):
+                    output |= self._missing()
+                return type(self).from_numpy(output)
             output = [False] * len(self)
             for i, e in enumerate(self):
                 for _, v in enumerate(values):
@@ -330,6 +1010,9 @@ class Array(object):
 
     def __eq__(self, other):
         if is_scalar(other):
+            output = self._compare_using_index('==', other)
+            if output is not None:
+                return output
             return Array([__eq__(e, other) for e in self])
         elif isinstance(other, Iterable):
             if len(self) == get_length(other):
@@ -356,6 +1039,9 @@ class Array(object):
 
     def __ge__(self, other):
         if is_scalar(other):
+            output = self._compare_using_index('>=', other)
+            if output is not None:
+                return output
             return Array([__ge__(e, other) for e in self])
         elif isinstance(other, Iterable):
             if len(self) == get_length(other):
@@ -369,6 +1055,9 @@ class Array(object):
 
     def __gt__(self, other):
         if is_scalar(other):
+            output = self._compare_using_index('>', other)
+            if output is not None:
+                return output
             return Array([__gt__(e, other) for e in self])
         elif isinstance(other, Iterable):
             if len(self) == get_length(other):
@@ -382,6 +1071,9 @@ class Array(object):
 
     def __le__(self, other):
         if is_scalar(other):
+            output = self._compare_using_index('<=', other)
+            if output is not None:
+                return output
             return Array([__le__(e, other) for e in self])
         elif isinstance(other, Iterable):
             if len(self) == get_length(other):
@@ -395,6 +1087,9 @@ class Array(object):
 
     def __lt__(self, other):
         if is_scalar(other):
+            output = self._compare_using_index('<', other)
+            if output is not None:
+                return output
             return Array([__lt__(e, other) for e in self])
         elif isinstance(other, Iterable):
             if len(self) == get_length(other):
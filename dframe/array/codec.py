@@ -0,0 +1,169 @@
+from __future__ import absolute_import
+from __future__ import print_function
+
+import pickle
+import numpy as np
+import pandas as pd
+
+from dframe.array.array import Array, _ArrayData, _LazyArrayData
+
+# An Array is encoded as a kind and a dict of flat numpy buffers:
+#
+#   'int', 'float', 'bool': 'values' (<i8, <f8, |b1)
+#   'str', 'text', 'bytes': 'offsets' (<i8, length + 1) and 'data' (|u1)
+#   'none': no buffers (all elements are missing)
+#   'pickle': 'data' (|u1), a pickled list of the elements
+#
+# Unpickling runs code chosen by whoever wrote the data, so the 'pickle' kind
+# is only allowed (allow_pickle) for data that this process wrote itself,
+# such as pickled Arrays and spilled data, and never for files.
+#
+# Every kind except 'none' may also have a 'mask' buffer (|b1) in which True
+# marks a missing value. 'str' holds the native str type; 'text' holds
+# unicode text on Python 2 and 'bytes' holds bytes on Python 3. Text is
+# stored as UTF-8.
+
+KINDS = ('int', 'float', 'bool', 'str', 'text', 'bytes', 'none', 'pickle')
+
+_VALUES_DTYPES = {'i': ('int', '<i8'), 'f': ('float', '<f8'),
+                  'b': ('bool', '|b1')}
+
+_TEXT_TYPE = type(u'')
+
+
+def _string_kind(dtype):
+    if dtype is str:
+        return 'str'
+    elif dtype is _TEXT_TYPE:
+        return 'text'
+    elif dtype is bytes:
+        return 'bytes'
+    else:
+        return None
+
+
+def kind_to_dtype(kind):
+    ''' The Array dtype of an encoded kind; None for 'pickle'. '''
+    return {'int': int, 'float': float, 'bool': bool, 'str': str,
+            'text': _TEXT_TYPE, 'bytes': bytes,
+            'none': type(None)}.get(kind)
+
+
+def encode_array(array, allow_pickle=True):
+    ''' Encode an Array as typed buffers.
+
+        Args
+        -----
+        array (Array)
+        allow_pickle (bool): if False, Arrays whose elements are not int,
+            float, bool or strings raise TypeError instead of being pickled.
+
+        Returns
+        --------
+        (str, dict): the kind and a dict of contiguous 1-dimensional numpy
+            arrays keyed by buffer name.
+    '''
+    assert isinstance(array, Array)
+    values, missing = array._to_buffers()
+    buffers = {}
+    if array.dtype is type(None):
+        return 'none', buffers
+    if missing.any():
+        buffers['mask'] = np.ascontiguousarray(missing, dtype='|b1')
+
+    string_kind = _string_kind(array.dtype)
+    if values.dtype.kind in _VALUES_DTYPES:
+        kind, numpy_dtype = _VALUES_DTYPES[values.dtype.kind]
+        buffers['values'] = np.ascontiguousarray(values, dtype=numpy_dtype)
+    elif string_kind is not None:
+        kind = string_kind
+        if (kind == 'text') or (kind == 'str' and str is not bytes):
+            cells = [b'' if value is None else value.encode('utf-8')
+                     for value in values]
+        else:
+            cells = [b'' if value is None else value for value in values]
+        offsets = np.zeros(len(cells) + 1, dtype='<i8')
+        np.cumsum(list(map(len, cells)), out=offsets[1:])
+        buffers['offsets'] = offsets
+        buffers['data'] = np.frombuffer(b''.join(cells), dtype='|u1')
+    elif not allow_pickle:
+        msg = 'arrays of dtype {} can only be encoded with pickle'
+        raise TypeError(msg.format(array.dtype.__name__))
+    else:
+        kind = 'pickle'
+        data = pickle.dumps(values.tolist(), protocol=2)
+        buffers['data'] = np.frombuffer(data, dtype='|u1')
+    return kind, buffers
+
+
+def decode_series(kind, buffers, length, allow_pickle=True):
+    ''' Decode typed buffers into an object pd.Series whose missing values
+        are None. See encode_array; with allow_pickle=False, the 'pickle'
+        kind raises ValueError.
+
+        Returns
+        --------
+        (pd.Series, type): the data and the dtype of the Array
+    '''
+    if kind not in KINDS:
+        msg = 'unknown column kind {}'.format(repr(kind))
+        raise ValueError(msg)
+    elif kind == 'pickle' and not allow_pickle:
+        msg = 'pickled columns are not allowed'
+        raise ValueError(msg)
+    mask = buffers.get('mask')
+    if kind == 'none':
+        return pd.Series([None] * length, dtype=object), type(None)
+    elif kind in ('int', 'float', 'bool'):
+        array = Array.from_numpy(buffers['values'], mask)
+        return array._data, array.dtype
+    elif kind == 'pickle':
+        values = pickle.loads(buffers['data'].tobytes())
+        array = Array(values)
+        return array._data, array.dtype
+
+    data = buffers['data'].tobytes()
+    offsets = buffers['offsets'].tolist()
+    cells = [data[start:stop]
+             for start, stop in zip(offsets[:-1], offsets[1:])]
+    if (kind == 'text') or (kind == 'str' and str is not bytes):
+        cells = [cell.decode('utf-8') for cell in cells]
+    dtype = kind_to_dtype(kind)
+    if mask is not None:
+        for i in np.flatnonzero(mask):
+            cells[i] = None
+        if mask.all():
+            dtype = type(None)
+    return pd.Series(cells, dtype=object), dtype
+
+
+def decode_array(kind, buffers, length, allow_pickle=True):
+    ''' Decode typed buffers into an Array. See decode_series. '''
+    series, dtype = decode_series(kind, buffers, length, allow_pickle)
+    return Array(_ArrayData(series, dtype))
+
+
+def _unpickle_array(kind, payloads, length, index_kind):
+    # Reconstructs an Array pickled by Array.__reduce_ex__. A payload is a
+    # numpy array or, with pickle protocol 5, any object with the buffer
+    # protocol (such as an out-of-band buffer); it is not copied.
+    buffers = {}
+    for name, (dtype, payload) in payloads.items():
+        if not isinstance(payload, np.ndarray):
+            payload = np.frombuffer(payload, dtype=np.dtype(str(dtype)))
+        buffers[name] = payload
+    dtype = kind_to_dtype(kind)
+    if dtype is None:
+        # Pickled elements do not record their dtype, so decode them now.
+        array = decode_array(kind, buffers, length)
+    else:
+        if 'mask' in buffers and buffers['mask'].all():
+            dtype = type(None)
+
+        def load():
+            series, _ = decode_series(kind, buffers, length)
+            return series
+
+        array = Array(_LazyArrayData(load, length, dtype))
+    array._index_kind = index_kind
+    return array
@@ -0,0 +1,106 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+
+# Secondary indexes over the elements of an Array. Lookups return the sorted
+# int64 positions of the matching elements. Missing values (None) are never
+# indexed, so they never match a lookup.
+
+INDEX_KINDS = ('hash', 'sorted')
+
+
+class HashIndex(object):
+    ''' Positions of every distinct element, grouped by element.
+        Supports '==' and 'in' lookups.
+    '''
+    ops = ('==', 'in')
+
+    def __init__(self, values, missing):
+        present = np.flatnonzero(~missing)
+        codes, uniques = pd.factorize(values[present])
+        # A stable sort keeps the positions of each group in row order
+        order = np.argsort(codes, kind='mergesort')
+        counts = np.bincount(codes, minlength=len(uniques))
+        stops = np.cumsum(counts)
+        starts = stops - counts
+        self._positions = present[order]
+        self._groups = {value: (start, stop) for value, start, stop in
+                        zip(np.asarray(uniques).tolist(), starts.tolist(),
+                            stops.tolist())}
+
+    def lookup(self, op, value):
+        if op == '==':
+            try:
+                start, stop = self._groups.get(value, (0, 0))
+            except TypeError:
+                # Unhashable values
+                return None
+            return self._positions[start:stop]
+        elif op == 'in':
+            parts = [self.lookup('==', v) for v in value]
+            if any(part is None for part in parts):
+                return None
+            if len(parts) == 0:
+                return np.array([], dtype=np.int64)
+            return np.sort(np.unique(np.concatenate(parts)))
+        else:
+            return None
+
+
+class SortedIndex(object):
+    ''' Elements in sorted order with their positions. Supports '==', 'in'
+        and range ('<', '<=', '>', '>=') lookups with binary search.
+    '''
+    ops = ('==', 'in', '<', '<=', '>', '>=')
+
+    def __init__(self, values, missing):
+        present = np.flatnonzero(~missing)
+        values = values[present]
+        order = np.argsort(values, kind='mergesort')
+        self._values = values[order]
+        self._positions = present[order]
+
+    def _range(self, lo, hi):
+        # Positions of sorted elements lo:hi, in row order
+        return np.sort(self._positions[lo:hi])
+
+    def lookup(self, op, value):
+        values = self._values
+        try:
+            if op == '==':
+                lo = values.searchsorted(value, side='left')
+                hi = values.searchsorted(value, side='right')
+                # Equal elements are in row order thanks to the stable sort
+                return self._positions[lo:hi]
+            elif op == 'in':
+                parts = [self.lookup('==', v) for v in value]
+                if len(parts) == 0:
+                    return np.array([], dtype=np.int64)
+                return np.sort(np.unique(np.concatenate(parts)))
+            elif op == '<':
+                return self._range(0, values.searchsorted(value, 'left'))
+            elif op == '<=':
+                return self._range(0, values.searchsorted(value, 'right'))
+            elif op == '>':
+                return self._range(values.searchsorted(value, 'right'),
+                                   len(values))
+            elif op == '>=':
+                return self._range(values.searchsorted(value, 'left'),
+                                   len(values))
+        except TypeError:
+            # Values that cannot be compared with the elements
+            return None
+        return None
+
+
+def build_index(kind, values, missing):
+    if kind == 'hash':
+        return HashIndex(values, missing)
+    elif kind == 'sorted':
+        return SortedIndex(values, missing)
+    else:
+        msg = 'index kind must be one of {}'.format(', '.join(INDEX_KINDS))
+        raise ValueError(msg)
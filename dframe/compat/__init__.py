@@ -1 +1,2 @@
-from .compat import Iterable
\ No newline at end of file
+from .compat import (Iterable, IntegerArray, BooleanArray, StringDtype, lzma,
+                     PickleBuffer, native_str)
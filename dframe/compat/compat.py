@@ -1,7 +1,43 @@
 from __future__ import absolute_import
 
+import pandas as pd
 
 try:
     from collections.abc import Iterable
 except ImportError:
     from collections import Iterable
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+# Nullable pandas extension arrays, when the installed pandas has them.
+try:
+    from pandas.arrays import IntegerArray
+except ImportError:
+    IntegerArray = None
+
+try:
+    from pandas.arrays import BooleanArray
+except ImportError:
+    BooleanArray = None
+
+try:
+    StringDtype = pd.StringDtype
+except AttributeError:
+    StringDtype = None
+
+# Out-of-band pickle buffers (pickle protocol 5, Python 3.8+)
+try:
+    from pickle import PickleBuffer
+except ImportError:
+    PickleBuffer = None
+
+
+def native_str(value):
+    # Python 2 libraries (json, DB-API drivers) return text as unicode;
+    # dframe uses the native str type. Other values are returned unchanged.
+    if str is bytes and isinstance(value, type(u'')):
+        return value.encode('utf-8')
+    return value
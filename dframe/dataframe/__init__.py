@@ -1,2 +1,4 @@
 from .dataframe import DataFrame
-from .operations import hstack, cbind, vstack, rbind
\ No newline at end of file
+from .operations import hstack, cbind, vstack, rbind
+from .builder import DataFrameBuilder
+from .lazy import LazyFrame
@@ -0,0 +1,208 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from builtins import range, zip
+
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+from dframe.array.array import _ArrayData
+from dframe.dtypes import is_float, is_string
+from dframe.scalar import is_list_unique, is_iterable_string
+from dframe.dataframe.dataframe import DataFrame, _get_generic_names
+
+
+def _is_nan(value):
+    return is_float(value) and value != value
+
+
+class DataFrameBuilder(object):
+    ''' Build a DataFrame from rows that arrive one at a time or in batches.
+
+        Rows can be sequences (list, tuple) with one value per column or
+        dict-like records keyed by column name. Values are appended directly
+        into per-column buffers and the dtype of each column is inferred as
+        values arrive, so `build()` does not need a second pass over the
+        data. NaN values are stored as missing values (None).
+
+        When names are not provided, sequence rows get generic names
+        (C0, C1, ...) and records add a new column the first time a new key
+        is seen; earlier rows get a missing value (None) for that column.
+        Records that do not have a key get a missing value for that column.
+
+        Args
+        -----
+        names (list-like): optional column names. When provided, rows must
+            have exactly these columns and records cannot have other keys.
+    '''
+
+    def __init__(self, names=None):
+        self._fixed_names = names is not None
+        self._names = None
+        self._columns = None
+        self._dtypes = None
+        self._nrow = 0
+        if names is not None:
+            self._init_columns(list(names))
+
+    def _init_columns(self, names):
+        if not is_iterable_string(names):
+            msg = 'non string names are not allowed'
+            raise ValueError(msg)
+        if not is_list_unique(names):
+            raise ValueError('duplicate column names found')
+        self._names = names
+        self._names_to_index = {name: j for j, name in enumerate(names)}
+        self._columns = [[] for _ in names]
+        self._dtypes = [type(None)] * len(names)
+
+    def _add_column(self, name):
+        if self._fixed_names:
+            msg = 'record contains unknown column name {}'.format(repr(name))
+            raise ValueError(msg)
+        if not is_string(name):
+            msg = 'non string names are not allowed'
+            raise ValueError(msg)
+        self._names_to_index[name] = len(self._names)
+        self._names.append(name)
+        self._columns.append([None] * self._nrow)
+        self._dtypes.append(type(None))
+
+    @property
+    def names(self):
+        return Array([] if self._names is None else self._names)
+
+    @property
+    def nrow(self):
+        return self._nrow
+
+    @property
+    def ncol(self):
+        return 0 if self._names is None else len(self._names)
+
+    def __len__(self):
+        return self._nrow
+
+    def _merge_dtype(self, j, types):
+        # Returns the dtype of column j after appending values of the given
+        # types; raises before anything is appended if the types conflict.
+        types = set(types)
+        types.discard(type(None))
+        if self._dtypes[j] is not type(None):
+            types.add(self._dtypes[j])
+        if len(types) == 0:
+            return type(None)
+        elif len(types) == 1:
+            return types.pop()
+        else:
+            msg = 'Multiple types detected in column {}: {}'
+            raise ValueError(msg.format(repr(self._names[j]),
+                                        [t.__name__ for t in types]))
+
+    def _append_columns(self, columns, nrow):
+        # columns is a list of per-column value lists, one per column of
+        # the builder, each of length nrow.
+        cleaned = []
+        dtypes = []
+        for j, values in enumerate(columns):
+            types = set(map(type, values))
+            float_types = [t for t in types
+                           if issubclass(t, (float, np.floating))]
+            if len(float_types) > 0:
+                if types.difference(float_types) <= {type(None)}:
+                    # Only floats and None: NaN is the only value that is
+                    # not equal to itself.
+                    values = [None if value != value else value
+                              for value in values]
+                else:
+                    values = [None if _is_nan(value) else value
+                              for value in values]
+                types = set(map(type, values))
+            dtypes.append(self._merge_dtype(j, types))
+            cleaned.append(values)
+        for j, values in enumerate(cleaned):
+            self._columns[j].extend(values)
+            self._dtypes[j] = dtypes[j]
+        self._nrow += nrow
+
+    def _row_to_values(self, row):
+        if isinstance(row, dict):
+            return [row.get(name) for name in self._names]
+        else:
+            if self._names is None:
+                self._init_columns(_get_generic_names(len(row)))
+            if len(row) != len(self._names):
+                msg = 'all rows do not have the same number of columns'
+                raise ValueError(msg)
+            return row
+
+    def append(self, row):
+        ''' Append one row, either a sequence or a dict-like record. '''
+        return self.extend([row])
+
+    def extend(self, rows):
+        ''' Append a batch of rows. Each row is either a sequence or a
+            dict-like record. The batch is transposed once and appended
+            column by column. If any row is invalid, nothing from the batch
+            is appended.
+        '''
+        rows = list(rows)
+        if len(rows) == 0:
+            return self
+        names_were_set = self._names is not None
+        if not names_were_set and isinstance(rows[0], dict):
+            self._init_columns([])
+        ncol_before = self.ncol
+        try:
+            # Register new record keys first so every row maps to the same
+            # set of columns.
+            for row in rows:
+                if isinstance(row, dict):
+                    for name in row:
+                        if name not in self._names_to_index:
+                            self._add_column(name)
+            values = [self._row_to_values(row) for row in rows]
+            if len(self._names) > 0:
+                self._append_columns(
+                    [list(column) for column in zip(*values)], len(rows))
+            else:
+                self._nrow += len(rows)
+        except ValueError:
+            if names_were_set:
+                self._drop_columns_from(ncol_before)
+            else:
+                self._names = self._columns = self._dtypes = None
+            raise
+        return self
+
+    def _drop_columns_from(self, ncol):
+        for name in self._names[ncol:]:
+            del self._names_to_index[name]
+        del self._names[ncol:]
+        del self._columns[ncol:]
+        del self._dtypes[ncol:]
+
+    def build(self):
+        ''' Finish the rows appended so far into a DataFrame.
+
+            The builder is reset to hold no rows but keeps its column names
+            and dtypes, so it can be reused to build further chunks with the
+            same columns. Appending values of a different type to a column
+            in a later chunk raises a ValueError.
+
+            Returns
+            --------
+            DataFrame
+        '''
+        if self._names is None:
+            return DataFrame()
+        arrays = []
+        for column, dtype in zip(self._columns, self._dtypes):
+            if column.count(None) == len(column):
+                dtype = type(None)
+            arrays.append(Array(_ArrayData(pd.Series(column, dtype=object),
+                                           dtype)))
+        df = DataFrame._from_arrays(arrays, self._names)
+        self._columns = [[] for _ in self._names]
+        self._nrow = 0
+        return df
@@ -1,16 +1,21 @@
 from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
-from builtins import range
+from builtins import range, zip
 
+import copy
 import warnings
 from prettytable import PrettyTable
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 import numpy as np
 import pandas as pd
 
 from dframe.array import Array, which
+from dframe.array.array import _ArrayData, _object_series, _resolve_index
+from dframe.array.index import INDEX_KINDS
 from dframe.errors import InternalError
+from dframe.parallel import map_columns
+from dframe.dataframe.expr import evaluate, evaluate_array, lookup
 from dframe.compat import Iterable
 from dframe.dtypes import is_integer, is_float, is_string, is_bool, infer_dtype
 from dframe.scalar import (is_scalar, get_length, is_list_unique, is_list_same,
@@ -33,17 +38,48 @@ class _DataFrameSlice(object):
         self._names = _names
 
 
+def _view_columns(columns):
+    # New Arrays that share the data of columns until either is modified
+    # (copy-on-write), boxed like DataFrame._data.
+    arrays = []
+    for column in columns:
+        view = Array(column)
+        view._index_kind = column._index_kind
+        view._index = column._index
+        arrays.append(view)
+    return Array(_ArrayData(_object_series(arrays),
+                            Array if arrays else type(None)))
+
+
+def _field_name(name, position):
+    # namedtuple field for a column name. On Python 2 field names must be
+    # ASCII str, so other unicode names get a positional name, as
+    # namedtuple(rename=True) gives to names that are not identifiers.
+    try:
+        return str(name)
+    except UnicodeError:
+        return '_{}'.format(position)
+
+
+def _unpickle_dataframe(cls, names, columns):
+    # Reconstructs a DataFrame pickled by DataFrame.__reduce_ex__
+    return cls._from_arrays(columns, names)
+
+
 class DataFrame(object):
     _print_max_nrows = 60
     _print_max_cols = 10
+    _iter_chunksize = 10000
 
     def __init__(self, data={}):
         if isinstance(data, dict):
             self._init_from_dict(data)
         elif isinstance(data, type(self)):
-            # This does not copy the underlying data a la Python and pandas.
-            self._data = data._data
-            self._names = data._names
+            # The columns share the underlying data until one of the
+            # DataFrames modifies a column, which then copies that column
+            # only (copy-on-write).
+            self._data = _view_columns(data._data)
+            self._names = Array(data._names)
             self._nrow = data._nrow
             self._ncol = data._ncol
             self._update_nrow_ncol()
@@ -74,27 +110,47 @@ class DataFrame(object):
         else:
             raise ValueError('duplicate column names found')
 
+    @classmethod
+    def _from_arrays(cls, arrays, names):
+        # Internal constructor for columns that are already Array objects.
+        # Unlike from_items, this does not push the columns through
+        # Array.__init__ again.
+        names = list(names)
+        if not is_iterable_string(names):
+            msg = 'non string names are not allowed'
+            raise ValueError(msg)
+        if not is_list_unique(names):
+            raise ValueError('duplicate column names found')
+        if len(arrays) != len(names):
+            msg = 'number of names do not match the number of columns'
+            raise ValueError(msg)
+        if not is_list_same([len(array) for array in arrays]):
+            msg = 'columns do not have the same lengths'
+            raise ValueError(msg)
+        _data = Array(_ArrayData(_object_series(arrays),
+                                 Array if arrays else type(None)))
+        _names = Array(_ArrayData(_object_series(names),
+                                  infer_dtype(names)))
+        return cls(_DataFrameSlice(_data, _names))
+
     @classmethod
     def from_rows(cls, list_of_rows, names=None):
-        nrow = get_length(list_of_rows)
-        ncol_per_row = [get_length(row) for row in list_of_rows]
-        if is_list_same(ncol_per_row):
-            if len(ncol_per_row) == 0:
-                ncol = 0
-            else:
-                ncol = ncol_per_row[0]
-            if names is None:
-                names = _get_generic_names(ncol)
-            if ncol == get_length(names):
-                items = [
-                    (names[j], [list_of_rows[i][j] for i in range(nrow)])
-                    for j in range(ncol)]
-                return cls.from_items(items)
-            else:
-                msg = 'number of names do not match the number of columns'
-                raise ValueError(msg)
+        # Imported here because the builder module imports DataFrame
+        from dframe.dataframe.builder import DataFrameBuilder
+        if get_length(list_of_rows) == 0:
+            ncol = 0
         else:
-            msg = 'all rows do not have the same number of columns'
+            ncol = get_length(list_of_rows[0])
+        if names is None:
+            names = _get_generic_names(ncol)
+        if ncol == get_length(names):
+            # The builder checks that every row has the same number of
+            # columns as it appends them.
+            builder = DataFrameBuilder(names)
+            builder.extend(list_of_rows)
+            return builder.build()
+        else:
+            msg = 'number of names do not match the number of columns'
             raise ValueError(msg)
 
     @classmethod
@@ -113,8 +169,17 @@ class DataFrame(object):
     def from_numpy(cls, array, names=None):
         assert isinstance(array, np.ndarray)
         if len(array.shape) == 2:
-            columns = [array[:, j] for j in range(array.shape[1])]
-            return cls.from_columns(columns, names)
+            ncol = array.shape[1]
+            if names is None:
+                names = _get_generic_names(ncol)
+            if ncol == get_length(names):
+                # Each column is converted in one vectorized pass; there is
+                # no per-element NaN scan for numeric, bool or string arrays.
+                columns = [Array.from_numpy(array[:, j]) for j in range(ncol)]
+                return cls._from_arrays(columns, names)
+            else:
+                msg = 'number of names do not match the number of columns'
+                raise ValueError(msg)
         else:
             msg = 'numpy array dimensions must be exactly 2'
             raise ValueError(msg)
@@ -126,9 +191,12 @@ class DataFrame(object):
                    'DataFrame instead')
             raise ValueError(msg)
         elif isinstance(df, pd.DataFrame):
-            df.reset_index(drop=True, inplace=True)
-            items = [(name, df[name]) for name in df]
-            return cls.from_items(items)
+            # Columns are taken by position so that the input DataFrame and
+            # its index are left untouched. Like every Array, numeric and
+            # bool columns are boxed (see Array.from_pandas).
+            columns = [Array.from_pandas(df.iloc[:, j])
+                       for j in range(df.shape[1])]
+            return cls._from_arrays(columns, list(df.columns))
         else:
             msg = 'pandas DataFrame required'
             raise ValueError(msg)
@@ -159,7 +227,30 @@ class DataFrame(object):
             raise ValueError(msg)
 
     @classmethod
-    def from_csv(cls, filepath_or_buffer, **kwargs):
+    def from_csv(cls, filepath_or_buffer, iterator=False, chunksize=None,
+                 **kwargs):
+        ''' Read a CSV file into a DataFrame using the pandas reader.
+
+            Args
+            -----
+            filepath_or_buffer (str or file-like): passed to pandas.read_csv
+            iterator (bool): when True, return a generator of DataFrame
+                chunks instead of one DataFrame; see dframe.read_csv_chunks.
+            chunksize (int): number of rows per chunk. Implies iterator=True.
+            kwargs: other keyword arguments passed to pandas.read_csv,
+                except index_col.
+
+            Returns
+            --------
+            DataFrame, or generator of DataFrame
+        '''
+        if iterator or (chunksize is not None):
+            # Imported here because dframe.io imports DataFrame
+            from dframe.io import read_csv_chunks
+            if chunksize is None:
+                return read_csv_chunks(filepath_or_buffer, **kwargs)
+            return read_csv_chunks(filepath_or_buffer, chunksize, **kwargs)
+
         # Use pandas reader which is incredibly fast!
         if 'index_col' in kwargs.keys():
             del kwargs['index_col']
@@ -247,6 +338,22 @@ class DataFrame(object):
     def __len__(self):
         return self._ncol
 
+    def __copy__(self):
+        # Copy-on-write, like DataFrame(self)
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        output = type(self)._from_arrays(
+            [copy.deepcopy(column, memo) for column in self._data],
+            list(self._names))
+        memo[id(self)] = output
+        return output
+
+    def __reduce_ex__(self, protocol):
+        # The columns are pickled as typed buffers (see Array.__reduce_ex__)
+        return _unpickle_dataframe, (type(self), list(self._names),
+                                     list(self._data))
+
     def __iter__(self):
         for name in self._names:
             yield name
@@ -344,24 +451,580 @@ class DataFrame(object):
     def items(self):
         return [(key, value) for key, value in zip(self.keys(), self.values())]
 
+    def _iter_column_chunks(self, chunksize):
+        # Pull each column's values out in bulk, one row range at a time,
+        # instead of indexing every cell through Array.__getitem__.
+        assert is_integer(chunksize)
+        if chunksize <= 0:
+            msg = 'chunksize must be a positive integer'
+            raise ValueError(msg)
+        for start in range(0, self._nrow, chunksize):
+            stop = min(start + chunksize, self._nrow)
+            yield [column._values(start, stop).tolist()
+                   for column in self._data]
+
     def rows(self, rows_as_tuple=True):
+        columns = [column.tolist() for column in self._data]
         if rows_as_tuple:
-            return [(column[row_index] for _, column in enumerate(self._data))
-                    for row_index in range(self._nrow)]
+            return list(zip(*columns))
         else:
-            return [[column[row_index] for _, column in enumerate(self._data)]
-                    for row_index in range(self._nrow)]
+            return [list(row) for row in zip(*columns)]
 
     def columns(self):
         return self.values()
 
+    def to_csv(self, path_or_buffer, chunksize=100000, sep=',', na_rep='',
+               header=True, compression='infer', encoding='utf-8',
+               line_terminator='\n', quotechar='"'):
+        ''' Write the DataFrame as CSV. Rows are formatted and written one
+            chunk at a time, so at most one chunk of formatted text is held
+            in memory. Within a chunk, each column is converted to text in
+            one vectorized step and the chunk is written as a single block.
+
+            Args
+            -----
+            path_or_buffer (str or file-like): output path, or a binary or
+                text stream.
+            chunksize (int): number of rows formatted per block.
+            sep (str): field separator.
+            na_rep (str): text for missing values (None).
+            header (bool): write the column names as the first line.
+            compression (str): 'gzip', 'bz2', 'xz', None, or 'infer' to
+                choose from the extension (.gz, .bz2, .xz) of a path.
+                Compression requires a path or a binary stream.
+            encoding (str): encoding of the output bytes.
+            line_terminator (str): line terminator.
+            quotechar (str): quote character for text fields that contain
+                the separator, the quote character or a newline.
+
+            Returns
+            --------
+            Nothing.
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import write_csv
+        write_csv(self, path_or_buffer, chunksize=chunksize, sep=sep,
+                  na_rep=na_rep, header=header, compression=compression,
+                  encoding=encoding, line_terminator=line_terminator,
+                  quotechar=quotechar)
+
+    def to_jsonl(self, path_or_buffer, chunksize=100000, compression='infer',
+                 encoding='utf-8'):
+        ''' Write the DataFrame as JSON Lines, one JSON object per row with
+            keys in column order. Missing values are written as null. Rows
+            are serialized one chunk at a time and each column of a chunk is
+            converted to JSON text in one pass.
+
+            Args
+            -----
+            path_or_buffer (str or file-like): output path, or a binary or
+                text stream.
+            chunksize (int): number of rows serialized per block.
+            compression (str): 'gzip', 'bz2', 'xz', None, or 'infer' to
+                choose from the extension (.gz, .bz2, .xz) of a path.
+            encoding (str): encoding of the output bytes.
+
+            Returns
+            --------
+            Nothing.
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import write_jsonl
+        write_jsonl(self, path_or_buffer, chunksize=chunksize,
+                    compression=compression, encoding=encoding)
+
+    @classmethod
+    def from_jsonl(cls, path_or_buffer, chunksize=None, names=None,
+                   compression='infer', encoding='utf-8'):
+        ''' Read a JSON Lines file; see dframe.io.read_jsonl.
+
+            Args
+            -----
+            path_or_buffer (str or file-like): input path, or a stream
+            chunksize (int): when given, return a generator of DataFrame
+                chunks with at most this many rows each.
+            names (list-like of str): optional column names to read
+            compression (str): 'gzip', 'bz2', 'xz', None, or 'infer'
+            encoding (str): encoding of the input bytes.
+
+            Returns
+            --------
+            DataFrame, or generator of DataFrame
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import read_jsonl
+        return read_jsonl(path_or_buffer, chunksize=chunksize, names=names,
+                          compression=compression, encoding=encoding)
+
+    def to_sql(self, table, connection, if_exists='fail', batchsize=10000):
+        ''' Write the DataFrame to a SQL table using a DB-API 2.0
+            connection, for example from the sqlite3 module.
+
+            Rows are inserted with cursor.executemany in batches, all in one
+            transaction that is committed at the end and rolled back on
+            error; changes not yet committed on the connection belong to
+            the same transaction. Parameters are bound as plain Python int,
+            float, bool, str and None values. A new table gets one column
+            per DataFrame column with type INTEGER, REAL, BOOLEAN, TEXT or
+            BLOB.
+
+            Args
+            -----
+            table (str): table name
+            connection: DB-API 2.0 connection
+            if_exists (str): 'fail' to raise a ValueError if the table
+                exists, 'replace' to drop and recreate it, or 'append' to
+                insert into it.
+            batchsize (int): number of rows per executemany call.
+
+            Returns
+            --------
+            Nothing.
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import write_sql
+        write_sql(self, table, connection, if_exists=if_exists,
+                  batchsize=batchsize)
+
+    @classmethod
+    def from_sql(cls, query, connection, params=None, chunksize=None):
+        ''' Read the result of a SQL query; see dframe.io.read_sql.
+
+            Args
+            -----
+            query (str): SQL query
+            connection: DB-API 2.0 connection
+            params (sequence or dict): optional query parameters
+            chunksize (int): when given, return a generator of DataFrame
+                chunks with at most this many rows each.
+
+            Returns
+            --------
+            DataFrame, or generator of DataFrame
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import read_sql
+        return read_sql(query, connection, params=params,
+                        chunksize=chunksize)
+
+    def to_binary(self, path):
+        ''' Write the DataFrame in the dframe binary columnar format, which
+            DataFrame.from_binary can memory-map. See dframe.io.write_binary.
+
+            Args
+            -----
+            path (str): output path
+
+            Returns
+            --------
+            Nothing.
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import write_binary
+        write_binary(self, path)
+
+    @classmethod
+    def from_binary(cls, path, names=None, mmap=True):
+        ''' Read a file written by DataFrame.to_binary. With mmap=True, the
+            file is memory-mapped and each column is decoded on first
+            access. See dframe.io.read_binary.
+
+            Args
+            -----
+            path (str): input path
+            names (list-like of str): optional names of the columns to load
+            mmap (bool): memory-map the file and decode columns lazily
+
+            Returns
+            --------
+            DataFrame
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import read_binary
+        return read_binary(path, names=names, mmap=mmap)
+
+    def to_parquet(self, path, row_group_size=None, compression='snappy'):
+        ''' Write the DataFrame to a Parquet file. Requires pyarrow. See
+            dframe.io.write_parquet.
+
+            Args
+            -----
+            path (str): output path
+            row_group_size (int): maximum number of rows per row group
+            compression (str): Parquet compression codec, or None.
+
+            Returns
+            --------
+            Nothing.
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import write_parquet
+        write_parquet(self, path, row_group_size=row_group_size,
+                      compression=compression)
+
+    @classmethod
+    def from_parquet(cls, path, names=None, filters=None):
+        ''' Read a Parquet file. Requires pyarrow. Only the selected
+            columns are read and row groups that cannot satisfy the filters
+            are skipped using their min/max statistics. See
+            dframe.io.read_parquet.
+
+            Args
+            -----
+            path (str): input path
+            names (list-like of str): optional names of the columns to read
+            filters (list of tuple): optional (name, op, value) predicates
+                that every returned row satisfies
+
+            Returns
+            --------
+            DataFrame
+        '''
+        # Imported here because dframe.io imports DataFrame
+        from dframe.io import read_parquet
+        return read_parquet(path, names=names, filters=filters)
+
+    def to_pandas(self):
+        ''' Convert the DataFrame to a pandas DataFrame with a default
+            RangeIndex. Columns are converted with Array.to_pandas, which
+            uses nullable pandas dtypes for columns with missing values
+            where available.
+
+            Returns
+            --------
+            pd.DataFrame
+        '''
+        names = list(self._names)
+        columns = map_columns(lambda column: column.to_pandas(), self._data)
+        return pd.DataFrame(OrderedDict(zip(names, columns)),
+                            index=pd.RangeIndex(self._nrow), columns=names)
+
+    def to_numpy(self, dtype=None, order='C'):
+        ''' Convert the DataFrame to a 2-dimensional numpy array. The output
+            is allocated once and filled column by column.
+
+            Args
+            -----
+            dtype (numpy dtype): optional dtype of the output. By default, the
+                common dtype of all columns as given by Array.to_numpy.
+                Missing values become NaN for float dtypes and None for
+                object dtype; other dtypes cannot hold missing values.
+            order (str): memory layout of the output, 'C' or 'F'.
+
+            Returns
+            --------
+            np.ndarray of shape (nrow, ncol)
+        '''
+        missing = map_columns(lambda column: column._missing(), self._data)
+        if dtype is None:
+            if self._ncol == 0:
+                dtype = np.float64
+            else:
+                dtype = np.result_type(
+                    *[column._numpy_dtype(m)
+                      for column, m in zip(self._data, missing)])
+        dtype = np.dtype(dtype)
+        output = np.empty((self._nrow, self._ncol), dtype=dtype, order=order)
+        for j, column in enumerate(self._data):
+            if (dtype.kind not in 'fcO') and missing[j].any():
+                msg = 'missing values (None) cannot be represented as {}'
+                raise ValueError(msg.format(dtype))
+
+        def fill(j):
+            output[:, j] = self._data[j]._values()
+        map_columns(fill, range(self._ncol))
+        return output
+
     def head(self, nrows=6):
         return self[:nrows, :]
 
     def iterrows(self):
-        for row_index in range(self._nrow):
-            row = (column[row_index] for _, column in enumerate(self._data))
-            yield row
+        for columns in self._iter_column_chunks(self._iter_chunksize):
+            for row in zip(*columns):
+                yield row
+
+    def itertuples(self, named=True, name='Row'):
+        ''' Iterate over the rows of the DataFrame as tuples.
+
+            Args
+            -----
+            named (bool): when True, rows are namedtuples whose fields are
+                the column names. Column names that are not valid Python
+                identifiers are replaced by positional names such as `_1`.
+            name (str): name of the namedtuple type.
+
+            Returns
+            --------
+            generator of tuples
+        '''
+        if named:
+            Row = namedtuple(name, [_field_name(n, i)
+                                    for i, n in enumerate(self._names)],
+                             rename=True)
+            make = Row._make
+        else:
+            make = tuple
+        for columns in self._iter_column_chunks(self._iter_chunksize):
+            for row in zip(*columns):
+                yield make(row)
+
+    def iterrowchunks(self, chunksize=None, rows_as_tuple=True):
+        ''' Iterate over the rows of the DataFrame in chunks. Each chunk is a
+            list of at most `chunksize` rows. Only one chunk of rows is held
+            in memory at a time.
+
+            Args
+            -----
+            chunksize (int): maximum number of rows per chunk.
+            rows_as_tuple (bool): when True, each row is a tuple; otherwise
+                each row is a list.
+
+            Returns
+            --------
+            generator of lists of rows
+        '''
+        if chunksize is None:
+            chunksize = self._iter_chunksize
+        for columns in self._iter_column_chunks(chunksize):
+            if rows_as_tuple:
+                yield list(zip(*columns))
+            else:
+                yield [list(row) for row in zip(*columns)]
+
+    def create_index(self, name, kind='hash'):
+        ''' Create a secondary index on a column. A 'hash' index answers
+            equality and isin lookups; a 'sorted' index also answers range
+            comparisons (<, <=, >, >=) with binary search.
+
+            Comparisons of the column with a scalar (`df['a'] == x`),
+            `isin`, and simple expressions in DataFrame.query use the index
+            automatically instead of scanning the column. The index is kept
+            until drop_index is called: it is invalidated whenever the column
+            is modified or replaced and rebuilt on the next lookup.
+
+            Args
+            -----
+            name (str): column name
+            kind (str): 'hash' or 'sorted'
+
+            Returns
+            --------
+            Nothing.
+        '''
+        if kind not in INDEX_KINDS:
+            msg = 'index kind must be one of {}'.format(', '.join(INDEX_KINDS))
+            raise ValueError(msg)
+        self[name]._create_index(kind)
+
+    def drop_index(self, name):
+        ''' Drop the secondary index on a column, if there is one. '''
+        self[name]._drop_index()
+
+    def indexes(self):
+        ''' Names of the columns that have a secondary index, mapped to the
+            kind of the index.
+
+            Returns
+            --------
+            dict
+        '''
+        return {name: column._index_kind
+                for name, column in zip(self._names, self._data)
+                if column._index_kind is not None}
+
+    def eval(self, expr):
+        ''' Evaluate an expression over the columns, for example
+            "a * b + c" or "price > 10 and region == 'EU'".
+
+            The expression is parsed once with the ast module and column
+            names are looked up directly. Each operator is applied to whole
+            columns with numpy and no intermediate Array is created. As with
+            Array operators, the result is None wherever an operand is None.
+
+            Supported are column names, literals, arithmetic (+ - * / // %
+            **), comparisons (including chained comparisons), `and`, `or`,
+            `not`, and `in` / `not in` with a list or tuple of literals.
+            Integer arithmetic is done in int64; / is true division. Division
+            by zero raises ZeroDivisionError.
+
+            Args
+            -----
+            expr (str): expression
+
+            Returns
+            --------
+            Array
+        '''
+        return evaluate_array(self, expr)
+
+    def query(self, expr):
+        ''' Select the rows for which a logical expression is True; rows for
+            which it is False or None are dropped. See DataFrame.eval for
+            the expression syntax.
+
+            Args
+            -----
+            expr (str): logical expression, for example
+                "price > 10 and region == 'EU'"
+
+            Returns
+            --------
+            DataFrame
+        '''
+        index = lookup(self, expr)
+        if index is not None:
+            columns = map_columns(lambda column: column._take(index),
+                                  self._data)
+            return type(self)._from_arrays(columns, self._names)
+        values, missing = evaluate(self, expr)
+        if values.dtype.kind != 'b':
+            if not missing.all():
+                msg = 'query expression must evaluate to bool'
+                raise TypeError(msg)
+            values = np.zeros(len(values), dtype=bool)
+        index = np.flatnonzero(values & ~missing)
+        columns = map_columns(lambda column: column._take(index), self._data)
+        return type(self)._from_arrays(columns, self._names)
+
+    def map_partitions(self, func, npartitions=None, nprocs=None):
+        ''' Apply a function to row partitions in a pool of processes and
+            stack the results; see dframe.map_partitions.
+
+            Args
+            -----
+            func (function): takes a DataFrame and returns a DataFrame.
+            npartitions (int): number of row partitions; defaults to nprocs.
+            nprocs (int): number of processes; defaults to the number of
+                CPUs.
+
+            Returns
+            --------
+            DataFrame
+        '''
+        # Imported here because dframe.parallel.partition imports DataFrame
+        from dframe.parallel.partition import map_partitions
+        return map_partitions(self, func, npartitions, nprocs)
+
+    def lazy(self):
+        ''' Start a lazy query on this DataFrame; see LazyFrame. The query
+            uses the data as of this call: later changes to this DataFrame
+            do not affect it.
+
+            Returns
+            --------
+            LazyFrame
+        '''
+        # Imported here because dframe.dataframe.lazy imports DataFrame
+        from dframe.dataframe.lazy import LazyFrame
+        snapshot = type(self)(self)
+
+        def read(columns, nrows):
+            if nrows is None:
+                return [snapshot[columns]]
+            return [snapshot[:nrows, columns]]
+        return LazyFrame._scan('dataframe', snapshot._names, read)
+
+    def window(self, partition_by=None, order_by=None, ascending=True):
+        ''' Partition the rows by the values of some columns and order them
+            within each partition, for window functions such as row_number,
+            rank, lag, lead and cumsum. The rows are sorted once; every
+            window function of the result reuses the sort.
+
+            Args
+            -----
+            partition_by (str or list of str): names of the partitioning
+                columns; None makes all rows one partition.
+            order_by (str or list of str): names of the ordering columns;
+                None keeps the row order. None(s) are ordered last.
+            ascending (bool or list of bool): order of each order_by column.
+
+            Returns
+            --------
+            Window: see dframe.dataframe.window.Window.
+        '''
+        # Imported here because dframe.dataframe.window imports DataFrame
+        # (through dframe.dataframe.grouping)
+        from dframe.dataframe.window import Window
+        return Window(self, partition_by, order_by, ascending)
+
+    def pivot_table(self, index, columns, values=None, aggfunc='count',
+                    fill_value=None):
+        ''' One row per group of `index` and one column per value of
+            `columns`, holding the aggregate of `values` in each cell; see
+            dframe.dataframe.grouping.pivot_table.
+
+            Args
+            -----
+            index (str or list of str): names of the row grouping columns.
+            columns (str): name of the column whose values become columns.
+            values (str): name of the column to aggregate; None counts rows.
+            aggfunc (str): 'count', 'sum', 'mean', 'min', 'max', 'first' or
+                'last'.
+            fill_value: value of the cells without any values.
+
+            Returns
+            --------
+            DataFrame
+        '''
+        # Imported here because dframe.dataframe.grouping imports DataFrame
+        from dframe.dataframe.grouping import pivot_table
+        return pivot_table(self, index, columns, values, aggfunc, fill_value)
+
+    def crosstab(self, index, columns):
+        ''' Row counts of every combination of the groups of `index` and
+            the values of `columns`; see pivot_table.
+
+            Returns
+            --------
+            DataFrame
+        '''
+        # Imported here because dframe.dataframe.grouping imports DataFrame
+        from dframe.dataframe.grouping import crosstab
+        return crosstab(self, index, columns)
+
+    def duplicated(self, subset=None, keep='first'):
+        ''' Flag the rows whose values in subset repeat those of another
+            row. Rows are compared by hashing whole columns, not row by row.
+
+            Args
+            -----
+            subset (str or list of str): names of the compared columns; None
+                compares all columns. None is equal to None.
+            keep (str or bool): 'first' or 'last' flags all but the first or
+                last of every set of equal rows; False flags all of them.
+
+            Returns
+            --------
+            Array: bool, True for the flagged rows.
+        '''
+        # Imported here because dframe.dataframe.grouping imports DataFrame
+        from dframe.dataframe.grouping import duplicated
+        return Array.from_numpy(duplicated(self, subset, keep))
+
+    def drop_duplicates(self, subset=None, keep='first'):
+        ''' The rows that are not flagged by DataFrame.duplicated, in
+            order.
+
+            Args
+            -----
+            subset (str or list of str): names of the compared columns; None
+                compares all columns.
+            keep (str or bool): 'first' or 'last' keeps the first or last of
+                every set of equal rows; False drops all of them.
+
+            Returns
+            --------
+            DataFrame
+        '''
+        # Imported here because dframe.dataframe.grouping imports DataFrame
+        from dframe.dataframe.grouping import duplicated
+        index = np.flatnonzero(~duplicated(self, subset, keep))
+        columns = map_columns(lambda column: column._take(index), self._data)
+        return type(self)._from_arrays(columns, self._names)
+
+    def distinct(self):
+        ''' The distinct rows, in order of first appearance. '''
+        return self.drop_duplicates()
 
     def __getitem__(self, key):
         if is_float(key):
@@ -375,16 +1038,16 @@ class DataFrame(object):
         elif is_string(key):
             return self._data[self._names_to_index[key]]
         elif isinstance(key, slice):
-            return type(self)(
-                _DataFrameSlice(self._data[key], self._names[key]))
+            return type(self)(_DataFrameSlice(_view_columns(self._data[key]),
+                                              self._names[key]))
         elif isinstance(key, Iterable) and not isinstance(key, tuple):
             if is_iterable_string(key):
                 key = [self._names_to_index[k] for k in key]
             if not is_iterable_unique(self._names[key]):
                 msg = 'duplicate column names found'
                 raise KeyError(msg)
-            return type(self)(
-                _DataFrameSlice(self._data[key], self._names[key]))
+            return type(self)(_DataFrameSlice(_view_columns(self._data[key]),
+                                              self._names[key]))
         elif isinstance(key, tuple):
             # Dual Indexing. Select both rows and columns.
             if len(key) == 2:
@@ -412,8 +1075,19 @@ class DataFrame(object):
                         raise KeyError(msg)
                     if is_integer(rowkey):
                         rowkey = [rowkey]
-                    _data = Array([column[rowkey]
-                                   for column in self._data[colkey]])
+                    # Resolve the row key once and apply the resulting
+                    # positions to every column.
+                    index = _resolve_index(rowkey, self._nrow)
+                    if index is None:
+                        columns = [column[rowkey]
+                                   for column in self._data[colkey]]
+                    else:
+                        columns = map_columns(
+                            lambda column: column._take(index),
+                            self._data[colkey])
+                    _data = Array(_ArrayData(
+                        _object_series(columns),
+                        Array if columns else type(None)))
                     return type(self)(_DataFrameSlice(_data, _names))
                 else:
                     # Catchall for all other column addresses
@@ -440,6 +1114,9 @@ class DataFrame(object):
         assert is_integer(key)
         tmp = self._create_array(value)
         if len(tmp) == self._nrow:
+            # A replaced column keeps its index kind; the index is rebuilt
+            # from the new values on the next lookup.
+            tmp._index_kind = self._data[key]._index_kind
             self._data[key] = tmp
         else:
             msg = 'value does not have match existing number of rows = {}'
@@ -655,8 +1332,9 @@ class DataFrame(object):
         self._update_names_to_index()
 
     def _delitem_rowkey(self, rowkey):
-        for j in range(len(self)):
-            del self._data[j][rowkey]
+        def delete(column):
+            del column[rowkey]
+        map_columns(delete, self._data)
         self._update_nrow_ncol()
 
     def __delitem__(self, key):
@@ -0,0 +1,357 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import ast
+import numbers
+import operator
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+
+# Expressions are parsed with the ast module and evaluated bottom-up on
+# (values, missing) pairs: values is a numpy array (or a Python scalar for
+# literals) and missing is a bool array (or bool) that is True where the
+# result is None. Every operator works on whole columns at once and the
+# missing masks are combined with the same rule as the element-wise
+# operators in dframe.missing: the result is None wherever an operand is
+# None.
+
+_ARITHMETIC = {ast.Add: operator.add, ast.Sub: operator.sub,
+               ast.Mult: operator.mul, ast.Div: operator.truediv,
+               ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+               ast.Pow: operator.pow}
+
+_COMPARISON = {ast.Eq: operator.eq, ast.NotEq: operator.ne,
+               ast.Lt: operator.lt, ast.LtE: operator.le,
+               ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+_DIVISION = (ast.Div, ast.FloorDiv, ast.Mod)
+
+# Integer results at least this large (in magnitude) may have wrapped around
+_INT64_LIMIT = 2.0 ** 63
+
+_LOOKUP_OPS = {ast.Eq: '==', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>',
+               ast.GtE: '>=', ast.In: 'in'}
+
+_REVERSED_OPS = {'==': '==', '<': '>', '<=': '>=', '>': '<', '>=': '<='}
+
+_NAMED_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+_cache = {}
+_cache_size = 256
+
+
+def _parse(text):
+    # Expressions are parsed once and the tree is reused by later calls
+    # with the same text.
+    tree = _cache.get(text)
+    if tree is None:
+        tree = ast.parse(text.strip(), mode='eval').body
+        if len(_cache) >= _cache_size:
+            _cache.clear()
+        _cache[text] = tree
+    return tree
+
+
+def _unsupported(node):
+    msg = 'unsupported expression: {}'.format(type(node).__name__)
+    return ValueError(msg)
+
+
+def _is_array(values):
+    return isinstance(values, np.ndarray)
+
+
+def _is_numeric(values):
+    if _is_array(values):
+        return values.dtype.kind in 'biuf'
+    return isinstance(values, (numbers.Real, np.bool_))
+
+
+def _as_number(values):
+    # numpy treats bool arithmetic as logic (True + True is True); Python
+    # treats bools as the integers 0 and 1.
+    if _is_array(values) and values.dtype.kind == 'b':
+        return values.astype(np.int64)
+    elif isinstance(values, (bool, np.bool_)):
+        return int(values)
+    return values
+
+
+def _literal(node):
+    # Returns the Python value of a literal node, or raises ValueError
+    name = type(node).__name__
+    if name in ('Num', 'Str', 'Bytes', 'NameConstant', 'Constant'):
+        for attribute in ('value', 'n', 's'):
+            if hasattr(node, attribute):
+                return getattr(node, attribute)
+    elif name == 'Name' and node.id in _NAMED_CONSTANTS:
+        return _NAMED_CONSTANTS[node.id]
+    elif name == 'UnaryOp' and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _literal(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    raise _unsupported(node)
+
+
+def _check_overflow(op, lvalues, rvalues, missing, values):
+    # numpy integer arithmetic wraps around silently; the same operation on
+    # float64 values tells whether any present result left the int64 range.
+    if not (_is_array(values) and values.dtype.kind in 'iu'):
+        return
+    with np.errstate(all='ignore'):
+        estimate = np.abs(op(np.asarray(lvalues, dtype=np.float64),
+                             np.asarray(rvalues, dtype=np.float64)))
+    overflow = np.logical_and(estimate >= _INT64_LIMIT,
+                              np.logical_not(missing))
+    if np.any(overflow):
+        msg = 'integer overflow: the result does not fit in 64 bits'
+        raise OverflowError(msg)
+
+
+def _fill_object(values, missing, n):
+    # Object results of element-wise operations: missing positions hold
+    # None and the array is narrowed to bool if every value is a bool.
+    missing = np.broadcast_to(missing, (n,))
+    present = values[~missing]
+    if len(present) > 0 and all(isinstance(value, (bool, np.bool_))
+                                for value in present):
+        result = np.zeros(n, dtype=bool)
+        result[~missing] = present.astype(bool)
+        return result
+    values[missing] = None
+    return values
+
+
+class _Evaluator(object):
+    def __init__(self, df):
+        self.df = df
+        self.n = df.nrow
+
+    def evaluate(self, node):
+        method = getattr(self, '_' + type(node).__name__, None)
+        if method is None:
+            value = _literal(node)
+            return value, value is None
+        return method(node)
+
+    def _Name(self, node):
+        if node.id in self.df._names_to_index:
+            column = self.df._data[self.df._names_to_index[node.id]]
+            return column._to_buffers()
+        elif node.id in _NAMED_CONSTANTS:
+            value = _NAMED_CONSTANTS[node.id]
+            return value, value is None
+        msg = 'column {} not found'.format(repr(node.id))
+        raise KeyError(msg)
+
+    def _apply(self, op, left, right):
+        lvalues, lmissing = left
+        rvalues, rmissing = right
+        missing = np.logical_or(lmissing, rmissing)
+        if not (_is_array(lvalues) or _is_array(rvalues)):
+            if missing:
+                return None, True
+            return op(lvalues, rvalues), False
+        if _is_numeric(lvalues) and _is_numeric(rvalues):
+            # Missing positions hold fill values (0, NaN, False) that are
+            # computed on and then masked.
+            with np.errstate(all='ignore'):
+                values = op(lvalues, rvalues)
+            _check_overflow(op, lvalues, rvalues, missing, values)
+            return values, missing
+        # Element-wise on the present values only, so that None never
+        # reaches an operator.
+        mask = np.broadcast_to(missing, (self.n,))
+        present = ~mask
+        values = np.empty(self.n, dtype=object)
+        lpresent = lvalues[present] if _is_array(lvalues) else lvalues
+        rpresent = rvalues[present] if _is_array(rvalues) else rvalues
+        if present.any():
+            values[present] = op(lpresent, rpresent)
+        return _fill_object(values, mask, self.n), mask
+
+    def _BinOp(self, node):
+        op = _ARITHMETIC.get(type(node.op))
+        if op is None:
+            raise _unsupported(node.op)
+        lvalues, lmissing = self.evaluate(node.left)
+        rvalues, rmissing = self.evaluate(node.right)
+        if _is_numeric(lvalues) and _is_numeric(rvalues):
+            lvalues, rvalues = _as_number(lvalues), _as_number(rvalues)
+            if isinstance(node.op, _DIVISION):
+                zero = np.logical_and(np.equal(rvalues, 0),
+                                      np.logical_not(rmissing))
+                zero = np.logical_and(zero, np.logical_not(lmissing))
+                if np.any(zero):
+                    raise ZeroDivisionError('division by zero')
+        return self._apply(op, (lvalues, lmissing), (rvalues, rmissing))
+
+    def _UnaryOp(self, node):
+        values, missing = self.evaluate(node.operand)
+        if isinstance(node.op, ast.Not):
+            return np.logical_not(self._as_bool(values, missing)), missing
+        elif isinstance(node.op, ast.USub):
+            op = operator.neg
+        elif isinstance(node.op, ast.UAdd):
+            op = operator.pos
+        else:
+            raise _unsupported(node.op)
+        values = _as_number(values)
+        if _is_array(values) and values.dtype.kind == 'O':
+            mask = np.broadcast_to(missing, (self.n,))
+            result = np.empty(self.n, dtype=object)
+            result[~mask] = op(values[~mask])
+            return _fill_object(result, mask, self.n), mask
+        elif not _is_array(values) and missing:
+            return None, True
+        return op(values), missing
+
+    def _as_bool(self, values, missing):
+        if _is_array(values):
+            if values.dtype.kind == 'b':
+                return values
+            elif np.all(missing):
+                return np.zeros(self.n, dtype=bool)
+        elif missing or isinstance(values, (bool, np.bool_)):
+            return bool(values)
+        msg = 'logical operators require bool operands'
+        raise TypeError(msg)
+
+    def _logical(self, op, left, right):
+        values = op(self._as_bool(*left), self._as_bool(*right))
+        return values, np.logical_or(left[1], right[1])
+
+    def _BoolOp(self, node):
+        if isinstance(node.op, ast.And):
+            op = np.logical_and
+        elif isinstance(node.op, ast.Or):
+            op = np.logical_or
+        else:
+            raise _unsupported(node.op)
+        result = self.evaluate(node.values[0])
+        for value in node.values[1:]:
+            result = self._logical(op, result, self.evaluate(value))
+        return result
+
+    def _membership(self, op, left, node):
+        if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            msg = "'in' requires a list, tuple or set of literals"
+            raise ValueError(msg)
+        candidates = [_literal(element) for element in node.elts]
+        values, missing = left
+        if _is_array(values):
+            isin = pd.Series(values).isin(candidates).values
+        else:
+            isin = values in candidates
+        if isinstance(op, ast.NotIn):
+            isin = np.logical_not(isin)
+        return isin, missing
+
+    def _Compare(self, node):
+        left = self.evaluate(node.left)
+        result = None
+        last = len(node.ops) - 1
+        for i, (op, comparator) in enumerate(zip(node.ops, node.comparators)):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                if i != last:
+                    # The list would be the left operand of the next link
+                    msg = "'in' must be the last operator of a comparison"
+                    raise ValueError(msg)
+                current = self._membership(op, left, comparator)
+                right = None
+            else:
+                function = _COMPARISON.get(type(op))
+                if function is None:
+                    raise _unsupported(op)
+                right = self.evaluate(comparator)
+                current = self._apply(function, left, right)
+            if result is None:
+                result = current
+            else:
+                result = self._logical(np.logical_and, result, current)
+            left = right
+        return result
+
+
+def evaluate(df, expr):
+    ''' Evaluate an expression over the columns of a DataFrame.
+
+        Returns
+        --------
+        (np.ndarray, np.ndarray): values and missing mask, both of length
+            df.nrow
+    '''
+    values, missing = _Evaluator(df).evaluate(_parse(expr))
+    n = df.nrow
+    if not _is_array(values):
+        # Expressions of literals only
+        values = np.full(n, values, dtype=object if missing or
+                         not _is_numeric(values) else None)
+    return values, np.broadcast_to(missing, (n,)).copy()
+
+
+def evaluate_array(df, expr):
+    values, missing = evaluate(df, expr)
+    return Array.from_numpy(values, missing)
+
+
+def _indexed_column(df, node):
+    if isinstance(node, ast.Name) and node.id in df._names_to_index:
+        column = df._data[df._names_to_index[node.id]]
+        if column._index_kind is not None:
+            return column
+    return None
+
+
+def _lookup(df, node):
+    # Sorted positions of the rows that satisfy node, using column indexes,
+    # or None if some part of node cannot be answered by an index.
+    if isinstance(node, ast.BoolOp):
+        parts = [_lookup(df, value) for value in node.values]
+        if any(part is None for part in parts):
+            return None
+        combine = (np.intersect1d if isinstance(node.op, ast.And)
+                   else np.union1d)
+        positions = parts[0]
+        for part in parts[1:]:
+            positions = combine(positions, part)
+        return positions
+    elif isinstance(node, ast.Compare) and len(node.ops) == 1:
+        op = _LOOKUP_OPS.get(type(node.ops[0]))
+        left, right = node.left, node.comparators[0]
+        column = _indexed_column(df, left)
+        if column is None and op in _REVERSED_OPS:
+            # literal <op> column
+            left, right = right, left
+            op = _REVERSED_OPS[op]
+            column = _indexed_column(df, left)
+        if op is None or column is None:
+            return None
+        try:
+            if op == 'in':
+                if not isinstance(right, (ast.List, ast.Tuple, ast.Set)):
+                    return None
+                value = [_literal(element) for element in right.elts]
+            else:
+                value = _literal(right)
+        except ValueError:
+            return None
+        return column._lookup(op, value)
+    return None
+
+
+def lookup(df, expr):
+    ''' Positions of the rows that satisfy a logical expression, found with
+        the column indexes (see DataFrame.create_index), or None if the
+        expression must be evaluated instead.
+    '''
+    return _lookup(df, _parse(expr))
+
+
+def referenced_names(expr):
+    ''' Names used by an expression, other than True, False and None. '''
+    return set(node.id for node in ast.walk(_parse(expr))
+               if isinstance(node, ast.Name) and
+               node.id not in _NAMED_CONSTANTS)
@@ -0,0 +1,380 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import numbers
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+from dframe.array.array import _ArrayData
+from dframe.dtypes import is_string
+from dframe.dataframe.dataframe import DataFrame
+
+# Hash-based grouping and joining over the buffers of whole columns. Rows
+# are mapped to dense int64 group codes with pandas.factorize; every other
+# step is a numpy operation on the codes.
+
+_MAX_CODES = 1 << 62
+_AGGREGATES = ('count', 'sum', 'mean', 'min', 'max', 'first', 'last')
+
+
+def _column_codes(column):
+    # Codes 1..k for the distinct elements, in order of first appearance,
+    # and 0 for None. Returns (codes, k + 1).
+    values, missing = column._to_buffers()
+    codes, uniques = pd.factorize(values)
+    codes = np.where(missing, 0, codes + 1)
+    return codes.astype(np.int64), len(uniques) + 1
+
+
+def factorize(columns):
+    ''' Group codes of the rows of a sequence of equal length Arrays.
+
+        Returns
+        --------
+        (np.ndarray, int): int64 codes 0..ngroups-1, numbered in order of the
+            first row of each group, and ngroups. None is a value of its own.
+    '''
+    codes, size = None, 1
+    for column in columns:
+        column_codes, k = _column_codes(column)
+        if codes is None:
+            codes, size = column_codes, k
+            continue
+        if size * k >= _MAX_CODES:
+            # Renumber densely before the mixed-radix codes can overflow
+            codes, uniques = pd.factorize(codes)
+            size = len(uniques)
+        codes = codes * k + column_codes
+        size *= k
+    if codes is None:
+        return np.zeros(0, dtype=np.int64), 0
+    codes, uniques = pd.factorize(codes)
+    return codes.astype(np.int64), len(uniques)
+
+
+def _first_rows(codes):
+    # Position of the first row of every group. Codes numbered in order of
+    # first appearance (see factorize) start a group where they exceed all
+    # earlier codes, so no sort is needed.
+    if len(codes) == 0:
+        return np.zeros(0, dtype=np.int64)
+    seen = np.maximum.accumulate(codes)
+    return np.flatnonzero(np.concatenate([[True], codes[1:] > seen[:-1]]))
+
+
+def _boxed(values, missing, dtype):
+    if missing.all():
+        dtype = type(None)
+    values = values.astype(object)
+    values[missing] = None
+    return Array(_ArrayData(pd.Series(values, dtype=object), dtype))
+
+
+def _aggregate_buffers(column, func, codes, ngroups):
+    # The aggregates of the groups as (values, empty, dtype), where empty
+    # marks the groups without values
+    values, missing = column._to_buffers()
+    if column.dtype is type(None):
+        # No values at all; every group is empty
+        values = np.zeros(len(column), dtype=np.int64)
+    present = ~missing
+    group = codes[present]
+    values = values[present]
+    count = np.bincount(group, minlength=ngroups)
+    empty = count == 0
+    if func == 'count':
+        return count, np.zeros(ngroups, dtype=bool), int
+    elif func in ('sum', 'mean'):
+        if values.dtype.kind not in 'biuf':
+            msg = '{} requires numeric columns'.format(func)
+            raise TypeError(msg)
+        if func == 'sum' and values.dtype.kind in 'biu':
+            total = np.zeros(ngroups, dtype=np.int64)
+            np.add.at(total, group, values.astype(np.int64))
+            return total, empty, int
+        total = np.bincount(group, weights=values.astype(np.float64),
+                            minlength=ngroups)
+        if func == 'sum':
+            return total, empty, float
+        with np.errstate(all='ignore'):
+            return total / count, empty, float
+    elif func in ('min', 'max', 'first', 'last'):
+        if func in ('min', 'max'):
+            # Sort by value, then stably by group
+            order = np.argsort(values, kind='mergesort')
+            order = order[np.argsort(group[order], kind='mergesort')]
+        else:
+            order = np.argsort(group, kind='mergesort')
+        stops = np.cumsum(count)
+        starts = stops - count
+        position = starts if func in ('min', 'first') else stops - 1
+        output = np.empty(ngroups, dtype=values.dtype)
+        output[~empty] = values[order[position[~empty]]]
+        return output, empty, column.dtype
+    msg = 'aggregate must be one of {}'.format(', '.join(_AGGREGATES))
+    raise ValueError(msg)
+
+
+def _aggregate_column(column, func, codes, ngroups):
+    if func == 'count':
+        values, _, _ = _aggregate_buffers(column, func, codes, ngroups)
+        return Array.from_numpy(values)
+    return _boxed(*_aggregate_buffers(column, func, codes, ngroups))
+
+
+def aggregate(df, by, aggs):
+    ''' Group the rows of df by the columns `by` and aggregate.
+
+        Args
+        -----
+        df (DataFrame)
+        by (list of str): names of the grouping columns.
+        aggs (list of tuple): (output name, column name, function) with
+            function one of 'count', 'sum', 'mean', 'min', 'max', 'first'
+            or 'last'. None(s) are ignored; the aggregate of a group
+            without values is None (0 for count).
+
+        Returns
+        --------
+        DataFrame: one row per group, in order of first appearance, with
+            the grouping columns followed by the aggregates.
+    '''
+    keys = [df[name] for name in by]
+    if len(keys) == 0:
+        codes, ngroups = np.zeros(df.nrow, dtype=np.int64), 1
+    else:
+        codes, ngroups = factorize(keys)
+    first = _first_rows(codes)
+    columns = [key._take(first) for key in keys]
+    for _, name, func in aggs:
+        columns.append(_aggregate_column(df[name], func, codes, ngroups))
+    names = list(by) + [output for output, _, _ in aggs]
+    return DataFrame._from_arrays(columns, names)
+
+
+def _pivot_name(value):
+    return value if is_string(value) else str(value)
+
+
+def _pivot_names(index, columns, values):
+    # Output names of the index columns and of the values of `columns`. A
+    # value named like an index column gets the suffix '_' + columns.
+    names = [_pivot_name(value) for value in values]
+    names = [name + '_' + columns if name in index else name
+             for name in names]
+    names = list(index) + names
+    if len(set(names)) != len(names):
+        msg = 'values of column {} collide with the index column names'
+        raise ValueError(msg.format(repr(columns)))
+    return names
+
+
+def pivot_table(df, index, columns, values=None, aggfunc='count',
+                fill_value=None):
+    ''' Spread the aggregates of the groups of the columns `index` and
+        `columns` into a table with one row per index group and one column
+        per distinct value of `columns`. The table is computed in a single
+        grouping pass over cell codes (index group * number of columns +
+        column value), and each output column is filled from the result
+        with vectorized numpy operations.
+
+        Args
+        -----
+        df (DataFrame)
+        index (str or list of str): names of the row grouping columns.
+        columns (str): name of the column whose distinct values become the
+            output columns. Rows with None in it are ignored.
+        values (str): name of the column to aggregate; None counts rows.
+        aggfunc (str): 'count', 'sum', 'mean', 'min', 'max', 'first' or
+            'last', as in aggregate.
+        fill_value: value of the cells without any values, converted to
+            the dtype of the output column (or kept as is if `values` has
+            no values at all); None by default ('count' gives 0).
+
+        Returns
+        --------
+        DataFrame: the index columns followed by one column per value of
+            `columns`, named by the value (str(value) for non strings) with
+            the suffix '_' + columns if an index column has that name. Rows
+            and columns are in order of first appearance.
+    '''
+    if is_string(index):
+        index = [index]
+    if values is None and aggfunc != 'count':
+        msg = "values is required unless aggfunc is 'count'"
+        raise ValueError(msg)
+    pivot = df[columns]
+    keys = [df[name] for name in index]
+    target = pivot if values is None else df[values]
+    missing = pivot._missing()
+    if missing.any():
+        rows = np.flatnonzero(~missing)
+        pivot, target = pivot._take(rows), target._take(rows)
+        keys = [key._take(rows) for key in keys]
+
+    nrow = len(pivot)
+    if len(keys) == 0:
+        rcodes, nrows = np.zeros(nrow, dtype=np.int64), min(nrow, 1)
+    else:
+        rcodes, nrows = factorize(keys)
+    ccodes, ncols = factorize([pivot])
+    cells, empty, dtype = _aggregate_buffers(target, aggfunc,
+                                             rcodes * ncols + ccodes,
+                                             nrows * ncols)
+    cells, empty = cells.reshape(nrows, ncols), empty.reshape(nrows, ncols)
+    if fill_value is not None and empty.any():
+        if dtype is type(None):
+            dtype = type(fill_value)
+        fill_value = dtype(fill_value)
+
+    first = _first_rows(rcodes)
+    output = [key._take(first) for key in keys]
+    for j in range(ncols):
+        column_empty = empty[:, j]
+        if fill_value is None or not column_empty.any():
+            output.append(_boxed(cells[:, j], column_empty, dtype))
+            continue
+        column = cells[:, j].astype(object)
+        column[column_empty] = fill_value
+        output.append(Array(_ArrayData(pd.Series(column, dtype=object),
+                                       dtype)))
+    first = _first_rows(ccodes)
+    names = _pivot_names(index, columns, pivot._take(first))
+    return DataFrame._from_arrays(output, names)
+
+
+def crosstab(df, index, columns):
+    ''' Count the rows of every combination of the groups of `index` and
+        the values of `columns`; see pivot_table.
+    '''
+    return pivot_table(df, index, columns, aggfunc='count')
+
+
+def duplicated(df, subset=None, keep='first'):
+    ''' Flag the rows that repeat the values of other rows.
+
+        Args
+        -----
+        df (DataFrame)
+        subset (str or list of str): names of the compared columns; None
+            compares all columns. None is equal to None.
+        keep (str or bool): 'first' or 'last' to flag all but the first or
+            last row of every set of equal rows, False to flag all of them.
+
+        Returns
+        --------
+        np.ndarray: bool, True for the flagged rows.
+    '''
+    if keep not in ('first', 'last', False):
+        msg = "keep must be 'first', 'last' or False"
+        raise ValueError(msg)
+    if subset is None:
+        subset = list(df.names)
+    elif is_string(subset):
+        subset = [subset]
+    if len(subset) == 0:
+        codes, ngroups = np.zeros(df.nrow, dtype=np.int64), min(df.nrow, 1)
+    else:
+        codes, ngroups = factorize([df[name] for name in subset])
+    flags = np.ones(len(codes), dtype=bool)
+    if keep == 'first':
+        flags[_first_rows(codes)] = False
+    elif keep == 'last':
+        # Renumbered in order of first appearance from the end
+        reverse, _ = pd.factorize(codes[::-1])
+        flags[len(codes) - 1 - _first_rows(reverse)] = False
+    else:
+        flags = np.bincount(codes, minlength=ngroups)[codes] > 1
+    return flags
+
+
+def _take_or_none(column, positions):
+    # Like Array._take, with None where positions is -1
+    unmatched = positions < 0
+    if not unmatched.any():
+        return column._take(positions)
+    values = column._values()[np.where(unmatched, 0, positions)]
+    values[unmatched] = None
+    dtype = column.dtype
+    if unmatched.all() or pd.isnull(values).all():
+        dtype = type(None)
+    return Array(_ArrayData(pd.Series(values, dtype=object), dtype))
+
+
+def _is_number(dtype):
+    return (issubclass(dtype, numbers.Real) and
+            not issubclass(dtype, (bool, np.bool_)))
+
+
+def _join_key(lcolumn, rcolumn, name):
+    # The left and right values of a key as one Array, so that they are
+    # factorized together
+    if (lcolumn.dtype == rcolumn.dtype or
+            type(None) in (lcolumn.dtype, rcolumn.dtype)):
+        return Array.from_chunks([lcolumn, rcolumn])
+    elif _is_number(lcolumn.dtype) and _is_number(rcolumn.dtype):
+        # int and float keys are compared as floats
+        lvalues, lmissing = lcolumn._to_buffers()
+        rvalues, rmissing = rcolumn._to_buffers()
+        values = np.concatenate([lvalues, rvalues]).astype(np.float64)
+        return Array.from_numpy(values, np.concatenate([lmissing, rmissing]))
+    msg = 'key {} has different dtypes'.format(repr(name))
+    raise TypeError(msg)
+
+
+def join(left, right, on, how='inner', suffix='_right'):
+    ''' Join two DataFrames on equal values of the columns `on`. Rows with
+        a None in a key never match.
+
+        Args
+        -----
+        left, right (DataFrame)
+        on (list of str): key columns present in both DataFrames.
+        how (str): 'inner', or 'left' to keep unmatched left rows with None
+            in the right columns.
+        suffix (str): appended to the names of right columns that are also
+            left columns.
+
+        Returns
+        --------
+        DataFrame: left columns followed by the right non-key columns, in
+            order of the left rows and then of the matching right rows.
+    '''
+    if how not in ('inner', 'left'):
+        msg = "how must be 'inner' or 'left'"
+        raise ValueError(msg)
+    nleft, nright = left.nrow, right.nrow
+    keys = [_join_key(left[name], right[name], name) for name in on]
+    missing = np.zeros(nleft + nright, dtype=bool)
+    for key in keys:
+        missing |= key._missing()
+    codes, ngroups = factorize(keys)
+    codes = np.where(missing, -1, codes)
+    lcodes, rcodes = codes[:nleft], codes[nleft:]
+
+    # Right rows grouped by code, in row order within a code
+    rpresent = np.flatnonzero(rcodes >= 0)
+    order = rpresent[np.argsort(rcodes[rpresent], kind='mergesort')]
+    counts = np.bincount(rcodes[rpresent], minlength=ngroups)
+    starts = np.cumsum(counts) - counts
+
+    matches = np.where(lcodes >= 0, counts[np.maximum(lcodes, 0)], 0)
+    repeats = np.maximum(matches, 1) if how == 'left' else matches
+    lpositions = np.repeat(np.arange(nleft), repeats)
+    offsets = np.arange(len(lpositions)) - np.repeat(np.cumsum(repeats) -
+                                                     repeats, repeats)
+    rstarts = np.repeat(starts[np.maximum(lcodes, 0)], repeats)
+    rmatched = np.repeat(matches > 0, repeats)
+    rpositions = np.full(len(lpositions), -1, dtype=np.int64)
+    rpositions[rmatched] = order[(rstarts + offsets)[rmatched]]
+
+    columns = [column._take(lpositions) for column in left.values()]
+    names = list(left.names)
+    for name, column in zip(right.names, right.values()):
+        if name in on:
+            continue
+        columns.append(_take_or_none(column, rpositions))
+        names.append(name + suffix if name in names else name)
+    return DataFrame._from_arrays(columns, names)
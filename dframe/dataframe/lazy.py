@@ -0,0 +1,524 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from dframe.array import Array
+from dframe.dtypes import is_string, is_integer
+from dframe.scalar import is_iterable_string
+from dframe.dataframe.dataframe import DataFrame
+from dframe.dataframe.expr import referenced_names
+from dframe.dataframe.grouping import aggregate, join, _AGGREGATES
+
+# A LazyFrame is a logical plan: a tree of the nodes below, with a scan at
+# every leaf. Nothing is computed until collect(). The optimizer rewrites
+# the tree in two passes:
+#
+# 1. push_predicates moves filters towards the scans. Adjacent filters are
+#    fused into one expression and a scan applies its filter to each chunk
+#    as it is read.
+# 2. prune passes the set of columns that are needed downwards, so that
+#    scans read only those columns and unused with_column steps and
+#    aggregates are dropped. Adjacent with_column steps are fused into one
+#    node, and head is moved below row-preserving steps into the scan.
+
+
+def _fuse(predicates):
+    if len(predicates) == 1:
+        return predicates[0]
+    return ' and '.join('({})'.format(p) for p in predicates)
+
+
+def _filtered(node, predicates):
+    if len(predicates) == 0:
+        return node
+    return _Filter(node, _fuse(predicates))
+
+
+def _limited(node, nrows):
+    # head(nrows) of node, as deep in the plan as the row order allows
+    if isinstance(node, _Scan):
+        return node.with_limit(nrows)
+    elif isinstance(node, _Select):
+        return _Select(_limited(node.input, nrows), node.columns)
+    elif isinstance(node, _WithColumns):
+        return _WithColumns(_limited(node.input, nrows), node.assignments)
+    return _Head(node, nrows)
+
+
+def _indent(text):
+    return '\n'.join('  ' + line for line in text.split('\n'))
+
+
+class _Scan(object):
+    # Reads the columns of a source. read(columns, nrows) returns an
+    # iterable of DataFrames (chunks) with at least the given columns and
+    # with at most nrows rows in total if nrows is not None.
+    def __init__(self, label, schema, read, columns=None, predicates=(),
+                 limit=None):
+        self.label = label
+        self.schema = list(schema)
+        self.read = read
+        self.columns = list(schema) if columns is None else list(columns)
+        self.predicates = list(predicates)
+        self.limit = limit
+
+    def _copy(self, **kwargs):
+        fields = dict(columns=self.columns, predicates=self.predicates,
+                      limit=self.limit)
+        fields.update(kwargs)
+        return _Scan(self.label, self.schema, self.read, **fields)
+
+    def with_limit(self, nrows):
+        if self.limit is not None:
+            nrows = min(nrows, self.limit)
+        return self._copy(limit=nrows)
+
+    def names(self):
+        return list(self.columns)
+
+    def push_predicates(self, predicates):
+        if self.limit is not None:
+            # Filtering must happen after the first rows are taken
+            return _filtered(self, predicates)
+        return self._copy(predicates=self.predicates + list(predicates))
+
+    def prune(self, required):
+        columns = [name for name in self.columns if name in required]
+        if len(columns) == 0 and len(self.columns) > 0:
+            # One column is kept to carry the number of rows
+            columns = self.columns[:1]
+        return self._copy(columns=columns)
+
+    def describe(self):
+        text = 'SCAN {} columns=[{}]'.format(self.label,
+                                             ', '.join(self.columns))
+        if self.predicates:
+            text += ' filter={}'.format(_fuse(self.predicates))
+        if self.limit is not None:
+            text += ' limit={}'.format(self.limit)
+        return text
+
+    def execute(self):
+        needed = set(self.columns)
+        for predicate in self.predicates:
+            needed.update(referenced_names(predicate))
+        read = [name for name in self.schema if name in needed]
+        chunks = []
+        nrows = 0
+        # Without a filter, the reader can stop at the limit by itself
+        limit = None if self.predicates else self.limit
+        for chunk in self.read(read, limit):
+            if self.predicates:
+                chunk = chunk.query(_fuse(self.predicates))
+            if self.limit is not None and nrows + chunk.nrow > self.limit:
+                chunk = chunk[:self.limit - nrows, :]
+            chunks.append(chunk)
+            nrows += chunk.nrow
+            if self.limit is not None and nrows >= self.limit:
+                break
+        if len(chunks) == 1:
+            return chunks[0][self.columns]
+        columns = [Array.from_chunks([chunk[name] for chunk in chunks])
+                   for name in self.columns]
+        return DataFrame._from_arrays(columns, self.columns)
+
+
+class _Select(object):
+    def __init__(self, input, columns):
+        self.input = input
+        self.columns = list(columns)
+
+    def names(self):
+        return list(self.columns)
+
+    def push_predicates(self, predicates):
+        # Predicates can only use the selected columns, which come from the
+        # input unchanged
+        return _Select(self.input.push_predicates(predicates), self.columns)
+
+    def prune(self, required):
+        columns = [name for name in self.columns if name in required]
+        if len(columns) == 0:
+            columns = self.columns[:1]
+        input = self.input.prune(set(columns))
+        if input.names() == columns:
+            return input
+        return _Select(input, columns)
+
+    def describe(self):
+        return 'SELECT [{}]'.format(', '.join(self.columns))
+
+    def execute(self):
+        return self.input.execute()[self.columns]
+
+
+class _Filter(object):
+    def __init__(self, input, predicate):
+        self.input = input
+        self.predicate = predicate
+
+    def names(self):
+        return self.input.names()
+
+    def push_predicates(self, predicates):
+        return self.input.push_predicates([self.predicate] + predicates)
+
+    def prune(self, required):
+        needed = set(required) | referenced_names(self.predicate)
+        return _Filter(self.input.prune(needed), self.predicate)
+
+    def describe(self):
+        return 'FILTER {}'.format(self.predicate)
+
+    def execute(self):
+        return self.input.execute().query(self.predicate)
+
+
+class _WithColumns(object):
+    # One or more columns computed from expressions, in order; later
+    # expressions may use earlier columns.
+    def __init__(self, input, assignments):
+        self.input = input
+        self.assignments = list(assignments)
+
+    def names(self):
+        names = self.input.names()
+        for name, _ in self.assignments:
+            if name not in names:
+                names.append(name)
+        return names
+
+    def push_predicates(self, predicates):
+        assigned = set(name for name, _ in self.assignments)
+        below = [p for p in predicates if not referenced_names(p) & assigned]
+        above = [p for p in predicates if referenced_names(p) & assigned]
+        node = _WithColumns(self.input.push_predicates(below),
+                            self.assignments)
+        return _filtered(node, above)
+
+    def prune(self, required):
+        needed = set(required)
+        assignments = []
+        for name, expr in reversed(self.assignments):
+            if name in needed:
+                assignments.insert(0, (name, expr))
+                needed.discard(name)
+                needed.update(referenced_names(expr))
+        input = self.input.prune(needed)
+        if len(assignments) == 0:
+            return input
+        elif isinstance(input, _WithColumns):
+            return _WithColumns(input.input, input.assignments + assignments)
+        return _WithColumns(input, assignments)
+
+    def describe(self):
+        return 'WITH {}'.format(', '.join('{} = {}'.format(name, expr)
+                                          for name, expr in self.assignments))
+
+    def execute(self):
+        df = self.input.execute()
+        columns = dict(zip(df.names, df.values()))
+        names = list(df.names)
+        for name, expr in self.assignments:
+            columns[name] = df.eval(expr)
+            if name not in names:
+                names.append(name)
+            df = DataFrame._from_arrays([columns[n] for n in names], names)
+        return df
+
+
+class _Aggregate(object):
+    def __init__(self, input, by, aggs):
+        self.input = input
+        self.by = list(by)
+        self.aggs = list(aggs)
+
+    def names(self):
+        return self.by + [output for output, _, _ in self.aggs]
+
+    def push_predicates(self, predicates):
+        outputs = set(output for output, _, _ in self.aggs)
+        keys = set(self.by) - outputs
+        below = [p for p in predicates if referenced_names(p) <= keys]
+        above = [p for p in predicates if not referenced_names(p) <= keys]
+        node = _Aggregate(self.input.push_predicates(below), self.by,
+                          self.aggs)
+        return _filtered(node, above)
+
+    def prune(self, required):
+        aggs = [agg for agg in self.aggs if agg[0] in required]
+        needed = set(self.by) | set(name for _, name, _ in aggs)
+        return _Aggregate(self.input.prune(needed), self.by, aggs)
+
+    def describe(self):
+        aggs = ', '.join('{} = {}({})'.format(output, func, name)
+                         for output, name, func in self.aggs)
+        return 'AGGREGATE by=[{}] {}'.format(', '.join(self.by), aggs)
+
+    def execute(self):
+        return aggregate(self.input.execute(), self.by, self.aggs)
+
+
+class _Join(object):
+    def __init__(self, left, right, on, how, renames):
+        self.left = left
+        self.right = right
+        self.on = list(on)
+        self.how = how
+        # Output names of the right non-key columns, fixed when the join is
+        # created so that pruning the left input does not change them
+        self.renames = renames
+
+    def names(self):
+        return self.left.names() + [self.renames[name]
+                                    for name in self.right.names()
+                                    if name not in self.on]
+
+    def push_predicates(self, predicates):
+        left_names = set(self.left.names())
+        right_names = set(self.renames[name] for name in self.right.names()
+                          if name not in self.on and
+                          self.renames[name] == name)
+        left, right, above = [], [], []
+        for predicate in predicates:
+            names = referenced_names(predicate)
+            if names <= left_names:
+                left.append(predicate)
+            elif self.how == 'inner' and names <= right_names:
+                # Unmatched rows of a left join must not be filtered early
+                right.append(predicate)
+            else:
+                above.append(predicate)
+        node = _Join(self.left.push_predicates(left),
+                     self.right.push_predicates(right), self.on, self.how,
+                     self.renames)
+        return _filtered(node, above)
+
+    def prune(self, required):
+        outputs = dict((output, name) for name, output in self.renames.items())
+        left_names = set(self.left.names())
+        left = set(name for name in required if name in left_names)
+        left.update(self.on)
+        right = set(outputs[name] for name in required
+                    if name in outputs) | set(self.on)
+        return _Join(self.left.prune(left), self.right.prune(right),
+                     self.on, self.how, self.renames)
+
+    def describe(self):
+        return 'JOIN {} on=[{}]'.format(self.how, ', '.join(self.on))
+
+    def execute(self):
+        left = self.left.execute()
+        right = self.right.execute()
+        df = join(left, right, self.on, self.how)
+        return DataFrame._from_arrays(df.values(), self.names())
+
+
+class _Head(object):
+    def __init__(self, input, nrows):
+        self.input = input
+        self.nrows = nrows
+
+    def names(self):
+        return self.input.names()
+
+    def push_predicates(self, predicates):
+        return _filtered(_Head(self.input.push_predicates([]), self.nrows),
+                         predicates)
+
+    def prune(self, required):
+        return _limited(self.input.prune(required), self.nrows)
+
+    def describe(self):
+        return 'HEAD {}'.format(self.nrows)
+
+    def execute(self):
+        return self.input.execute().head(self.nrows)
+
+
+def _inputs(node):
+    if isinstance(node, _Scan):
+        return []
+    elif isinstance(node, _Join):
+        return [node.left, node.right]
+    return [node.input]
+
+
+def _explain(node):
+    lines = [node.describe()]
+    for input in _inputs(node):
+        lines.append(_indent(_explain(input)))
+    return '\n'.join(lines)
+
+
+def _check_names(names, available):
+    missing = [name for name in names if name not in available]
+    if missing:
+        msg = 'column {} not found'.format(repr(missing[0]))
+        raise KeyError(msg)
+
+
+def _as_names(names):
+    if len(names) == 1 and not is_string(names[0]):
+        names = names[0]
+    names = list(names)
+    if not is_iterable_string(names):
+        msg = 'column names must be strings'
+        raise ValueError(msg)
+    return names
+
+
+class LazyFrame(object):
+    ''' A query on a DataFrame or a file that is planned, optimized and run
+        only when collect() is called. Create one with DataFrame.lazy() or
+        dframe.scan_csv().
+
+        Each method returns a new LazyFrame with one more step. Before
+        running, filters are moved as close to the source as possible,
+        only the columns that the result needs are read (for a CSV file,
+        only those columns are parsed), unused steps are removed, and
+        adjacent filter and with_column steps are fused. Use explain() to
+        see the plan.
+    '''
+    def __init__(self, plan):
+        self._plan = plan
+
+    @classmethod
+    def _scan(cls, label, schema, read):
+        return cls(_Scan(label, schema, read))
+
+    @property
+    def names(self):
+        return Array(self._plan.names())
+
+    def select(self, *names):
+        ''' Keep the given columns, in the given order. '''
+        names = _as_names(names)
+        _check_names(names, self._plan.names())
+        return LazyFrame(_Select(self._plan, names))
+
+    def filter(self, expr):
+        ''' Keep the rows for which the expression is True; see
+            DataFrame.query.
+        '''
+        _check_names(referenced_names(expr), self._plan.names())
+        return LazyFrame(_Filter(self._plan, expr))
+
+    def with_column(self, name, expr):
+        ''' Add or replace the column `name` with the value of an
+            expression; see DataFrame.eval.
+        '''
+        if not is_string(name):
+            msg = 'column name must be a string'
+            raise ValueError(msg)
+        _check_names(referenced_names(expr), self._plan.names())
+        return LazyFrame(_WithColumns(self._plan, [(name, expr)]))
+
+    def groupby(self, *names):
+        ''' Group by the given columns; call agg() on the result. '''
+        names = _as_names(names)
+        _check_names(names, self._plan.names())
+        return LazyGroupBy(self, names)
+
+    def join(self, other, on, how='inner', suffix='_right'):
+        ''' Join with another LazyFrame or DataFrame on equal values of the
+            key columns; see dframe.dataframe.grouping.join.
+
+            Args
+            -----
+            other (LazyFrame or DataFrame)
+            on (str or list of str): key columns present in both.
+            how (str): 'inner' or 'left'.
+            suffix (str): appended to the names of the columns of other
+                that are also columns of this LazyFrame.
+
+            Returns
+            --------
+            LazyFrame
+        '''
+        if isinstance(other, DataFrame):
+            other = other.lazy()
+        on = [on] if is_string(on) else list(on)
+        if how not in ('inner', 'left'):
+            msg = "how must be 'inner' or 'left'"
+            raise ValueError(msg)
+        left, right = self._plan.names(), other._plan.names()
+        _check_names(on, left)
+        _check_names(on, right)
+        renames = dict((name, name + suffix if name in left else name)
+                       for name in right if name not in on)
+        return LazyFrame(_Join(self._plan, other._plan, on, how, renames))
+
+    def head(self, nrows=6):
+        if not is_integer(nrows) or nrows < 0:
+            msg = 'nrows must be a non-negative integer'
+            raise ValueError(msg)
+        return LazyFrame(_Head(self._plan, nrows))
+
+    def optimize(self):
+        ''' The same query with the optimized plan. '''
+        names = self._plan.names()
+        plan = self._plan.push_predicates([])
+        plan = plan.prune(set(names))
+        if plan.names() != names:
+            plan = _Select(plan, names)
+        return LazyFrame(plan)
+
+    def explain(self, optimized=True):
+        ''' The plan as text, one step per line with inputs indented. '''
+        plan = self.optimize()._plan if optimized else self._plan
+        return _explain(plan)
+
+    def collect(self):
+        ''' Run the optimized plan.
+
+            Returns
+            --------
+            DataFrame
+        '''
+        return self.optimize()._plan.execute()
+
+    def __repr__(self):
+        return self.explain(optimized=False)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class LazyGroupBy(object):
+    def __init__(self, lazyframe, by):
+        self._lazyframe = lazyframe
+        self._by = by
+
+    def agg(self, aggs):
+        ''' Aggregate every group to one row.
+
+            Args
+            -----
+            aggs (list of tuple): (column, function) or (column, function,
+                output name), with function one of 'count', 'sum', 'mean',
+                'min', 'max', 'first' or 'last'. The default output name is
+                column_function.
+
+            Returns
+            --------
+            LazyFrame: the grouping columns followed by the aggregates.
+        '''
+        normalized = []
+        for agg in aggs:
+            if len(agg) == 2:
+                name, func = agg
+                output = '{}_{}'.format(name, func)
+            else:
+                name, func, output = agg
+            if func not in _AGGREGATES:
+                msg = 'aggregate must be one of {}'.format(
+                    ', '.join(_AGGREGATES))
+                raise ValueError(msg)
+            normalized.append((output, name, func))
+        plan = self._lazyframe._plan
+        _check_names([name for _, name, _ in normalized], plan.names())
+        outputs = self._by + [output for output, _, _ in normalized]
+        if len(set(outputs)) != len(outputs):
+            raise ValueError('duplicate column names found')
+        return LazyFrame(_Aggregate(plan, self._by, normalized))
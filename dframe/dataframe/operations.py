@@ -1,9 +1,15 @@
 from __future__ import absolute_import
 from __future__ import print_function
 
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+from dframe.array.array import _ArrayData
 from dframe.scalar import is_list_same, is_list_unique
 from dframe.compat import Iterable
 from dframe.dataframe import DataFrame
+from dframe.parallel import map_columns
 
 
 def is_iterable_dataframe(x):
@@ -25,6 +31,29 @@ def is_iterable_dataframe(x):
     return True
 
 
+def _concatenate_columns(columns, dtype):
+    # Concatenate Arrays of the same dtype into one Array. The element
+    # buffers are copied once into the output and the dtype is not inferred
+    # again.
+    if len(columns) == 1:
+        values = columns[0]._data.values.copy()
+    else:
+        values = np.concatenate([column._data.values for column in columns])
+    return Array(_ArrayData(pd.Series(values, dtype=object), dtype))
+
+
+def _stack_columns(columns_per_df, names, lazy=False):
+    # columns_per_df[i][j] is column j of DataFrame i, already in the
+    # output order and with the same dtypes across DataFrames.
+    def stack(j):
+        columns = [columns[j] for columns in columns_per_df]
+        if lazy:
+            return Array.from_chunks(columns)
+        return _concatenate_columns(columns, columns[0].dtype)
+    arrays = map_columns(stack, range(len(names)))
+    return DataFrame._from_arrays(arrays, names)
+
+
 def hstack(dfs):
     ''' Horizontally stack a sequence of DataFrames. This is same as cbind().
 
@@ -71,7 +100,7 @@ def cbind(dfs):
     return hstack(dfs)
 
 
-def vstack(dfs):
+def vstack(dfs, lazy=False):
     ''' Vertically stack a sequence of DataFrames.
 
         Args
@@ -80,6 +109,11 @@ def vstack(dfs):
                 objects must have the same number of columns. Columns must have
                 the same order of dtypes across DataFrames. Column names need
                 not be the same across DataFrames.
+            lazy (bool): if True, the columns of the output reference the
+                columns of the input DataFrames as chunks instead of copying
+                them (see Array.from_chunks). Scans, filters and row
+                iteration work one chunk at a time; a column is concatenated
+                only when it is modified.
 
         Returns
         --------
@@ -92,11 +126,11 @@ def vstack(dfs):
                 names = []
             else:
                 names = dfs[0].names
-            dtypes = [tuple(df.dtypes) for df in dfs]
+            columns_per_df = [list(df._data) for df in dfs]
+            dtypes = [tuple(column.dtype for column in columns)
+                      for columns in columns_per_df]
             if is_list_same(dtypes):
-                items = [(name, [elem for df in dfs for elem in df[j]])
-                         for j, name in enumerate(names)]
-                return DataFrame.from_items(items)
+                return _stack_columns(columns_per_df, list(names), lazy)
             else:
                 msg = 'columns must have the same dtypes in the same order'
                 raise ValueError(msg)
@@ -108,7 +142,7 @@ def vstack(dfs):
         raise ValueError(msg)
 
 
-def rbind(dfs):
+def rbind(dfs, lazy=False):
     ''' Vertically stack a sequence of DataFrames.
 
         Args
@@ -118,6 +152,8 @@ def rbind(dfs):
                 the same order of dtypes across DataFrames and same set of
                 column names. Column names need not be in the same order across
                 DataFrames.
+            lazy (bool): if True, the columns of the output reference the
+                input columns instead of copying them. See vstack().
 
         Returns
         --------
@@ -132,12 +168,14 @@ def rbind(dfs):
                     names = []
                 else:
                     names = dfs[0].names
-                dfs = [df[names] for df in dfs]
-                dtypes = [tuple(df.dtypes) for df in dfs]
+                names = list(names)
+                # Columns are matched by name without slicing each DataFrame
+                columns_per_df = [[df._data[df._names_to_index[name]]
+                                   for name in names] for df in dfs]
+                dtypes = [tuple(column.dtype for column in columns)
+                          for columns in columns_per_df]
                 if is_list_same(dtypes):
-                    items = [(name, [elem for df in dfs for elem in df[name]])
-                             for name in names]
-                    return DataFrame.from_items(items)
+                    return _stack_columns(columns_per_df, names, lazy)
                 else:
                     msg = 'columns must have the same dtypes'
                     raise ValueError(msg)
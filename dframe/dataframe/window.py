@@ -0,0 +1,237 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+from dframe.array.array import _ArrayData
+from dframe.dtypes import is_string, is_integer
+from dframe.dataframe.grouping import factorize, _take_or_none, _MAX_CODES
+
+# Window functions are computed over the rows sorted once by partition and
+# then by the order_by columns. The sorted rows form one contiguous segment
+# per partition; every function is a vectorized operation on the sorted
+# values that restarts at segment boundaries, and the result is scattered
+# back to the original row order.
+
+
+def _as_names(names):
+    if names is None:
+        return []
+    elif is_string(names):
+        return [names]
+    return list(names)
+
+
+def _sort_codes(column, ascending):
+    # Codes that sort like the elements of column, with None last
+    values, missing = column._to_buffers()
+    codes, uniques = pd.factorize(values, sort=True)
+    k = len(uniques)
+    if not ascending:
+        codes = k - 1 - codes
+    return np.where(missing, k, codes).astype(np.int64), k + 1
+
+
+def _sort_order(keys):
+    # Stable order of the rows sorted by keys, a list of (codes, number of
+    # codes) with the primary key first. Keys are combined into one mixed
+    # radix key, which sorts much faster than np.lexsort, when it fits.
+    combined, size = keys[0]
+    for codes, k in keys[1:]:
+        if size * k >= _MAX_CODES:
+            # np.lexsort is stable and sorts by its last key first
+            return np.lexsort([codes for codes, _ in keys[::-1]])
+        combined = combined * k + codes
+        size *= k
+    return np.argsort(combined, kind='mergesort')
+
+
+class Window(object):
+    ''' Rows of a DataFrame partitioned by the values of some columns and
+        ordered within each partition by other columns; see
+        DataFrame.window. Every window function returns an Array aligned to
+        the rows of the DataFrame as of the creation of the Window; later
+        changes to the DataFrame do not affect it.
+    '''
+    def __init__(self, df, partition_by=None, order_by=None, ascending=True):
+        # Copy-on-write snapshot, as DataFrame.lazy
+        df = type(df)(df)
+        self._df = df
+        self.partition_by = _as_names(partition_by)
+        self.order_by = _as_names(order_by)
+        if isinstance(ascending, bool):
+            ascending = [ascending] * len(self.order_by)
+        if len(ascending) != len(self.order_by):
+            msg = 'ascending must be a bool or one bool per order_by column'
+            raise ValueError(msg)
+
+        nrow = df.nrow
+        if self.partition_by:
+            codes, ngroups = factorize([df[name]
+                                        for name in self.partition_by])
+        else:
+            codes, ngroups = np.zeros(nrow, dtype=np.int64), 1
+        keys = [_sort_codes(df[name], up)
+                for name, up in zip(self.order_by, ascending)]
+        self._order = _sort_order([(codes, ngroups)] + keys)
+        codes = codes[self._order]
+        keys = [key[self._order] for key, _ in keys]
+
+        positions = np.arange(nrow)
+        starts = np.ones(nrow, dtype=bool)
+        starts[1:] = codes[1:] != codes[:-1]
+        segment_start = np.maximum.accumulate(np.where(starts, positions, 0))
+        # Segment label and position within the segment of each sorted row
+        self._segments = np.cumsum(starts) - 1
+        self._positions = positions - segment_start
+        lengths = np.bincount(self._segments)
+        self._remaining = lengths[self._segments] - self._positions - 1
+        # Sorted rows whose order_by values differ from the previous row's
+        ties = np.zeros(nrow, dtype=bool)
+        for key in keys:
+            ties[1:] |= key[1:] != key[:-1]
+        self._new_value = starts | ties
+
+    def _unsort(self, values):
+        output = np.empty_like(values)
+        output[self._order] = values
+        return output
+
+    def row_number(self):
+        ''' 1, 2, ... within each partition, in window order. '''
+        return Array.from_numpy(self._unsort(self._positions + 1))
+
+    def rank(self, dense=False):
+        ''' Rank of the order_by values within each partition, starting
+            at 1. Rows with equal values have equal ranks; ranks after ties
+            are skipped (as SQL RANK) unless dense (as SQL DENSE_RANK).
+        '''
+        if dense:
+            changes = np.cumsum(self._new_value)
+            first = np.maximum.accumulate(
+                np.where(self._positions == 0, changes, 0))
+            ranks = changes - first + 1
+        else:
+            positions = np.arange(len(self._order))
+            first = np.maximum.accumulate(
+                np.where(self._new_value, positions, 0))
+            ranks = self._positions[first] + 1
+        return Array.from_numpy(self._unsort(ranks))
+
+    def lag(self, name, n=1, default=None):
+        ''' The value of column `name` n rows earlier in the partition, or
+            default where there is no such row.
+        '''
+        if not is_integer(n):
+            msg = 'n must be an integer'
+            raise ValueError(msg)
+        return self._offset(name, -n, default)
+
+    def lead(self, name, n=1, default=None):
+        ''' The value of column `name` n rows later in the partition, or
+            default where there is no such row.
+        '''
+        return self._offset(name, n, default)
+
+    def _offset(self, name, n, default):
+        if not is_integer(n):
+            msg = 'n must be an integer'
+            raise ValueError(msg)
+        column = self._df[name]
+        nrow = len(self._order)
+        if n >= 0:
+            valid = self._remaining >= n
+        else:
+            valid = self._positions >= -n
+        sources = np.full(nrow, -1, dtype=np.int64)
+        sorted_positions = np.flatnonzero(valid)
+        sources[sorted_positions] = self._order[sorted_positions + n]
+        sources = self._unsort(sources)
+        if default is None:
+            return _take_or_none(column, sources)
+        dtype = column.dtype
+        if dtype is type(None):
+            dtype = type(default)
+        elif type(default) is not dtype:
+            msg = 'default must be None or of the dtype of the column'
+            raise TypeError(msg)
+        unmatched = sources < 0
+        values = column._values()[np.where(unmatched, 0, sources)]
+        values[unmatched] = default
+        return Array(_ArrayData(pd.Series(values, dtype=object), dtype))
+
+    def _cumulative(self, name, func):
+        column = self._df[name]
+        values, missing = column._to_buffers()
+        if column.dtype is type(None):
+            # No values at all
+            values = np.zeros(len(column), dtype=np.int64)
+        if func != 'count' and values.dtype.kind not in 'biuf':
+            msg = '{} requires numeric columns'.format(func)
+            raise TypeError(msg)
+        values, missing = values[self._order], missing[self._order]
+        present = pd.Series(~missing).groupby(self._segments)
+        count = present.cumsum().values.astype(np.int64)
+        if func == 'count':
+            return Array.from_numpy(self._unsort(count))
+
+        if values.dtype.kind == 'b' and func in ('sum', 'mean'):
+            values = values.astype(np.int64)
+        if func in ('sum', 'mean'):
+            values = np.where(missing, 0, values)
+            result = pd.Series(values).groupby(self._segments).cumsum().values
+            if func == 'mean':
+                with np.errstate(all='ignore'):
+                    result = result / count
+        else:
+            # Missing values are replaced by the identity of min or max
+            if values.dtype.kind == 'f':
+                fill = np.inf if func == 'min' else -np.inf
+            elif values.dtype.kind == 'b':
+                fill = func == 'min'
+            else:
+                info = np.iinfo(values.dtype)
+                fill = info.max if func == 'min' else info.min
+            values = np.where(missing, fill, values)
+            grouped = pd.Series(values).groupby(self._segments)
+            result = (grouped.cummin() if func == 'min' else
+                      grouped.cummax()).values
+            # pandas may return a C long long buffer, whose elements numpy
+            # boxes as long rather than int on Python 2
+            result = result.astype(np.int_ if values.dtype.kind == 'i'
+                                   else values.dtype)
+        # None until the first value of the partition
+        return Array.from_numpy(self._unsort(result), self._unsort(count == 0))
+
+    def cumcount(self, name):
+        ''' The number of values (not None) of column `name` up to and
+            including each row of the partition.
+        '''
+        return self._cumulative(name, 'count')
+
+    def cumsum(self, name):
+        ''' Running sum of column `name` within each partition. None(s) are
+            ignored; the sum is None until the first value.
+        '''
+        return self._cumulative(name, 'sum')
+
+    def cummean(self, name):
+        ''' Running mean of column `name` within each partition; see
+            cumsum.
+        '''
+        return self._cumulative(name, 'mean')
+
+    def cummin(self, name):
+        ''' Running minimum of column `name` within each partition; see
+            cumsum.
+        '''
+        return self._cumulative(name, 'min')
+
+    def cummax(self, name):
+        ''' Running maximum of column `name` within each partition; see
+            cumsum.
+        '''
+        return self._cumulative(name, 'max')
@@ -0,0 +1,5 @@
+from .csv import read_csv_chunks, read_csv_parallel, scan_csv, write_csv
+from .binary import read_binary, write_binary
+from .parquet import read_parquet, write_parquet
+from .jsonl import read_jsonl, write_jsonl
+from .sql import read_sql, write_sql
@@ -0,0 +1,255 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import io
+import json
+import mmap as _mmap
+import struct
+import threading
+from functools import partial
+import numpy as np
+
+from dframe.array import Array
+from dframe.array.array import _LazyArrayData
+from dframe.array.codec import encode_array, decode_array, decode_series
+from dframe.array.codec import kind_to_dtype
+from dframe.dtypes import is_string
+from dframe.dataframe import DataFrame
+from dframe.parallel import map_columns
+
+# File layout:
+#
+#   magic (8 bytes) | header length (8 bytes, little-endian) | JSON header |
+#   padding | buffers
+#
+# The data section starts at the first multiple of _ALIGNMENT after the
+# header and every buffer starts at a multiple of _ALIGNMENT within it.
+# Buffer offsets in the header are relative to the start of the data section.
+# See dframe.array.codec for how a column is encoded as buffers. Columns are
+# never pickled, so reading a file cannot run code chosen by its writer.
+
+_MAGIC = b'DFRAME\x00\x01'
+_VERSION = 1
+_ALIGNMENT = 64
+_TEXT_TYPE = type(u'')
+
+
+def _aligned(n):
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+
+def _encode_name(name):
+    # JSON stores text; remember whether the name was the native str type so
+    # that Python 2 gets back the same type of name.
+    if isinstance(name, bytes) and not isinstance(name, str):
+        msg = 'bytes column names are not supported: {}'.format(repr(name))
+        raise ValueError(msg)
+    if isinstance(name, str):
+        if str is bytes:
+            return name.decode('utf-8'), 'str'
+        return name, 'str'
+    return name, 'text'
+
+
+def _decode_name(name, name_type):
+    if name_type == 'str' and str is bytes:
+        return name.encode('utf-8')
+    return name
+
+
+def write_binary(df, path):
+    ''' Write a DataFrame to a file in the dframe binary columnar format.
+
+        Each column is stored as flat, aligned typed buffers (values, a
+        missing value mask and, for strings, offsets into a byte blob) that
+        read_binary can memory-map without parsing. Only int, float, bool,
+        string and NoneType columns can be written; other dtypes raise
+        TypeError (convert them to strings first).
+
+        Args
+        -----
+        df (DataFrame)
+        path (str): output path
+
+        Returns
+        --------
+        Nothing.
+    '''
+    _write_binary(df, path, allow_pickle=False)
+
+
+def _write_binary(df, path, allow_pickle):
+    # allow_pickle is only for files that are read back by this process or
+    # its workers (see dframe.parallel.partition)
+    assert isinstance(df, DataFrame)
+    columns = []
+    all_buffers = []
+    position = 0
+    encoded = map_columns(partial(encode_array, allow_pickle=allow_pickle),
+                          df.values())
+    for name, (kind, buffers) in zip(df.names, encoded):
+        name, name_type = _encode_name(name)
+        entries = {}
+        for buffer_name in sorted(buffers.keys()):
+            buffer = buffers[buffer_name]
+            entries[buffer_name] = [position, len(buffer), buffer.dtype.str]
+            all_buffers.append((position, buffer))
+            position = _aligned(position + buffer.nbytes)
+        columns.append({'name': name, 'name_type': name_type, 'kind': kind,
+                        'buffers': entries})
+    header = {'version': _VERSION, 'nrow': df.nrow, 'columns': columns}
+    header = json.dumps(header, sort_keys=True).encode('utf-8')
+    data_start = _aligned(len(_MAGIC) + 8 + len(header))
+
+    with io.open(path, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for offset, buffer in all_buffers:
+            f.write(b'\x00' * (data_start + offset - f.tell()))
+            f.write(buffer.tobytes())
+
+
+def _read_header(f):
+    magic = f.read(len(_MAGIC))
+    if magic != _MAGIC:
+        msg = 'not a dframe binary file'
+        raise ValueError(msg)
+    header_length, = struct.unpack('<Q', f.read(8))
+    header = json.loads(f.read(header_length).decode('utf-8'))
+    if header.get('version') != _VERSION:
+        msg = 'unsupported dframe binary format version {}'
+        raise ValueError(msg.format(header.get('version')))
+    data_start = _aligned(len(_MAGIC) + 8 + header_length)
+    return header, data_start
+
+
+def _column_buffers(source, data_start, entries):
+    buffers = {}
+    for buffer_name, (offset, count, dtype) in entries.items():
+        buffers[buffer_name] = np.frombuffer(
+            source, dtype=np.dtype(str(dtype)), count=count,
+            offset=data_start + offset)
+    return buffers
+
+
+class _MappedFile(object):
+    # The memory map of a file read by read_binary, shared by its lazy
+    # columns. It is closed once every column has been loaded; while some
+    # are not, it lives as long as they do. The reader holds it (one more
+    # pending load) until all the columns are created.
+    def __init__(self, f, ncolumns):
+        self.source = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        self._pending = ncolumns + 1
+        self._lock = threading.Lock()
+
+    def loaded(self):
+        with self._lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self.source.close()
+
+
+def _lazy_column(mapped, data_start, column, nrow):
+    dtype = kind_to_dtype(column['kind'])
+    if dtype is None:
+        # Pickled columns do not record their dtype, so load them now.
+        buffers = _column_buffers(mapped.source, data_start,
+                                  column['buffers'])
+        array = decode_array(column['kind'], buffers, nrow)
+        del buffers
+        mapped.loaded()
+        return array
+
+    def load():
+        buffers = _column_buffers(mapped.source, data_start,
+                                  column['buffers'])
+        series, _ = decode_series(column['kind'], buffers, nrow)
+        # The decoded Series does not reference the memory map
+        del buffers
+        mapped.loaded()
+        return series
+
+    # A string column whose values are all missing is stored with its string
+    # kind but has dtype NoneType.
+    if 'mask' in column['buffers'] and dtype is not type(None):
+        offset, count, mask_dtype = column['buffers']['mask']
+        mask = np.frombuffer(mapped.source, dtype=np.dtype(str(mask_dtype)),
+                             count=count, offset=data_start + offset)
+        if mask.all():
+            dtype = type(None)
+    return Array(_LazyArrayData(load, nrow, dtype))
+
+
+def read_binary(path, names=None, mmap=True):
+    ''' Read a DataFrame written by write_binary.
+
+        With mmap=True, the file is memory-mapped and only the header is
+        parsed. Each column is decoded the first time it is accessed, so
+        opening a file costs the same regardless of its size and columns
+        that are never used are never read from disk. The memory map is
+        closed once every selected column has been decoded.
+
+        Args
+        -----
+        path (str): input path
+        names (list-like of str): optional names of the columns to load, in
+            the order in which they appear in the output. By default, all
+            columns are loaded.
+        mmap (bool): memory-map the file and decode columns lazily. When
+            False, the selected columns are read and decoded immediately.
+
+        Returns
+        --------
+        DataFrame
+    '''
+    return _read_binary(path, names, mmap, allow_pickle=False)
+
+
+def _read_binary(path, names, mmap, allow_pickle):
+    # allow_pickle is only for files written by _write_binary with
+    # allow_pickle in this process or its workers
+    with io.open(path, 'rb') as f:
+        header, data_start = _read_header(f)
+        columns = header['columns']
+        nrow = header['nrow']
+        all_names = [_decode_name(column['name'], column['name_type'])
+                     for column in columns]
+        if names is None:
+            selected = list(range(len(columns)))
+        else:
+            if is_string(names):
+                names = [names]
+            names_to_index = {name: j for j, name in enumerate(all_names)}
+            selected = []
+            for name in names:
+                if name not in names_to_index:
+                    msg = 'column {} not found'.format(repr(name))
+                    raise KeyError(msg)
+                selected.append(names_to_index[name])
+        for j in selected:
+            kind = columns[j]['kind']
+            if kind_to_dtype(kind) is None and not (kind == 'pickle' and
+                                                    allow_pickle):
+                # Such as pickled columns, which could run arbitrary code
+                msg = 'unsupported column kind {}'
+                raise ValueError(msg.format(repr(kind)))
+
+        if mmap and any(len(columns[j]['buffers']) > 0 for j in selected):
+            mapped = _MappedFile(f, len(selected))
+            arrays = [_lazy_column(mapped, data_start, columns[j], nrow)
+                      for j in selected]
+            mapped.loaded()
+        else:
+            arrays = []
+            for j in selected:
+                buffers = {}
+                for buffer_name, entry in columns[j]['buffers'].items():
+                    offset, count, dtype = entry
+                    f.seek(data_start + offset)
+                    buffers[buffer_name] = np.fromfile(
+                        f, dtype=np.dtype(str(dtype)), count=count)
+                arrays.append(decode_array(columns[j]['kind'], buffers, nrow,
+                                           allow_pickle))
+    return DataFrame._from_arrays(arrays, [all_names[j] for j in selected])
@@ -0,0 +1,477 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import io
+import os
+import contextlib
+import bz2
+import zlib
+import numbers
+import warnings
+import multiprocessing
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+from dframe.compat import lzma
+from dframe.dtypes import is_integer, is_string
+from dframe.dataframe import DataFrame, LazyFrame
+
+
+def _check_read_csv_kwargs(kwargs):
+    kwargs = dict(kwargs)
+    if 'index_col' in kwargs.keys():
+        del kwargs['index_col']
+        msg = ('index_col in keyword arguments is not allowed',
+               'dframe does not have index at all')
+        warnings.warn(msg)
+    return kwargs
+
+
+def _is_int_dtype(dtype):
+    return (issubclass(dtype, numbers.Integral) and
+            not issubclass(dtype, (bool, np.bool_)))
+
+
+def _is_float_dtype(dtype):
+    return (issubclass(dtype, numbers.Real) and
+            not issubclass(dtype, numbers.Integral))
+
+
+def _conform_column(column, dtype, name):
+    # pandas infers dtypes per chunk, so an int column that has a missing
+    # value in one chunk comes back as float. Cast such columns back to the
+    # dtype established by the previous chunks; anything else is an error.
+    # NoneType (the column was entirely missing so far) is not a dtype yet:
+    # the first chunk with values sets it.
+    if (column.dtype is dtype or column.dtype is type(None) or
+            dtype is type(None)):
+        return column
+    values, missing = column._to_buffers()
+    if _is_int_dtype(dtype) and _is_float_dtype(column.dtype):
+        present = values[~missing]
+        if np.array_equal(present, np.floor(present)):
+            return Array.from_numpy(values.astype(np.int64), missing)
+    elif _is_float_dtype(dtype) and _is_int_dtype(column.dtype):
+        return Array.from_numpy(values.astype(np.float64), missing)
+    msg = ('column {} has dtype {} in this chunk but {} in previous chunks; '
+           'pass dtype to fix the column type')
+    raise ValueError(msg.format(repr(name), column.dtype.__name__,
+                                dtype.__name__))
+
+
+def read_csv_chunks(filepath_or_buffer, chunksize=100000, **kwargs):
+    ''' Read a CSV file as a sequence of DataFrame chunks. At most one chunk
+        of rows is parsed and held in memory at a time.
+
+        Every chunk has the same column names. Column dtypes are consistent
+        across chunks: an int column that has missing values in a later
+        chunk stays int, and a float column whose values happen to be whole
+        numbers in a later chunk stays float. A column whose values are of
+        a different type in a later chunk raises a ValueError; pass `dtype`
+        (as accepted by pandas.read_csv) for such columns. A chunk in which
+        a column is entirely missing has dtype NoneType for that column;
+        the first chunk with values sets the dtype for the later chunks.
+
+        Args
+        -----
+        filepath_or_buffer (str or file-like): passed to pandas.read_csv
+        chunksize (int): maximum number of rows per chunk.
+        kwargs: other keyword arguments passed to pandas.read_csv, except
+            index_col.
+
+        Returns
+        --------
+        generator of DataFrame
+    '''
+    # Arguments are checked, and the file is opened, when this is called
+    # rather than when the first chunk is requested.
+    if not is_integer(chunksize) or chunksize <= 0:
+        msg = 'chunksize must be a positive integer'
+        raise ValueError(msg)
+    kwargs = _check_read_csv_kwargs(kwargs)
+    reader = pd.read_csv(filepath_or_buffer, index_col=False,
+                         chunksize=chunksize, **kwargs)
+    return _read_csv_chunks(reader)
+
+
+def _read_csv_chunks(reader):
+    dtypes = None
+    for chunk in reader:
+        df = DataFrame.from_pandas(chunk)
+        if dtypes is None:
+            dtypes = list(df.dtypes)
+        else:
+            columns = [_conform_column(column, dtype, name)
+                       for column, dtype, name in
+                       zip(df.values(), dtypes, df.names)]
+            df = DataFrame._from_arrays(columns, df.names)
+        dtypes = [dtype if column.dtype is type(None) else column.dtype
+                  for column, dtype in zip(df.values(), dtypes)]
+        yield df
+
+
+def scan_csv(filepath_or_buffer, chunksize=100000, **kwargs):
+    ''' Start a lazy query on a CSV file; see LazyFrame. Only the header is
+        read here. When the query is collected, the file is read in chunks
+        with read_csv_chunks, only the columns that the query needs are
+        parsed, and filters that can be applied to the file's columns are
+        applied to every chunk as it is read.
+
+        Args
+        -----
+        filepath_or_buffer (str): path of the CSV file.
+        chunksize (int): number of rows parsed at a time.
+        kwargs: other keyword arguments passed to pandas.read_csv, except
+            index_col, usecols and nrows.
+
+        Returns
+        --------
+        LazyFrame
+    '''
+    kwargs = _check_read_csv_kwargs(kwargs)
+    for key in ('usecols', 'nrows', 'chunksize', 'iterator'):
+        if key in kwargs:
+            msg = '{} is not supported by scan_csv'.format(key)
+            raise ValueError(msg)
+    header = pd.read_csv(filepath_or_buffer, index_col=False, nrows=0,
+                         **kwargs)
+
+    def read(columns, nrows):
+        return read_csv_chunks(filepath_or_buffer, chunksize,
+                               usecols=columns, nrows=nrows, **kwargs)
+    label = 'csv {}'.format(repr(filepath_or_buffer))
+    return LazyFrame._scan(label, list(header.columns), read)
+
+
+_SCAN_BLOCKSIZE = 1 << 20
+_MIN_PARTSIZE = 1 << 22
+# The line boundary scan (_find_line_starts) only knows about quotechar, so
+# comment and escapechar, which change where lines and quoted fields end,
+# are rejected too.
+_PARALLEL_UNSUPPORTED_KWARGS = ('header', 'names', 'skiprows', 'skipfooter',
+                                'nrows', 'chunksize', 'iterator',
+                                'compression', 'lineterminator', 'comment',
+                                'escapechar')
+
+
+def _find_line_starts(f, start, targets, quotechar):
+    ''' For each target byte offset, find the offset of the first line that
+        starts at or after it. A newline only ends a line when it is outside a
+        quoted field; whether we are inside quotes is tracked by counting
+        quote characters from `start`, which must be the start of a line.
+        Escaped quotes ("") count twice and do not change the parity.
+    '''
+    targets = sorted(targets)
+    starts = []
+    f.seek(start)
+    offset = start
+    in_quotes = False
+    while targets:
+        block = f.read(_SCAN_BLOCKSIZE)
+        if not block:
+            break
+        pos = 0
+        while targets:
+            target = max(targets[0] - offset, pos)
+            if target >= len(block):
+                break
+            in_quotes ^= bool(block.count(quotechar, pos, target) % 2)
+            newline = block.find(b'\n', target)
+            if newline == -1:
+                pos = target
+                break
+            in_quotes ^= bool(block.count(quotechar, target, newline) % 2)
+            pos = newline + 1
+            if not in_quotes:
+                line_start = offset + pos
+                starts.append(line_start)
+                targets = [t for t in targets if t > line_start]
+        in_quotes ^= bool(block.count(quotechar, pos) % 2)
+        offset += len(block)
+    return starts
+
+
+def _parse_csv_range(args):
+    # file_names names every column of the file (a range has no header) so
+    # that usecols selects the same columns as in the header; names are the
+    # columns to return, in output order.
+    filepath, start, stop, file_names, names, kwargs = args
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    df = pd.read_csv(io.BytesIO(data), header=None, names=file_names,
+                     index_col=False, **kwargs)
+    # Send back plain numpy buffers; numeric columns pickle as raw bytes.
+    return [np.asarray(df[name]) for name in names]
+
+
+def _concatenate_parts(parts):
+    # Numeric parts are concatenated as numbers (int and float give float,
+    # as in a single pandas.read_csv call). Any other mix is concatenated as
+    # objects; Array.from_numpy raises ValueError if the types conflict.
+    if len(parts) == 0:
+        return Array([])
+    kinds = set(part.dtype.kind for part in parts)
+    if len(kinds) == 1 or kinds <= set('iuf'):
+        return Array.from_numpy(np.concatenate(parts))
+    return Array.from_numpy(
+        np.concatenate([part.astype(object) for part in parts]))
+
+
+def _text_dtype(dtype, file_names, text_names):
+    # The dtype argument of pandas.read_csv with str for text_names. A
+    # single dtype is spread over every column, so that the other columns
+    # are parsed as before.
+    if isinstance(dtype, dict):
+        dtype = dict(dtype)
+    elif dtype is None:
+        dtype = {}
+    else:
+        dtype = {name: dtype for name in file_names}
+    dtype.update({name: str for name in text_names})
+    return dtype
+
+
+def _map(func, tasks, nprocs):
+    if nprocs == 1 or len(tasks) <= 1:
+        return [func(task) for task in tasks]
+    pool = multiprocessing.Pool(min(nprocs, len(tasks)))
+    try:
+        return pool.map(func, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def read_csv_parallel(filepath, nprocs=None, partsize=None, **kwargs):
+    ''' Read a CSV file into a DataFrame using several processes.
+
+        The file is split at line boundaries into byte ranges, each range is
+        parsed by pandas in a process pool and the parsed columns are
+        concatenated in the original row order. Newlines inside quoted fields
+        are handled by tracking quotes while looking for line boundaries, so
+        finding the boundaries reads the file once sequentially.
+
+        The first line must be the header. Column dtypes follow the same rules
+        as a single pandas.read_csv call: a column that is int in one range
+        and float in another is float. A column that parses as text in some
+        ranges and as numbers in others is parsed as text everywhere.
+
+        Args
+        -----
+        filepath (str): path of an uncompressed CSV file.
+        nprocs (int): number of processes; defaults to the number of CPUs.
+        partsize (int): approximate number of bytes per range. By default,
+            the file is split into one range per process, but ranges are at
+            least 4 MiB.
+        kwargs: other keyword arguments passed to pandas.read_csv, except
+            index_col, header, names, skiprows, skipfooter, nrows, chunksize,
+            iterator, compression, lineterminator, comment and escapechar.
+
+        Returns
+        --------
+        DataFrame
+    '''
+    kwargs = _check_read_csv_kwargs(kwargs)
+    for key in _PARALLEL_UNSUPPORTED_KWARGS:
+        if key in kwargs:
+            msg = '{} is not supported by read_csv_parallel'.format(key)
+            raise ValueError(msg)
+    if nprocs is None:
+        nprocs = multiprocessing.cpu_count()
+    if not is_integer(nprocs) or nprocs <= 0:
+        msg = 'nprocs must be a positive integer'
+        raise ValueError(msg)
+    quotechar = kwargs.get('quotechar', '"').encode('ascii')
+
+    size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as f:
+        header_end = (_find_line_starts(f, 0, [0], quotechar) or [size])[0]
+        f.seek(0)
+        header = f.read(header_end)
+        # The output columns and their order, as pandas.read_csv gives them
+        names = list(pd.read_csv(io.BytesIO(header), nrows=0,
+                                 index_col=False, **kwargs).columns)
+        header_kwargs = dict(kwargs)
+        header_kwargs.pop('usecols', None)
+        file_names = list(pd.read_csv(io.BytesIO(header), nrows=0,
+                                      index_col=False,
+                                      **header_kwargs).columns)
+        if partsize is None:
+            partsize = max(-(-(size - header_end) // nprocs), _MIN_PARTSIZE)
+        if not is_integer(partsize) or partsize <= 0:
+            msg = 'partsize must be a positive integer'
+            raise ValueError(msg)
+        targets = range(header_end + partsize, size, partsize)
+        starts = _find_line_starts(f, header_end, targets, quotechar)
+    bounds = [header_end] + [s for s in starts if s < size] + [size]
+    ranges = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])
+              if stop > start]
+
+    tasks = [(filepath, start, stop, file_names, names, kwargs)
+             for start, stop in ranges]
+    parts = _map(_parse_csv_range, tasks, nprocs)
+
+    columns = []
+    text = []
+    for j in range(len(names)):
+        try:
+            columns.append(_concatenate_parts([part[j] for part in parts]))
+        except ValueError:
+            text.append(j)
+            columns.append(None)
+
+    # Columns that are text in some ranges and numbers in others are parsed
+    # again as text in the ranges where they were not text.
+    if text:
+        dtype = _text_dtype(kwargs.get('dtype'), file_names,
+                            [names[j] for j in text])
+        redo = [i for i, part in enumerate(parts)
+                if any(part[j].dtype.kind != 'O' for j in text)]
+        retasks = [(filepath, ranges[i][0], ranges[i][1], file_names, names,
+                    dict(kwargs, dtype=dtype)) for i in redo]
+        for i, part in zip(redo, _map(_parse_csv_range, retasks, nprocs)):
+            parts[i] = part
+        for j in text:
+            columns[j] = _concatenate_parts([part[j] for part in parts])
+    return DataFrame._from_arrays(columns, names)
+
+
+_COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+
+def _get_compressor(compression, path_or_buffer):
+    if compression == 'infer':
+        compression = None
+        if is_string(path_or_buffer):
+            extension = os.path.splitext(path_or_buffer)[1]
+            compression = _COMPRESSION_EXTENSIONS.get(extension)
+    if compression is None:
+        return None
+    elif compression == 'gzip':
+        # wbits = 16 + 15 writes a gzip header and trailer
+        return zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED,
+                                16 + zlib.MAX_WBITS)
+    elif compression == 'bz2':
+        return bz2.BZ2Compressor()
+    elif compression == 'xz':
+        if lzma is None:
+            msg = 'xz compression requires the lzma module'
+            raise ValueError(msg)
+        return lzma.LZMACompressor()
+    else:
+        msg = 'compression must be one of infer, gzip, bz2, xz, or None'
+        raise ValueError(msg)
+
+
+@contextlib.contextmanager
+def _open_writer(path_or_buffer, compression, encoding):
+    # Yields a function that writes text (or already encoded bytes) to a path
+    # or stream, encoding and compressing it as needed.
+    compressor = _get_compressor(compression, path_or_buffer)
+    if is_string(path_or_buffer):
+        f = io.open(path_or_buffer, 'wb')
+        close = True
+    else:
+        f = path_or_buffer
+        close = False
+    try:
+        # Text streams receive text; everything else receives encoded bytes.
+        text_stream = isinstance(f, io.TextIOBase)
+        if text_stream and (compressor is not None):
+            msg = 'compression requires a path or a binary buffer'
+            raise ValueError(msg)
+
+        def write(text):
+            if text_stream:
+                if isinstance(text, bytes):
+                    text = text.decode(encoding)
+                f.write(text)
+            else:
+                data = (text if isinstance(text, bytes)
+                        else text.encode(encoding))
+                if compressor is not None:
+                    data = compressor.compress(data)
+                if data:
+                    f.write(data)
+
+        yield write
+        if (compressor is not None) and not text_stream:
+            f.write(compressor.flush())
+    finally:
+        if close:
+            f.close()
+
+
+def _native_str(value, encoding):
+    # Text in the native str type: bytes on Python 2 and unicode on Python 3,
+    # so the common string type is never converted.
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, bytes):
+        return value.decode(encoding)
+    elif is_string(value):
+        return value.encode(encoding)
+    else:
+        return str(value)
+
+
+def _quote(text, sep, quotechar):
+    if sep in text or quotechar in text or '\n' in text or '\r' in text:
+        return quotechar + text.replace(quotechar, quotechar * 2) + quotechar
+    return text
+
+
+def _format_column(column, start, stop, na_rep, sep, quotechar, encoding):
+    # Returns the CSV cells of column[start:stop] as a list of native str.
+    values, missing = column._to_buffers(start, stop)
+    if column.dtype is type(None):
+        return [na_rep] * len(values)
+    elif values.dtype.kind == 'f':
+        cells = list(map(repr, values.tolist()))
+    elif values.dtype.kind in 'biu':
+        cells = list(map(str, values.tolist()))
+    elif column.dtype is str:
+        cells = values.tolist()
+    else:
+        cells = [None if value is None else _native_str(value, encoding)
+                 for value in values]
+    present = [cell for cell in cells if cell is not None]
+    # Check the whole chunk at once; most cells need no quoting. Numbers
+    # are checked too, since sep may be '.' or 'e'.
+    joined = ''.join(present)
+    if any(c in joined for c in (sep, quotechar, '\n', '\r')):
+        cells = [None if cell is None else _quote(cell, sep, quotechar)
+                 for cell in cells]
+    if missing.any():
+        for i in np.flatnonzero(missing):
+            cells[i] = na_rep
+    return cells
+
+
+def write_csv(df, path_or_buffer, chunksize=100000, sep=',', na_rep='',
+              header=True, compression='infer', encoding='utf-8',
+              line_terminator='\n', quotechar='"'):
+    ''' Write a DataFrame as CSV; see DataFrame.to_csv. '''
+    if not is_integer(chunksize) or chunksize <= 0:
+        msg = 'chunksize must be a positive integer'
+        raise ValueError(msg)
+    sep, na_rep, line_terminator, quotechar = [
+        _native_str(text, encoding)
+        for text in (sep, na_rep, line_terminator, quotechar)]
+    with _open_writer(path_or_buffer, compression, encoding) as write:
+        if df.ncol > 0:
+            if header:
+                names = [_quote(_native_str(name, encoding), sep, quotechar)
+                         for name in df.names]
+                write(sep.join(names) + line_terminator)
+            columns = df.values()
+            for start in range(0, df.nrow, chunksize):
+                stop = min(start + chunksize, df.nrow)
+                cells = [_format_column(column, start, stop, na_rep, sep,
+                                        quotechar, encoding)
+                         for column in columns]
+                lines = [sep.join(row) for row in zip(*cells)]
+                write(line_terminator.join(lines) + line_terminator)
@@ -0,0 +1,218 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import io
+import os
+import bz2
+import gzip
+import json
+import contextlib
+import numpy as np
+from collections import OrderedDict
+
+from dframe.compat import lzma, native_str
+from dframe.dtypes import is_integer, is_string
+from dframe.dataframe import DataFrameBuilder
+from dframe.io.csv import _COMPRESSION_EXTENSIONS, _open_writer
+
+_BATCHSIZE = 100000
+
+
+def _native_pairs(pairs):
+    return OrderedDict((native_str(key), native_str(value))
+                       for key, value in pairs)
+
+
+if str is bytes:
+    _json_loads_kwargs = {'object_pairs_hook': _native_pairs}
+else:
+    _json_loads_kwargs = {}
+
+
+@contextlib.contextmanager
+def _open_reader(path_or_buffer, compression):
+    if compression == 'infer':
+        compression = None
+        if is_string(path_or_buffer):
+            extension = os.path.splitext(path_or_buffer)[1]
+            compression = _COMPRESSION_EXTENSIONS.get(extension)
+    if not is_string(path_or_buffer):
+        if compression is not None:
+            msg = 'compression requires a path'
+            raise ValueError(msg)
+        yield path_or_buffer
+        return
+    if compression is None:
+        f = io.open(path_or_buffer, 'rb')
+    elif compression == 'gzip':
+        f = gzip.open(path_or_buffer, 'rb')
+    elif compression == 'bz2':
+        f = bz2.BZ2File(path_or_buffer, 'rb')
+    elif compression == 'xz':
+        if lzma is None:
+            msg = 'xz compression requires the lzma module'
+            raise ValueError(msg)
+        f = lzma.open(path_or_buffer, 'rb')
+    else:
+        msg = 'compression must be one of infer, gzip, bz2, xz, or None'
+        raise ValueError(msg)
+    try:
+        yield f
+    finally:
+        f.close()
+
+
+def _parse_lines(lines, line_numbers):
+    # All lines of a batch are parsed by one json.loads call. A line that is
+    # not a single JSON value (such as '{"a": 1}, {"a": 2}' or half of a
+    # record) can still make a valid batch, so the number of records is
+    # checked against the number of lines.
+    try:
+        records = json.loads('[' + ','.join(lines) + ']',
+                             **_json_loads_kwargs)
+    except ValueError:
+        records = None
+    if records is None or len(records) != len(lines):
+        # Parse line by line to report the offending line
+        records = []
+        for line, line_number in zip(lines, line_numbers):
+            try:
+                records.append(json.loads(line, **_json_loads_kwargs))
+            except ValueError as e:
+                msg = 'invalid JSON on line {}: {}'
+                raise ValueError(msg.format(line_number, e))
+    for record, line_number in zip(records, line_numbers):
+        if not isinstance(record, dict):
+            msg = 'line {} is not a JSON object'
+            raise ValueError(msg.format(line_number))
+    return records
+
+
+def _iter_record_batches(f, batchsize, encoding):
+    # Yields lists of at most batchsize parsed records; blank lines are
+    # skipped.
+    lines = []
+    line_numbers = []
+    line_number = 0
+    for line in f:
+        line_number += 1
+        if isinstance(line, bytes) and (str is not bytes):
+            line = line.decode(encoding)
+        if not line.strip():
+            continue
+        lines.append(line)
+        line_numbers.append(line_number)
+        if len(lines) == batchsize:
+            yield _parse_lines(lines, line_numbers)
+            lines = []
+            line_numbers = []
+    if len(lines) > 0:
+        yield _parse_lines(lines, line_numbers)
+
+
+def _append_records(builder, records, names):
+    if names is None:
+        builder.extend(records)
+    else:
+        # Keys that are not selected are ignored
+        builder.extend([[record.get(name) for name in names]
+                        for record in records])
+
+
+def _read_jsonl_chunks(path_or_buffer, chunksize, names, compression,
+                       encoding):
+    builder = DataFrameBuilder(names)
+    with _open_reader(path_or_buffer, compression) as f:
+        for records in _iter_record_batches(f, chunksize, encoding):
+            _append_records(builder, records, names)
+            yield builder.build()
+
+
+def read_jsonl(path_or_buffer, chunksize=None, names=None,
+               compression='infer', encoding='utf-8'):
+    ''' Read a JSON Lines file, one JSON object per line, into a DataFrame.
+
+        Lines are parsed in batches and records are appended directly into
+        typed column buffers (see DataFrameBuilder), so the records are never
+        held in memory as one list of rows. With chunksize, only one chunk of
+        records is held in memory at a time.
+
+        Columns are created in the order in which keys are first seen and
+        keep their position in every later chunk. Records that do not have a
+        key get a missing value (None) for that column. A key first seen in
+        a later chunk adds a column to that chunk and every chunk after it.
+        A column whose values are of a different type in a later chunk
+        raises a ValueError.
+
+        Args
+        -----
+        path_or_buffer (str or file-like): input path, or a stream of lines
+        chunksize (int): when given, return a generator of DataFrame chunks
+            with at most this many rows each.
+        names (list-like of str): optional column names to read. Other keys
+            are ignored and records that do not have a key get None.
+        compression (str): 'gzip', 'bz2', 'xz', None, or 'infer' to choose
+            from the extension (.gz, .bz2, .xz) of a path.
+        encoding (str): encoding of the input bytes.
+
+        Returns
+        --------
+        DataFrame, or generator of DataFrame
+    '''
+    if names is not None:
+        names = [names] if is_string(names) else list(names)
+    if chunksize is not None:
+        if not is_integer(chunksize) or chunksize <= 0:
+            msg = 'chunksize must be a positive integer'
+            raise ValueError(msg)
+        return _read_jsonl_chunks(path_or_buffer, chunksize, names,
+                                  compression, encoding)
+    builder = DataFrameBuilder(names)
+    with _open_reader(path_or_buffer, compression) as f:
+        for records in _iter_record_batches(f, _BATCHSIZE, encoding):
+            _append_records(builder, records, names)
+    return builder.build()
+
+
+def _format_json_column(column, start, stop):
+    # Returns the JSON text of each value of column[start:stop]
+    values, missing = column._to_buffers(start, stop)
+    kind = values.dtype.kind
+    if column.dtype is type(None):
+        return ['null'] * len(values)
+    elif kind == 'i':
+        cells = list(map(str, values.tolist()))
+    elif kind == 'b':
+        cells = np.where(values, 'true', 'false').tolist()
+    else:
+        # Missing floats are NaN in values; they are replaced below.
+        cells = [json.dumps(value) for value in values.tolist()]
+    for i in np.flatnonzero(missing):
+        cells[i] = 'null'
+    return cells
+
+
+def write_jsonl(df, path_or_buffer, chunksize=100000, compression='infer',
+                encoding='utf-8'):
+    ''' Write a DataFrame as JSON Lines; see DataFrame.to_jsonl. '''
+    if not is_integer(chunksize) or chunksize <= 0:
+        msg = 'chunksize must be a positive integer'
+        raise ValueError(msg)
+    if df.ncol == 0:
+        template = '{}'
+    else:
+        # One %s per column; '%' in names is escaped for the % operator.
+        keys = [json.dumps(name).replace('%', '%%') for name in df.names]
+        template = '{' + ', '.join(key + ': %s' for key in keys) + '}'
+    columns = df.values()
+    with _open_writer(path_or_buffer, compression, encoding) as write:
+        for start in range(0, df.nrow, chunksize):
+            stop = min(start + chunksize, df.nrow)
+            if df.ncol == 0:
+                lines = [template] * (stop - start)
+            else:
+                cells = [_format_json_column(column, start, stop)
+                         for column in columns]
+                lines = [template % row for row in zip(*cells)]
+            write('\n'.join(lines) + '\n')
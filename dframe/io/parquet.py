@@ -0,0 +1,282 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import operator
+import numpy as np
+import pandas as pd
+
+from dframe.array import Array
+from dframe.compat import native_str
+from dframe.dtypes import is_string
+from dframe.dataframe import DataFrame
+
+_OPERATORS = {'==': operator.eq, '!=': operator.ne,
+              '<': operator.lt, '<=': operator.le,
+              '>': operator.gt, '>=': operator.ge}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        msg = 'reading and writing Parquet files requires pyarrow'
+        raise ImportError(msg)
+    return pyarrow, pyarrow.parquet
+
+
+def _to_arrow(pa, array):
+    values, missing = array._to_buffers()
+    kind = values.dtype.kind
+    if array.dtype is type(None):
+        return pa.array([None] * len(array), type=pa.null())
+    elif kind in 'ifb':
+        return pa.array(values, mask=missing)
+    elif array.dtype is str or array.dtype is type(u''):
+        return pa.array(values, type=pa.string())
+    elif array.dtype is bytes:
+        return pa.array(values, type=pa.binary())
+    else:
+        msg = 'cannot write a column of type {} to Parquet'
+        raise ValueError(msg.format(array.dtype.__name__))
+
+
+def write_parquet(df, path, row_group_size=None, compression='snappy'):
+    ''' Write a DataFrame to a Parquet file using pyarrow.
+
+        Each column is converted from its typed buffers (see
+        Array._to_buffers) straight into an Arrow array. Strings are stored
+        as UTF-8 and bytes as binary. Columns of other types cannot be
+        written.
+
+        Args
+        -----
+        df (DataFrame)
+        path (str): output path
+        row_group_size (int): maximum number of rows per row group. Smaller
+            row groups let read_parquet skip more data with filters.
+        compression (str): Parquet compression codec, or None.
+
+        Returns
+        --------
+        Nothing.
+    '''
+    assert isinstance(df, DataFrame)
+    pa, pq = _import_pyarrow()
+    arrays = [_to_arrow(pa, column) for column in df.values()]
+    table = pa.Table.from_arrays(arrays, names=[str(name)
+                                               for name in df.names])
+    pq.write_table(table, path, row_group_size=row_group_size,
+                   compression=compression)
+
+
+def _check_filters(filters):
+    if filters is None:
+        return []
+    checked = []
+    for predicate in filters:
+        if len(predicate) != 3:
+            msg = 'filters must be (name, op, value) tuples'
+            raise ValueError(msg)
+        name, op, value = predicate
+        if op not in _OPERATORS and op not in ('in', 'not in'):
+            msg = 'unsupported filter operator {}'.format(repr(op))
+            raise ValueError(msg)
+        if op in ('in', 'not in'):
+            value = list(value)
+        checked.append((name, op, value))
+    return checked
+
+
+def _may_match(op, value, statistics, num_rows):
+    # Returns False only if the min/max statistics of a row group prove that
+    # no row of the row group satisfies the predicate.
+    if statistics is None:
+        return True
+    if (getattr(statistics, 'has_null_count', True) and
+            statistics.null_count == num_rows):
+        # Missing values never satisfy a predicate
+        return False
+    if not statistics.has_min_max:
+        return True
+    # Python 2 pyarrow gives string statistics as unicode; filter values
+    # are native str, like the values that read_parquet returns
+    low, high = native_str(statistics.min), native_str(statistics.max)
+    try:
+        if op == '==':
+            return low <= value <= high
+        elif op == '!=':
+            return not (low == high == value)
+        elif op == '<':
+            return low < value
+        elif op == '<=':
+            return low <= value
+        elif op == '>':
+            return high > value
+        elif op == '>=':
+            return high >= value
+        elif op == 'in':
+            return any(low <= v <= high for v in value)
+        else:
+            return not (low == high and low in value)
+    except (TypeError, UnicodeError):
+        return True
+
+
+def _unpack_validity(buffer, offset, length):
+    # Arrow validity bitmaps are little-endian bit order; True is valid.
+    bits = np.frombuffer(buffer, dtype=np.uint8)
+    bits = (bits[:, None] >> np.arange(8, dtype=np.uint8)) & 1
+    return bits.ravel()[offset:offset + length].astype(bool)
+
+
+def _chunk_to_numpy(pa, chunk):
+    # Returns (values, missing) numpy arrays for one Arrow array.
+    n = len(chunk)
+    if pa.types.is_null(chunk.type):
+        return np.full(n, None, dtype=object), np.ones(n, dtype=bool)
+    elif chunk.null_count == 0 and (pa.types.is_integer(chunk.type) or
+                                    pa.types.is_floating(chunk.type) or
+                                    pa.types.is_boolean(chunk.type)):
+        return np.asarray(chunk.to_pandas()), np.zeros(n, dtype=bool)
+    elif pa.types.is_integer(chunk.type):
+        # Read the data buffer directly: converting through pandas would
+        # give floats, which cannot represent every 64-bit integer.
+        validity, data = chunk.buffers()[:2]
+        values = np.frombuffer(data, dtype=chunk.type.to_pandas_dtype())
+        values = values[chunk.offset:chunk.offset + n]
+        return values, ~_unpack_validity(validity, chunk.offset, n)
+    elif pa.types.is_floating(chunk.type):
+        values = np.asarray(chunk.to_pandas())
+        return values, np.isnan(values)
+    elif pa.types.is_timestamp(chunk.type) or pa.types.is_date(chunk.type):
+        # Python datetime and date objects. The pandas conversion may give
+        # datetime64 values in a read-only buffer, so box them explicitly
+        # into a new array.
+        values = pd.Series(chunk.to_pandas())
+        if values.dtype.kind == 'M':
+            values = (values.dt.to_pydatetime()
+                      if pa.types.is_timestamp(chunk.type)
+                      else values.dt.date.values)
+        values = np.array(values, dtype=object)
+        missing = pd.isnull(values)
+        values[missing] = None
+        return values, missing
+    values = np.asarray(chunk.to_pandas(), dtype=object)
+    missing = pd.isnull(values)
+    if pa.types.is_string(chunk.type) and str is bytes:
+        # Python 2 reads UTF-8 strings as unicode; use the native str type
+        # as the rest of dframe does.
+        values = np.array([None if value is None else value.encode('utf-8')
+                           for value in values], dtype=object)
+    return values, missing
+
+
+def _column_to_numpy(pa, column):
+    # column is an Arrow ChunkedArray (or Column in older pyarrow)
+    chunks = column.chunks if hasattr(column, 'chunks') else column.data.chunks
+    buffers = [_chunk_to_numpy(pa, chunk) for chunk in chunks]
+    if len(buffers) == 0:
+        return np.array([], dtype=object), np.array([], dtype=bool)
+    elif len(buffers) == 1:
+        return buffers[0]
+    values = [values for values, _ in buffers]
+    if len(set(v.dtype for v in values)) > 1:
+        values = [v.astype(object) for v in values]
+    return (np.concatenate(values),
+            np.concatenate([missing for _, missing in buffers]))
+
+
+def _evaluate(op, value, values, missing):
+    # Returns a bool array that is True where the predicate is satisfied.
+    # Missing values never satisfy a predicate.
+    result = np.zeros(len(values), dtype=bool)
+    present = ~missing
+    if op in ('in', 'not in'):
+        isin = pd.Series(values[present]).isin(value).values
+        result[present] = isin if op == 'in' else ~isin
+    else:
+        result[present] = np.asarray(
+            _OPERATORS[op](values[present], value), dtype=bool)
+    return result
+
+
+def read_parquet(path, names=None, filters=None):
+    ''' Read a Parquet file into a DataFrame using pyarrow.
+
+        Only the selected columns are read. Filters are applied in two
+        steps: row groups whose min/max statistics show that no row can
+        match are skipped without being read, and the rows of the remaining
+        row groups are then filtered exactly. Arrow buffers are converted
+        straight into typed columns without going through pandas objects
+        for numeric columns.
+
+        Args
+        -----
+        path (str): input path
+        names (list-like of str): optional names of the columns to read, in
+            the order in which they appear in the output. By default, all
+            columns are read.
+        filters (list of tuple): optional predicates (name, op, value), all
+            of which must be satisfied by a row. op is one of '==', '!=',
+            '<', '<=', '>', '>=', 'in', 'not in'. Rows with a missing value
+            in a filtered column never satisfy the filter.
+
+        Returns
+        --------
+        DataFrame
+    '''
+    pa, pq = _import_pyarrow()
+    parquet_file = pq.ParquetFile(path)
+    all_names = list(parquet_file.schema.names)
+    if names is None:
+        names = all_names
+    elif is_string(names):
+        names = [names]
+    filters = _check_filters(filters)
+    for name in list(names) + [name for name, _, _ in filters]:
+        if name not in all_names:
+            msg = 'column {} not found'.format(repr(name))
+            raise KeyError(msg)
+    names = list(names)
+    read_names = names + [name for name, _, _ in filters
+                          if name not in names]
+    read_names = [name for name in all_names if name in set(read_names)]
+
+    metadata = parquet_file.metadata
+    chunks = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        statistics = {}
+        for k in range(row_group.num_columns):
+            chunk = row_group.column(k)
+            statistics[chunk.path_in_schema] = (
+                chunk.statistics if chunk.is_stats_set else None)
+        if not all(_may_match(op, value, statistics.get(name),
+                              row_group.num_rows)
+                   for name, op, value in filters):
+            continue
+        table = parquet_file.read_row_group(i, columns=read_names)
+        columns = {name: _column_to_numpy(pa, table.column(k))
+                   for k, name in enumerate(table.schema.names)}
+        if len(filters) > 0:
+            keep = np.ones(table.num_rows, dtype=bool)
+            for name, op, value in filters:
+                keep &= _evaluate(op, value, *columns[name])
+            columns = {name: (values[keep], missing[keep])
+                       for name, (values, missing) in columns.items()}
+        chunks.append(columns)
+
+    arrays = []
+    for name in names:
+        values = [chunk[name][0] for chunk in chunks]
+        missing = [chunk[name][1] for chunk in chunks]
+        if len(values) == 0:
+            arrays.append(Array())
+            continue
+        if len(set(v.dtype for v in values)) > 1:
+            values = [v.astype(object) for v in values]
+        arrays.append(Array.from_numpy(np.concatenate(values),
+                                       np.concatenate(missing)))
+    return DataFrame._from_arrays(arrays, names)
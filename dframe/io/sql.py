@@ -0,0 +1,243 @@
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import sys
+import numpy as np
+
+from dframe.compat import native_str
+from dframe.dtypes import is_integer, is_string
+from dframe.dataframe import DataFrame, DataFrameBuilder
+
+_FETCHSIZE = 10000
+
+_SQLITE_MODULES = ('sqlite3', 'pysqlite2')
+
+_SQL_TYPES = [(bool, 'BOOLEAN'), (int, 'INTEGER'), (float, 'REAL'),
+              (str, 'TEXT'), (type(u''), 'TEXT'), (bytes, 'BLOB')]
+
+
+def _fetch_batches(connection, query, params, batchsize):
+    # Yields (names, rows) for each fetchmany batch of the query result.
+    cursor = connection.cursor()
+    try:
+        if params is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, params)
+        if cursor.description is None:
+            msg = 'query did not return rows'
+            raise ValueError(msg)
+        names = [native_str(column[0]) for column in cursor.description]
+        yield names, []
+        while True:
+            rows = cursor.fetchmany(batchsize)
+            if not rows:
+                break
+            if str is bytes:
+                # Python 2 drivers return text as unicode
+                rows = [[native_str(value) for value in row] for row in rows]
+            yield names, rows
+    finally:
+        cursor.close()
+
+
+def _read_sql_chunks(query, connection, params, chunksize):
+    builder = None
+    for names, rows in _fetch_batches(connection, query, params, chunksize):
+        if builder is None:
+            builder = DataFrameBuilder(names)
+            continue
+        builder.extend(rows)
+        yield builder.build()
+
+
+def read_sql(query, connection, params=None, chunksize=None):
+    ''' Read the result of a SQL query into a DataFrame using a DB-API 2.0
+        connection, for example from the sqlite3 module.
+
+        Rows are fetched in batches with cursor.fetchmany and appended
+        directly into typed column buffers (see DataFrameBuilder). With
+        chunksize, only one chunk of rows is held in memory at a time.
+
+        Args
+        -----
+        query (str): SQL query
+        connection: DB-API 2.0 connection
+        params (sequence or dict): optional query parameters, in the
+            paramstyle of the driver
+        chunksize (int): when given, return a generator of DataFrame chunks
+            with at most this many rows each.
+
+        Returns
+        --------
+        DataFrame, or generator of DataFrame
+    '''
+    if chunksize is not None:
+        if not is_integer(chunksize) or chunksize <= 0:
+            msg = 'chunksize must be a positive integer'
+            raise ValueError(msg)
+        return _read_sql_chunks(query, connection, params, chunksize)
+    builder = None
+    for names, rows in _fetch_batches(connection, query, params, _FETCHSIZE):
+        if builder is None:
+            builder = DataFrameBuilder(names)
+        builder.extend(rows)
+    return builder.build()
+
+
+def _driver_attribute(connection, attribute):
+    # Module globals such as paramstyle are defined by the driver module,
+    # not the connection
+    module = type(connection).__module__
+    for name in [module, module.split('.')[0]]:
+        value = getattr(sys.modules.get(name), attribute, None)
+        if value is not None:
+            return value
+    return None
+
+
+def _paramstyle(connection):
+    paramstyle = _driver_attribute(connection, 'paramstyle')
+    return 'qmark' if paramstyle is None else paramstyle
+
+
+def _driver_error(connection):
+    # The base class of the driver's exceptions; DB-API drivers usually
+    # also expose it as an attribute of the connection.
+    error = getattr(connection, 'Error', None)
+    if error is None:
+        error = _driver_attribute(connection, 'Error')
+    if isinstance(error, type) and issubclass(error, Exception):
+        return error
+    return Exception
+
+
+def _placeholders(paramstyle, ncol):
+    if paramstyle == 'qmark':
+        return ['?'] * ncol
+    elif paramstyle == 'numeric':
+        return [':{}'.format(j + 1) for j in range(ncol)]
+    elif paramstyle == 'named':
+        return [':p{}'.format(j) for j in range(ncol)]
+    elif paramstyle in ('format', 'pyformat'):
+        return ['%s'] * ncol
+    else:
+        msg = 'unsupported paramstyle {}'.format(repr(paramstyle))
+        raise ValueError(msg)
+
+
+def _quote_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_type(dtype, name):
+    if dtype is type(None):
+        # Nothing to go by; TEXT accepts any value in SQLite
+        return 'TEXT'
+    for python_type, sql_type in _SQL_TYPES:
+        if issubclass(dtype, python_type):
+            return sql_type
+    if issubclass(dtype, np.integer):
+        return 'INTEGER'
+    elif issubclass(dtype, np.floating):
+        return 'REAL'
+    msg = 'cannot write column {} of type {} to SQL'
+    raise ValueError(msg.format(repr(name), dtype.__name__))
+
+
+def _column_params(column, start, stop):
+    # Python values of column[start:stop] with None for missing values.
+    # tolist() turns numpy scalars into Python int, float and bool, which
+    # every driver can bind.
+    values, missing = column._to_buffers(start, stop)
+    params = values.tolist()
+    if values.dtype.kind != 'O':
+        for i in np.flatnonzero(missing):
+            params[i] = None
+    return params
+
+
+def _table_exists(connection, cursor, table):
+    # DB-API has no portable catalog query, so probe the table. A failed
+    # statement aborts the transaction on some databases (such as
+    # PostgreSQL), so there the probe runs in a savepoint and only the
+    # savepoint is rolled back; the changes already made in the transaction
+    # are kept. SQLite does not abort the transaction, and its Python 2
+    # module commits around savepoints, so it gets the bare probe.
+    error = _driver_error(connection)
+    savepoint = error.__module__.split('.')[0] not in _SQLITE_MODULES
+    if savepoint:
+        try:
+            cursor.execute('SAVEPOINT dframe_probe')
+        except error:
+            # No savepoints either
+            savepoint = False
+    try:
+        cursor.execute('SELECT * FROM {} WHERE 1 = 0'.format(
+            _quote_identifier(table)))
+        cursor.fetchall()
+        exists = True
+    except error:
+        exists = False
+        if savepoint:
+            cursor.execute('ROLLBACK TO SAVEPOINT dframe_probe')
+    if savepoint:
+        cursor.execute('RELEASE SAVEPOINT dframe_probe')
+    return exists
+
+
+def write_sql(df, table, connection, if_exists='fail', batchsize=10000):
+    ''' Write a DataFrame to a SQL table; see DataFrame.to_sql. '''
+    if if_exists not in ('fail', 'replace', 'append'):
+        msg = "if_exists must be one of 'fail', 'replace' or 'append'"
+        raise ValueError(msg)
+    if not is_integer(batchsize) or batchsize <= 0:
+        msg = 'batchsize must be a positive integer'
+        raise ValueError(msg)
+    if not is_string(table):
+        msg = 'table name must be a string'
+        raise ValueError(msg)
+    if df.ncol == 0:
+        msg = 'cannot write a DataFrame without columns to SQL'
+        raise ValueError(msg)
+    names = [native_str(name) for name in df.names]
+    columns = df.values()
+    types = [_sql_type(column.dtype, name)
+             for column, name in zip(columns, names)]
+    placeholders = _placeholders(_paramstyle(connection), df.ncol)
+    named = placeholders[0].startswith(':p')
+    insert = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        _quote_identifier(table),
+        ', '.join(_quote_identifier(name) for name in names),
+        ', '.join(placeholders))
+
+    cursor = connection.cursor()
+    try:
+        exists = _table_exists(connection, cursor, table)
+        if exists and if_exists == 'fail':
+            msg = 'table {} already exists'.format(repr(table))
+            raise ValueError(msg)
+        if exists and if_exists == 'replace':
+            cursor.execute('DROP TABLE {}'.format(_quote_identifier(table)))
+        if not exists or if_exists == 'replace':
+            cursor.execute('CREATE TABLE {} ({})'.format(
+                _quote_identifier(table),
+                ', '.join('{} {}'.format(_quote_identifier(name), sql_type)
+                          for name, sql_type in zip(names, types))))
+        # All batches are inserted in one transaction
+        for start in range(0, df.nrow, batchsize):
+            stop = min(start + batchsize, df.nrow)
+            params = [_column_params(column, start, stop)
+                      for column in columns]
+            rows = list(zip(*params))
+            if named:
+                keys = [placeholder[1:] for placeholder in placeholders]
+                rows = [dict(zip(keys, row)) for row in rows]
+            cursor.executemany(insert, rows)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
@@ -0,0 +1,2 @@
+from .memory import (set_memory_budget, get_memory_budget, memory_stats,
+                     reset_memory_stats)
@@ -0,0 +1,232 @@
+from __future__ import absolute_import
+from __future__ import division
+
+import os
+import sys
+import mmap
+import tempfile
+import weakref
+import threading
+from collections import OrderedDict
+import numpy as np
+
+from dframe.dtypes import is_integer
+
+# A process-wide memory budget for the data of Arrays. While a budget is set,
+# every Array whose data is accessed is tracked, in least recently used
+# order, with the bytes held by its data. When the tracked bytes exceed the
+# budget, the least recently used Arrays are spilled: their data is written
+# to a temporary file as the typed buffers of dframe.array.codec, the file is
+# memory-mapped and the data is released. A spilled Array loads (faults) its
+# data back from the memory map the next time the data is needed, like any
+# other lazy Array, so spilling is invisible to the Array and DataFrame APIs.
+#
+# Only Arrays of int, float, bool and string dtypes are tracked. Arrays that
+# share data (copy-on-write) count the data once; it is freed when all of
+# them have been spilled.
+
+_SPILLABLE = (int, float, bool, str, type(u''), bytes)
+_ALIGNMENT = 8
+_SAMPLE_SIZE = 100
+
+enabled = False
+_budget = None
+_directory = None
+_lock = threading.RLock()
+_spilling = False
+# id(array) -> (weak reference to the array, id of its data), least recently
+# used first
+_arrays = OrderedDict()
+# id(data) -> [bytes, number of tracked arrays that hold the data]
+_held = {}
+_nbytes = 0
+_stats = {'spills': 0, 'faults': 0, 'spilled_bytes': 0}
+
+
+def set_memory_budget(nbytes, directory=None):
+    ''' Limit the bytes held by the data of Arrays. Over the budget, the
+        least recently used Arrays are spilled to memory-mapped temporary
+        files and loaded back when they are next used.
+
+        Args
+        -----
+        nbytes (int): the budget in bytes; None removes the budget and stops
+            tracking Arrays (Arrays that are spilled stay spilled until
+            they are used).
+        directory (str): where the temporary files are created; defaults to
+            the directory of tempfile.gettempdir(). The files are removed
+            as soon as they are mapped.
+    '''
+    global enabled, _budget, _directory, _nbytes
+    if nbytes is not None and (not is_integer(nbytes) or nbytes < 0):
+        msg = 'memory budget must be a non-negative integer or None'
+        raise ValueError(msg)
+    with _lock:
+        _budget = nbytes
+        _directory = directory
+        enabled = nbytes is not None
+        if not enabled:
+            _arrays.clear()
+            _held.clear()
+            _nbytes = 0
+        elif _nbytes > _budget:
+            _spill(None)
+
+
+def get_memory_budget():
+    ''' The memory budget in bytes, or None if there is none. '''
+    return _budget
+
+
+def memory_stats():
+    ''' Counters of the memory budget.
+
+        Returns
+        --------
+        dict: 'budget' (bytes or None), 'nbytes' (bytes held by the tracked
+            Arrays), 'narrays' (number of tracked Arrays), 'spills' and
+            'faults' (number of Arrays spilled and loaded back) and
+            'spilled_bytes' (bytes written to temporary files).
+    '''
+    with _lock:
+        stats = dict(_stats)
+        stats.update(budget=_budget, nbytes=_nbytes, narrays=len(_arrays))
+    return stats
+
+
+def reset_memory_stats():
+    ''' Set the spill and fault counters of memory_stats to zero. '''
+    with _lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def _estimate_nbytes(values):
+    # Pointers plus the size of the boxed elements, estimated from a sample
+    # of at most _SAMPLE_SIZE elements
+    step = max(len(values) // _SAMPLE_SIZE, 1)
+    sample = values[::step]
+    element = sum(map(sys.getsizeof, sample)) / len(sample)
+    return int(values.nbytes + element * len(values))
+
+
+def _hold(data):
+    global _nbytes
+    key = id(data)
+    if key in _held:
+        _held[key][1] += 1
+    else:
+        nbytes = _estimate_nbytes(data.values)
+        _held[key] = [nbytes, 1]
+        _nbytes += nbytes
+    return key
+
+
+def _release(key):
+    global _nbytes
+    held = _held[key]
+    held[1] -= 1
+    if held[1] == 0:
+        _nbytes -= held[0]
+        del _held[key]
+
+
+def _forget(key, ref):
+    # Called when a tracked Array is garbage collected
+    with _lock:
+        entry = _arrays.get(key)
+        if entry is not None and entry[0] is ref:
+            del _arrays[key]
+            _release(entry[1])
+
+
+def touch(array):
+    ''' Mark the data of an Array as used, tracking it if it is new, and
+        spill other Arrays if the budget is exceeded. Called by Array._data.
+    '''
+    # The dtype is not set yet while an Array is constructed
+    if getattr(array, 'dtype', None) not in _SPILLABLE or len(array) == 0:
+        return
+    with _lock:
+        if not enabled or _spilling or array._series is None:
+            # Spilled by another thread since it was accessed
+            return
+        key = id(array)
+        entry = _arrays.pop(key, None)
+        if entry is not None and entry[1] == id(array._series):
+            # Most recently used
+            _arrays[key] = entry
+            return
+        if entry is not None:
+            # The data was replaced
+            _release(entry[1])
+        ref = weakref.ref(array, lambda ref, key=key: _forget(key, ref))
+        _arrays[key] = (ref, _hold(array._series))
+        if _nbytes > _budget:
+            _spill(array)
+
+
+def release(array):
+    ''' Stop tracking the data of an Array that is replaced or unloaded.
+        Called by Array._data and Array._set_lazy.
+    '''
+    with _lock:
+        entry = _arrays.pop(id(array), None)
+        if entry is not None:
+            _release(entry[1])
+
+
+def _spill(current):
+    # Spills the least recently used Arrays, except current, until the
+    # tracked bytes are within the budget
+    global _spilling
+    _spilling = True
+    try:
+        for key in list(_arrays):
+            if _nbytes <= _budget:
+                break
+            entry = _arrays.get(key)
+            array = None if entry is None else entry[0]()
+            if array is not None and array is not current:
+                _spill_array(array)
+    finally:
+        _spilling = False
+
+
+def _spill_array(array):
+    # Imported here because dframe.array.codec imports Array
+    from dframe.array.codec import encode_array, decode_series
+    kind, buffers = encode_array(array)
+    length = len(array)
+    entries, position = {}, 0
+    handle, path = tempfile.mkstemp(prefix='dframe-spill-', dir=_directory)
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            for name, buffer in buffers.items():
+                padding = -position % _ALIGNMENT
+                f.write(b'\0' * padding)
+                position += padding
+                f.write(buffer.tobytes())
+                entries[name] = (position, len(buffer), buffer.dtype.str)
+                position += buffer.nbytes
+        if position == 0:
+            return
+        with open(path, 'rb') as f:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    finally:
+        # The memory map stays valid after the file is removed
+        os.remove(path)
+
+    def load():
+        with _lock:
+            _stats['faults'] += 1
+        spilled = {name: np.frombuffer(source, dtype=np.dtype(str(dtype)),
+                                       count=count, offset=offset)
+                   for name, (offset, count, dtype) in entries.items()}
+        series, _ = decode_series(kind, spilled, length)
+        return series
+
+    array._set_lazy(load, length)
+    array._shared = False
+    _stats['spills'] += 1
+    _stats['spilled_bytes'] += position
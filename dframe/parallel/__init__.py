@@ -0,0 +1 @@
+from .parallel import set_num_threads, get_num_threads, map_columns
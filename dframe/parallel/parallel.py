@@ -0,0 +1,68 @@
+from __future__ import absolute_import
+
+import threading
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from dframe.dtypes import is_integer
+
+# A process-wide pool of threads for independent per-column work. With one
+# thread (the default) the work runs in the calling thread. Work that runs
+# inside a pool thread never uses the pool again, so nested calls cannot
+# wait on threads that are all busy.
+
+_num_threads = 1
+_pool = None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def set_num_threads(n=None):
+    ''' Set the number of threads used for per-column work, such as row
+        selection, deletion, stacking and conversion of the columns of a
+        DataFrame. Columns are processed concurrently; numpy and I/O steps
+        that release the GIL run in parallel.
+
+        Args
+        -----
+        n (int): number of threads; 1 disables threading. None uses the
+            number of CPUs.
+    '''
+    global _num_threads, _pool
+    if n is None:
+        n = multiprocessing.cpu_count()
+    if not is_integer(n) or n < 1:
+        msg = 'number of threads must be a positive integer'
+        raise ValueError(msg)
+    with _lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+        _num_threads = int(n)
+
+
+def get_num_threads():
+    return _num_threads
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPool(_num_threads, initializer=_mark_worker)
+        return _pool
+
+
+def _mark_worker():
+    _local.worker = True
+
+
+def map_columns(func, columns):
+    ''' [func(column) for column in columns], computed by the thread pool
+        when there is more than one thread and more than one column.
+    '''
+    columns = list(columns)
+    if (_num_threads == 1 or len(columns) < 2 or
+            getattr(_local, 'worker', False)):
+        return [func(column) for column in columns]
+    return _get_pool().map(func, columns, chunksize=1)
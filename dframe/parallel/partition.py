@@ -0,0 +1,130 @@
+from __future__ import absolute_import
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+import multiprocessing
+import numpy as np
+
+from dframe.array import Array
+from dframe.dtypes import is_integer
+from dframe.dataframe import DataFrame
+from dframe.io.binary import _read_binary, _write_binary
+
+# Partitions are exchanged with the worker processes as files in the binary
+# format of dframe.io.binary, in shared memory (/dev/shm) where available.
+# Workers and the parent memory-map these files, so column buffers are
+# never pickled; only file paths are sent through the pool. The files are
+# private to this process tree, so columns of other dtypes (such as dates)
+# are stored pickled, which read_binary would refuse.
+
+_SHARED_MEMORY_DIR = '/dev/shm'
+_func = None
+
+
+def _temporary_directory():
+    if os.path.isdir(_SHARED_MEMORY_DIR) and os.access(_SHARED_MEMORY_DIR,
+                                                       os.W_OK):
+        return tempfile.mkdtemp(prefix='dframe-', dir=_SHARED_MEMORY_DIR)
+    return tempfile.mkdtemp(prefix='dframe-')
+
+
+def _init_worker(func):
+    # With fork, func is inherited rather than pickled, so lambdas and
+    # closures work too.
+    global _func
+    _func = func
+
+
+def _apply(func, df):
+    output = func(df)
+    if not isinstance(output, DataFrame):
+        msg = 'function must return a DataFrame, not {}'
+        raise TypeError(msg.format(type(output).__name__))
+    return output
+
+
+def _read_partition(path):
+    return _read_binary(path, None, True, allow_pickle=True)
+
+
+def _run_partition(paths):
+    in_path, out_path = paths
+    output = _apply(_func, _read_partition(in_path))
+    _write_binary(output, out_path, allow_pickle=True)
+    return out_path
+
+
+def _combine(parts):
+    names = list(parts[0].names)
+    for part in parts[1:]:
+        if list(part.names) != names:
+            msg = 'function must return DataFrames with the same columns'
+            raise ValueError(msg)
+    columns = [Array.from_chunks([part[name] for part in parts])
+               for name in names]
+    return DataFrame._from_arrays(columns, names)
+
+
+def map_partitions(df, func, npartitions=None, nprocs=None):
+    ''' Apply a function to row partitions of a DataFrame in a pool of
+        processes and stack the results. Use it for CPU-heavy Python code,
+        which does not run in parallel in threads.
+
+        The partitions are written to shared memory in the binary format of
+        DataFrame.to_binary and memory-mapped by the workers, and the
+        results come back the same way. The columns of the output reference
+        the memory-mapped results of the partitions (see Array.from_chunks).
+
+        Args
+        -----
+        df (DataFrame)
+        func (function): takes a DataFrame and returns a DataFrame. Every
+            partition must give the same column names and compatible
+            dtypes. Where processes are not forked, func must be picklable.
+        npartitions (int): number of row partitions; defaults to nprocs.
+        nprocs (int): number of processes; defaults to the number of CPUs.
+            With one process, func is called in this process.
+
+        Returns
+        --------
+        DataFrame: the results of the partitions in row order.
+    '''
+    assert isinstance(df, DataFrame)
+    if nprocs is None:
+        nprocs = multiprocessing.cpu_count()
+    if npartitions is None:
+        npartitions = nprocs
+    for value in (nprocs, npartitions):
+        if not is_integer(value) or value < 1:
+            msg = 'nprocs and npartitions must be positive integers'
+            raise ValueError(msg)
+    npartitions = max(min(npartitions, df.nrow), 1)
+    bounds = np.linspace(0, df.nrow, npartitions + 1).astype(np.int64)
+    bounds = bounds.tolist()
+
+    if nprocs == 1 or npartitions == 1:
+        return _combine([_apply(func, df[start:stop, :]) for start, stop in
+                         zip(bounds[:-1], bounds[1:])])
+
+    directory = _temporary_directory()
+    try:
+        tasks = []
+        for i, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+            in_path = os.path.join(directory, 'in-{}.dframe'.format(i))
+            out_path = os.path.join(directory, 'out-{}.dframe'.format(i))
+            _write_binary(df[start:stop, :], in_path, allow_pickle=True)
+            tasks.append((in_path, out_path))
+        pool = multiprocessing.Pool(min(nprocs, npartitions),
+                                    initializer=_init_worker,
+                                    initargs=(func,))
+        try:
+            paths = pool.map(_run_partition, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        # The memory maps stay valid after the files are removed
+        return _combine([_read_partition(path) for path in paths])
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -145,9 +145,36 @@ class TestDataFrameFromNumpy:
                 else:
                     assert ydf[i, j] == self.y[i, j]
 
+    def test_from_numpy_layouts_and_dtypes(self):
+        c_order = np.arange(12).reshape((4, 3))
+        f_order = np.asfortranarray(c_order)
+        for array in [c_order, f_order, f_order.astype(np.int8)]:
+            df = DataFrame.from_numpy(array)
+            assert df.shape == (4, 3)
+            assert all(df.dtypes == int)
+            assert df.rows() == [tuple(row) for row in c_order.tolist()]
+
+        df = DataFrame.from_numpy(np.array([[True], [False]]))
+        assert df.dtypes.equals(Array([bool]))
+        assert df['C0'].equals(Array([True, False]))
+
+        df = DataFrame.from_numpy(np.array([['a', 'b'], ['c', 'd']]))
+        assert df.dtypes.equals(Array([str, str]))
+        assert df.rows() == [('a', 'b'), ('c', 'd')]
+
+        df = DataFrame.from_numpy(np.array([[1, None], [None, np.nan]],
+                                           dtype=object))
+        assert df.dtypes.equals(Array([int, type(None)]))
+        assert df.rows() == [(1, None), (None, None)]
+
+        df = DataFrame.from_numpy(np.array([[np.nan], [np.nan]]))
+        assert df.dtypes.equals(Array([type(None)]))
+
     def test_invalid_construction(self):
         with pytest.raises(ValueError):
             DataFrame.from_numpy(np.array([]))
+        with pytest.raises(ValueError):
+            DataFrame.from_numpy(self.x, ['a', 'b'])
         with pytest.raises(ValueError):
             DataFrame.from_numpy(np.array([1, 2, 3]))
         with pytest.raises(ValueError):
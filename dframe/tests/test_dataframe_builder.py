@@ -0,0 +1,84 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame, DataFrameBuilder
+
+
+class TestDataFrameBuilder:
+    rows = [[1, 'a', 3.4], [2, None, float('nan')], [None, 'c', 5.0]]
+    names = ['a', 'b', 'c']
+
+    def test_empty_builder(self):
+        df = DataFrameBuilder().build()
+        assert isinstance(df, DataFrame)
+        assert df.shape == (0, 0)
+        df = DataFrameBuilder(self.names).build()
+        assert df.shape == (0, 3)
+        assert df.names.equals(Array(self.names))
+        assert all(df.dtypes == type(None))
+
+    def test_append_rows(self):
+        builder = DataFrameBuilder(self.names)
+        for row in self.rows:
+            builder.append(row)
+        assert len(builder) == 3
+        df = builder.build()
+        assert df.shape == (3, 3)
+        assert df.dtypes.equals(Array([int, str, float]))
+        assert df.rows() == [(1, 'a', 3.4), (2, None, None),
+                             (None, 'c', 5.0)]
+        assert df.equals(DataFrame.from_rows(self.rows, self.names))
+
+    def test_extend_rows_generic_names(self):
+        df = DataFrameBuilder().extend(self.rows).build()
+        assert df.names.equals(Array(['C0', 'C1', 'C2']))
+        assert df.equals(DataFrame.from_rows(self.rows))
+
+    def test_records(self):
+        builder = DataFrameBuilder()
+        builder.append(OrderedDict([('a', 1), ('b', 'x')]))
+        builder.extend([{'a': 2}, OrderedDict([('b', 'y'), ('c', True)])])
+        df = builder.build()
+        assert df.names.equals(Array(['a', 'b', 'c']))
+        assert df.dtypes.equals(Array([int, str, bool]))
+        assert df.rows() == [(1, 'x', None), (2, None, None),
+                             (None, 'y', True)]
+
+    def test_build_resets_rows_and_keeps_columns(self):
+        builder = DataFrameBuilder()
+        builder.append({'a': 1})
+        first = builder.build()
+        assert first.shape == (1, 1)
+        assert len(builder) == 0
+        builder.append({})
+        second = builder.build()
+        assert second.names.equals(Array(['a']))
+        assert second.dtypes.equals(Array([type(None)]))
+        with pytest.raises(ValueError):
+            builder.append({'a': 'x'})
+
+    def test_invalid_rows_are_not_appended(self):
+        builder = DataFrameBuilder(self.names)
+        builder.append(self.rows[0])
+        with pytest.raises(ValueError):
+            builder.append([1, 2])
+        with pytest.raises(ValueError):
+            builder.extend([[3, 'd', 1.0], ['x', 'e', 2.0]])
+        with pytest.raises(ValueError):
+            builder.append({'d': 1})
+        assert len(builder) == 1
+        df = builder.build()
+        assert df.rows() == [tuple(self.rows[0])]
+
+    def test_invalid_records_roll_back_new_columns(self):
+        builder = DataFrameBuilder()
+        builder.append({'a': 1})
+        with pytest.raises(ValueError):
+            builder.extend([{'b': 1}, {'a': 'x'}])
+        assert builder.names.equals(Array(['a']))
+        with pytest.raises(ValueError):
+            DataFrameBuilder(['a', 'a'])
+        with pytest.raises(ValueError):
+            DataFrameBuilder().append({1: 2})
@@ -0,0 +1,135 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+import numpy as np
+from collections import OrderedDict
+from dframe import Array, DataFrame, vstack, rbind
+
+
+def make_dfs():
+    return [DataFrame(OrderedDict([('a', [1, 2, None]),
+                                   ('b', ['x', None, 'z'])])),
+            DataFrame(OrderedDict([('a', [None, 3]),
+                                   ('b', [None, 'w'])])),
+            DataFrame(OrderedDict([('a', [4, 5]),
+                                   ('b', ['u', 'v'])]))]
+
+
+def is_chunked(df):
+    return all(column._chunks is not None for column in df.values())
+
+
+class TestChunkedArray:
+    def test_construction(self):
+        x = Array.from_chunks([Array([1, 2]), Array([]), Array([None, 3])])
+        assert len(x) == 4
+        assert x.dtype is int
+        assert len(x.chunks) == 2
+        assert x.tolist() == [1, 2, None, 3]
+        assert x.equals(Array([1, 2, None, 3]))
+        assert Array.from_chunks([]).dtype is type(None)
+        assert len(Array.from_chunks([x, Array([4])]).chunks) == 3
+        with pytest.raises(TypeError):
+            Array.from_chunks([Array([1]), Array(['a'])])
+        with pytest.raises(TypeError):
+            Array.from_chunks([[1, 2]])
+
+    def test_scans_do_not_consolidate(self):
+        x = Array.from_chunks([Array([1, 2]), Array([None]), Array([3, 4])])
+        assert (x > 1).equals(Array([False, True, None, True, True]))
+        assert x.isin([2, 3]).equals(
+            Array([False, True, False, True, False]))
+        values, missing = x._to_buffers()
+        assert values.dtype == np.int64
+        assert values[~missing].tolist() == [1, 2, 3, 4]
+        assert x._to_buffers(1, 4)[0][[0, 2]].tolist() == [2, 3]
+        np.testing.assert_array_equal(x.to_numpy(),
+                                      [1., 2., np.nan, 3., 4.])
+        assert x[3] == 3 and x[-1] == 4 and x[2] is None
+        assert x[1:4].equals(Array([2, None, 3]))
+        assert x._take(np.array([4, 0, 3])).equals(Array([4, 1, 3]))
+        assert str(x) == '[1, 2, None, 3, 4]'
+        assert x._chunks is not None
+
+    def test_random_access_consolidates(self):
+        first = Array([1, 2])
+        x = Array.from_chunks([first, Array([3])])
+        x._data
+        assert x._chunks is None
+        assert x.chunks == [x]
+        assert x.equals(Array([1, 2, 3]))
+        x = Array.from_chunks([first, Array([3])])
+        x[0] = 10
+        assert x.tolist() == [10, 2, 3]
+        assert first.tolist() == [1, 2]
+
+    def test_extend(self):
+        x = Array.from_chunks([Array([1])])
+        x.extend(Array([2, 3]))
+        assert len(x.chunks) == 2
+        assert x.tolist() == [1, 2, 3]
+        with pytest.raises(TypeError):
+            x.extend(Array(['a']))
+
+    def test_chunks_are_snapshots(self):
+        first, second = Array([1, 2]), Array([3, 4])
+        x = Array.from_chunks([first, second])
+        first[0] = 10
+        del second[0]
+        x.extend(second)
+        second.extend(Array([5]))
+        assert len(x) == 5
+        assert x.tolist() == [1, 2, 3, 4, 4]
+        assert first.tolist() == [10, 2]
+
+
+class TestLazyStacking:
+    def test_vstack(self):
+        dfs = make_dfs()
+        eager = vstack(dfs)
+        lazy = vstack(dfs, lazy=True)
+        assert is_chunked(lazy)
+        assert lazy.shape == (7, 2)
+        assert lazy.equals(eager)
+        assert lazy.dtypes.equals(eager.dtypes)
+        assert is_chunked(lazy)
+
+    def test_rbind(self):
+        dfs = make_dfs()
+        dfs[1] = dfs[1][:, ['b', 'a']]
+        lazy = rbind(dfs, lazy=True)
+        assert is_chunked(lazy)
+        assert lazy.equals(rbind(dfs))
+
+    def test_operations_are_chunk_wise(self):
+        lazy = vstack(make_dfs(), lazy=True)
+        rows = lazy.rows()
+        assert list(lazy.iterrows()) == rows
+        assert lazy.query('a > 2').rows() == [(3, 'w'), (4, 'u'), (5, 'v')]
+        assert lazy[np.arange(7) > 5, :].rows() == [(5, 'v')]
+        assert lazy[[6, 0], :].rows() == [(5, 'v'), (1, 'x')]
+        assert lazy.to_numpy().shape == (7, 2)
+        assert lazy[6, 'b'] == 'v'
+        assert is_chunked(lazy)
+
+    def test_modification_consolidates(self):
+        dfs = make_dfs()
+        lazy = vstack(dfs, lazy=True)
+        lazy[0, 'a'] = 100
+        assert lazy[0, 'a'] == 100
+        assert dfs[0][0, 'a'] == 1
+        assert lazy['a']._chunks is None
+
+    def test_inputs_modified_later(self):
+        dfs = make_dfs()
+        eager = vstack(dfs)
+        lazy = vstack(dfs, lazy=True)
+        del dfs[0][[0], :]
+        dfs[1][1, 'a'] = 30
+        dfs[2]['b'] = ['s', 't']
+        assert lazy.shape == (7, 2)
+        assert len(lazy['a'].tolist()) == 7
+        assert lazy[4, 'a'] == 3
+        assert lazy.equals(eager)
+        assert is_chunked(lazy)
@@ -0,0 +1,124 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+import numpy as np
+import pandas as pd
+from dframe import Array, DataFrame
+
+
+class TestArrayNumpy:
+    def test_from_numpy(self):
+        x = Array.from_numpy(np.array([1.5, np.nan, 2.0]))
+        assert x.dtype is float
+        assert x.equals(Array([1.5, None, 2.0]))
+        x = Array.from_numpy(np.array([1, 2, 3]), mask=[False, True, False])
+        assert x.dtype is int
+        assert x.equals(Array([1, None, 3]))
+        x = Array.from_numpy(np.array([1, 2]), mask=[True, True])
+        assert x.dtype is type(None)
+        with pytest.raises(ValueError):
+            Array.from_numpy(np.zeros((2, 2)))
+        with pytest.raises(ValueError):
+            Array.from_numpy(np.zeros(2), mask=[True])
+
+    def test_to_numpy(self):
+        x = Array([1, 2, 3]).to_numpy()
+        assert x.dtype == np.int64
+        assert x.tolist() == [1, 2, 3]
+        x = Array([1, None, 3]).to_numpy()
+        assert x.dtype == np.float64
+        assert np.isnan(x[1])
+        x = Array([True, None]).to_numpy()
+        assert x.dtype == object
+        assert x.tolist() == [True, None]
+        x = Array(['a', 'b']).to_numpy()
+        assert x.dtype == object
+        assert Array([True, False]).to_numpy().dtype == bool
+        assert Array([1, 2]).to_numpy(np.float32).dtype == np.float32
+        with pytest.raises(ValueError):
+            Array([1, None]).to_numpy(np.int64)
+
+
+class TestDataFrameToNumpy:
+    x = DataFrame.from_rows([[1, 2.5, True], [2, None, False]],
+                            ['a', 'b', 'c'])
+
+    def test_to_numpy_default_dtype(self):
+        y = self.x.to_numpy()
+        assert y.shape == (2, 3)
+        assert y.dtype == np.float64
+        assert y[0].tolist() == [1.0, 2.5, 1.0]
+        assert np.isnan(y[1, 1])
+        assert self.x[['a', 'c']].to_numpy().dtype == np.int64
+        assert self.x[['c']].to_numpy().dtype == bool
+
+    def test_to_numpy_dtype_and_order(self):
+        y = self.x[['a']].to_numpy(np.float32, order='F')
+        assert y.dtype == np.float32
+        assert y.flags['F_CONTIGUOUS']
+        y = self.x.to_numpy(object)
+        assert y[1].tolist() == [2, None, False]
+        with pytest.raises(ValueError):
+            self.x.to_numpy(np.int64)
+
+    def test_to_numpy_round_trip(self):
+        z = np.arange(12, dtype=np.float64).reshape((3, 4))
+        z[1, 2] = np.nan
+        y = DataFrame.from_numpy(z).to_numpy()
+        assert np.array_equal(np.isnan(y), np.isnan(z))
+        assert np.array_equal(np.nan_to_num(y), np.nan_to_num(z))
+
+    def test_empty(self):
+        assert DataFrame().to_numpy().shape == (0, 0)
+
+
+class TestDataFramePandas:
+    def test_from_pandas_does_not_modify_input(self):
+        xpd = pd.DataFrame({'a': [1, 2, 3], 'b': [1.5, np.nan, 2.5]},
+                           index=[10, 20, 30], columns=['a', 'b'])
+        before = xpd.copy()
+        xdf = DataFrame.from_pandas(xpd)
+        assert xpd.index.tolist() == [10, 20, 30]
+        assert xpd.equals(before)
+        assert xdf.dtypes.equals(Array([int, float]))
+        assert xdf.rows() == [(1, 1.5), (2, None), (3, 2.5)]
+
+    def test_from_pandas_dtypes(self):
+        xpd = pd.DataFrame({'a': [True, False], 'b': ['x', None],
+                            'c': [np.nan, np.nan]}, columns=['a', 'b', 'c'])
+        xdf = DataFrame.from_pandas(xpd)
+        assert xdf.dtypes.equals(Array([bool, str, type(None)]))
+        assert xdf.rows() == [(True, 'x', None), (False, None, None)]
+        assert type(xdf[0, 'a']) is bool
+
+    def test_from_pandas_nullable_integers(self):
+        xpd = pd.DataFrame({'a': pd.Series([1, None, 3], dtype='Int64')})
+        xdf = DataFrame.from_pandas(xpd)
+        assert xdf.dtypes.equals(Array([int]))
+        assert xdf['a'].equals(Array([1, None, 3]))
+
+    def test_to_pandas(self):
+        xdf = DataFrame.from_rows([[1, 1.5, True, 'x'],
+                                   [None, None, None, None]],
+                                  ['a', 'b', 'c', 'd'])
+        xpd = xdf.to_pandas()
+        assert xpd.columns.tolist() == ['a', 'b', 'c', 'd']
+        assert xpd.shape == (2, 4)
+        assert xpd.isna().values.tolist() == [[False] * 4, [True] * 4]
+        assert str(xpd['a'].dtype) == 'Int64'
+        assert xpd['b'].dtype == np.float64
+        assert xpd.iloc[0].tolist() == [1, 1.5, True, 'x']
+
+    def test_to_pandas_without_missing_values(self):
+        xdf = DataFrame.from_rows([[1, 1.5, True], [2, 2.5, False]])
+        xpd = xdf.to_pandas()
+        assert xpd.dtypes.tolist() == [np.int64, np.float64, bool]
+
+    def test_round_trip(self):
+        xdf = DataFrame.from_rows([[1, 'a', 2.5, False],
+                                   [None, None, None, None],
+                                   [3, 'c', 1.0, True]])
+        assert DataFrame.from_pandas(xdf.to_pandas()).equals(xdf)
+        assert DataFrame.from_pandas(DataFrame().to_pandas()).equals(
+            DataFrame())
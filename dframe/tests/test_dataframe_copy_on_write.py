@@ -0,0 +1,88 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import numpy as np
+from collections import OrderedDict
+from dframe import Array, DataFrame, hstack
+
+
+def make_df():
+    return DataFrame(OrderedDict([('a', [1, 2, 3]), ('b', ['x', 'y', 'z'])]))
+
+
+def shares(x, y):
+    return np.shares_memory(x._data.values, y._data.values)
+
+
+class TestArrayCopyOnWrite:
+    def test_constructor(self):
+        x = Array([1, 2, 3])
+        y = Array(x)
+        assert shares(x, y)
+        y[0] = 10
+        assert not shares(x, y)
+        assert x.tolist() == [1, 2, 3]
+        assert y.tolist() == [10, 2, 3]
+        x[1] = 20
+        assert x.tolist() == [1, 20, 3]
+        assert y.tolist() == [10, 2, 3]
+
+    def test_slice(self):
+        x = Array([1, 2, 3, 4])
+        y = x[1:3]
+        assert shares(x, y)
+        y[[0, 1]] = [5, 6]
+        assert x.tolist() == [1, 2, 3, 4]
+        x[1] = None
+        assert y.tolist() == [5, 6]
+
+    def test_delete(self):
+        x = Array([1, 2, 3])
+        y = Array(x)
+        del y[0]
+        del x[[1]]
+        assert x.tolist() == [1, 3]
+        assert y.tolist() == [2, 3]
+
+    def test_unshared_write_does_not_copy(self):
+        x = Array([1, 2, 3])
+        data = x._data
+        x[0] = 5
+        assert x._data is data
+
+
+class TestDataFrameCopyOnWrite:
+    def test_constructor(self):
+        x = make_df()
+        y = DataFrame(x)
+        assert shares(x['a'], y['a'])
+        y[0, 'a'] = 10
+        assert x[0, 'a'] == 1
+        # Only the modified column is copied
+        assert not shares(x['a'], y['a'])
+        assert shares(x['b'], y['b'])
+        y['c'] = [True, False, True]
+        assert x.names.equals(Array(['a', 'b']))
+        x['b'] = ['u', 'v', 'w']
+        assert y[0, 'b'] == 'x'
+
+    def test_selection(self):
+        x = make_df()
+        for y in [x[['a', 'b']], x[0:2], x.head(2), x[0:2, :]]:
+            assert shares(x['a'], y['a'])
+            y[0, 'a'] = 10
+            assert x[0, 'a'] == 1
+            assert y[0, 'a'] == 10
+
+    def test_hstack(self):
+        x = make_df()
+        y = hstack([x, DataFrame({'c': [1.0, 2.0, 3.0]})])
+        assert shares(x['b'], y['b'])
+        y[2, 'b'] = 'w'
+        assert x[2, 'b'] == 'z'
+
+    def test_names(self):
+        x = make_df()
+        names = x.names
+        names[0] = 'c'
+        assert x.names.equals(Array(['a', 'b']))
@@ -0,0 +1,52 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame
+
+
+def make_df():
+    return DataFrame(OrderedDict([
+        ('a', [1, 2, 1, None, 1, None, 2]),
+        ('b', ['x', 'y', 'x', 'z', 'y', 'z', 'y']),
+        ('c', [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5])]))
+
+
+class TestDuplicates:
+    def test_duplicated(self):
+        df = make_df()
+        assert df.duplicated().equals(Array([False] * 7))
+        assert df.duplicated(['a', 'b']).equals(
+            Array([False, False, True, False, False, True, True]))
+        assert df.duplicated(['a', 'b'], keep='last').equals(
+            Array([True, True, False, True, False, False, False]))
+        assert df.duplicated(['a', 'b'], keep=False).equals(
+            Array([True, True, True, True, False, True, True]))
+        assert df.duplicated('a').equals(
+            Array([False, False, True, False, True, True, True]))
+        with pytest.raises(ValueError):
+            df.duplicated(keep=True)
+        with pytest.raises(KeyError):
+            df.duplicated('zz')
+
+    def test_drop_duplicates(self):
+        df = make_df()
+        assert df.drop_duplicates(['a', 'b']).rows() == [
+            (1, 'x', 0.5), (2, 'y', 1.5), (None, 'z', 3.5), (1, 'y', 4.5)]
+        assert df.drop_duplicates('a', keep='last').rows() == [
+            (1, 'y', 4.5), (None, 'z', 5.5), (2, 'y', 6.5)]
+        assert df.drop_duplicates(['a', 'b'], keep=False).rows() == [
+            (1, 'y', 4.5)]
+        assert df.drop_duplicates().equals(df)
+
+    def test_distinct(self):
+        df = make_df()[:, ['a', 'b']]
+        distinct = df.distinct()
+        assert distinct.rows() == [(1, 'x'), (2, 'y'), (None, 'z'),
+                                   (1, 'y')]
+        assert distinct.names.tolist() == ['a', 'b']
+        assert distinct['a'].dtype is int
+        empty = df[[False] * 7, :]
+        assert empty.distinct().nrow == 0
+        assert DataFrame().distinct().equals(DataFrame())
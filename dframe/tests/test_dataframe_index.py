@@ -0,0 +1,103 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame
+
+
+def make_df():
+    return DataFrame(OrderedDict([('user', [3, 1, 2, None, 1, 5]),
+                                  ('name', ['c', 'a', 'b', 'd', None, 'a'])]))
+
+
+@pytest.fixture(params=['hash', 'sorted'])
+def kind(request):
+    return request.param
+
+
+class TestIndex:
+    def test_create_index(self, kind):
+        df = make_df()
+        df.create_index('user', kind=kind)
+        assert df.indexes() == {'user': kind}
+        df.drop_index('user')
+        assert df.indexes() == {}
+        with pytest.raises(ValueError):
+            df.create_index('user', kind='btree')
+        with pytest.raises(KeyError):
+            df.create_index('zz')
+
+    def test_equality(self, kind):
+        df = make_df()
+        expected = df['user'] == 1
+        df.create_index('user', kind=kind)
+        assert df['user']._index is not None
+        assert (df['user'] == 1).equals(expected)
+        assert (df['user'] == 1.0).equals(expected)
+        assert (df['user'] == 7).equals(
+            Array([False, False, False, None, False, False]))
+
+    def test_strings(self, kind):
+        df = make_df()
+        df.create_index('name', kind=kind)
+        assert df.query("name == 'a'")[:, 'user'].equals(Array([1, 5]))
+        assert df['name'].isin(['a', None]).equals(
+            Array([False, True, False, False, True, True]))
+
+    def test_isin(self, kind):
+        df = make_df()
+        expected = df['user'].isin([1, 5, 'x'])
+        df.create_index('user', kind=kind)
+        assert df['user'].isin([1, 5, 'x']).equals(expected)
+        assert df['user'].isin([]).equals(Array([False] * 6))
+
+    def test_range(self):
+        df = make_df()
+        expected = [df['user'] < 2, df['user'] <= 2, df['user'] > 2,
+                    df['user'] >= 2]
+        df.create_index('user', kind='sorted')
+        assert (df['user'] < 2).equals(expected[0])
+        assert (df['user'] <= 2).equals(expected[1])
+        assert (df['user'] > 2).equals(expected[2])
+        assert (df['user'] >= 2).equals(expected[3])
+
+    def test_query(self, kind):
+        df = make_df()
+        df.create_index('user', kind=kind)
+        df.create_index('name', kind=kind)
+        assert df.query('user == 1').rows() == [(1, 'a'), (1, None)]
+        assert df.query('1 == user').rows() == [(1, 'a'), (1, None)]
+        assert df.query("user in [2, 3] or name == 'a'").rows() == [
+            (3, 'c'), (1, 'a'), (2, 'b'), (5, 'a')]
+        assert df.query("user == 1 and name == 'a'").rows() == [(1, 'a')]
+        # Not answered by the index
+        assert df.query('user != 1').rows() == [(3, 'c'), (2, 'b'),
+                                                (5, 'a')]
+
+    def test_setitem_invalidates(self, kind):
+        df = make_df()
+        df.create_index('user', kind=kind)
+        df[0, 'user'] = 1
+        assert df['user']._index is None
+        assert df.query('user == 1')[:, 'name'].equals(
+            Array(['c', 'a', None]))
+        df['user'] = [9, 9, 8, 8, 7, 7]
+        assert df.indexes() == {'user': kind}
+        assert df.query('user == 8')[:, 'name'].equals(Array(['b', 'd']))
+
+    def test_delitem_invalidates(self, kind):
+        df = make_df()
+        df.create_index('user', kind=kind)
+        del df[[0, 1], :]
+        assert df.query('user == 1')[:, 'name'].equals(Array([None]))
+        assert (df['user'] == 5).equals(Array([False, None, False, True]))
+
+    def test_append_invalidates(self, kind):
+        df = make_df()
+        df.create_index('user', kind=kind)
+        assert (df['user'] == 4).equals(Array([False] * 3 + [None] +
+                                              [False] * 2))
+        df['user'].extend(Array([4]))
+        assert df['user'][[6]].equals(Array([4]))
+        assert df['user']._lookup('==', 4).tolist() == [6]
@@ -0,0 +1,159 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame, LazyFrame, scan_csv, read_csv_chunks
+from dframe.dataframe import grouping
+
+
+def make_df():
+    return DataFrame(OrderedDict([('k', ['a', 'b', 'a', None, 'b', 'a']),
+                                  ('x', [1, 2, 3, 4, None, 6]),
+                                  ('y', [1.5, 2.5, None, 4.5, 5.5, 6.5])]))
+
+
+@pytest.fixture
+def csv_path(tmpdir):
+    path = tmpdir.join('data.csv')
+    path.write('k,x,y,z\n'
+               'a,1,1.5,u\n'
+               'b,2,2.5,v\n'
+               'a,3,,w\n'
+               ',4,4.5,x\n'
+               'b,,5.5,y\n'
+               'a,6,6.5,z\n')
+    return str(path)
+
+
+class TestLazyFrame:
+    def test_collect_matches_eager(self):
+        df = make_df()
+        lf = df.lazy()
+        assert isinstance(lf, LazyFrame)
+        assert lf.collect().equals(df)
+        result = (lf.filter('x > 1').with_column('z', 'x * 2')
+                  .select('k', 'z').collect())
+        assert result.names.equals(Array(['k', 'z']))
+        assert result.rows() == [('b', 4), ('a', 6), (None, 8), ('a', 12)]
+        assert lf.head(2).collect().rows() == df.head(2).rows()
+
+    def test_snapshot(self):
+        df = make_df()
+        lf = df.lazy()
+        df[0, 'x'] = 100
+        assert lf.collect()[0, 'x'] == 1
+
+    def test_predicate_pushdown(self):
+        lf = make_df().lazy().with_column('z', 'x + 1').filter('x > 2')
+        lf = lf.filter('z < 6').select('k', 'z')
+        plan = lf.explain()
+        assert 'SCAN dataframe columns=[k, x] filter=x > 2' in plan
+        assert 'FILTER z < 6' in plan
+        assert lf.collect().rows() == [('a', 4), (None, 5)]
+
+    def test_fusion_and_pruning(self):
+        lf = (make_df().lazy().with_column('a', 'x + 1')
+              .with_column('b', 'a * 2').with_column('c', 'y * 2')
+              .select('k', 'b'))
+        plan = lf.explain()
+        assert 'WITH a = x + 1, b = a * 2' in plan
+        assert 'c = ' not in plan
+        assert 'columns=[k, x]' in plan
+        assert lf.collect().rows() == [('a', 4), ('b', 6), ('a', 8),
+                                       (None, 10), ('b', None), ('a', 14)]
+
+    def test_head_pushdown(self):
+        lf = make_df().lazy().with_column('z', 'x * 2').head(2)
+        assert 'limit=2' in lf.explain()
+        assert lf.collect().rows() == [('a', 1, 1.5, 2), ('b', 2, 2.5, 4)]
+        # Filters above a head are not pushed below it
+        lf = make_df().lazy().head(3).filter('x > 1')
+        assert lf.collect().rows() == [('b', 2, 2.5), ('a', 3, None)]
+
+    def test_groupby_agg(self):
+        lf = make_df().lazy().groupby('k').agg(
+            [('x', 'sum'), ('y', 'mean', 'avg'), ('x', 'count'),
+             ('y', 'max'), ('x', 'first')])
+        result = lf.collect()
+        assert result.names.equals(Array(['k', 'x_sum', 'avg', 'x_count',
+                                          'y_max', 'x_first']))
+        assert result.rows() == [('a', 10, 4.0, 3, 6.5, 1),
+                                 ('b', 2, 4.0, 1, 5.5, 2),
+                                 (None, 4, 4.5, 1, 4.5, 4)]
+        # Filters on keys go below the aggregation, others stay above
+        lf = lf.filter("k == 'a'").filter('x_sum > 5')
+        plan = lf.explain()
+        assert "filter=k == 'a'" in plan
+        assert 'FILTER x_sum > 5' in plan
+        assert lf.collect().rows() == [('a', 10, 4.0, 3, 6.5, 1)]
+        with pytest.raises(ValueError):
+            make_df().lazy().groupby('k').agg([('x', 'median')])
+
+    def test_join(self):
+        left = make_df().lazy()
+        right = DataFrame(OrderedDict([('k', ['a', 'b', 'c']),
+                                       ('x', [10, 20, 30])]))
+        result = left.join(right, on='k').select('k', 'x', 'x_right')
+        assert result.collect().rows() == [('a', 1, 10), ('b', 2, 20),
+                                           ('a', 3, 10), ('b', None, 20),
+                                           ('a', 6, 10)]
+        result = left.join(right, on='k', how='left').filter('x_right > 15')
+        assert result.collect()[:, 'x'].equals(Array([2, None]))
+        filtered = left.join(right, on='k').filter('x < 3')
+        assert 'filter=x < 3' in filtered.explain()
+
+    def test_invalid(self):
+        lf = make_df().lazy()
+        with pytest.raises(KeyError):
+            lf.select('zz')
+        with pytest.raises(KeyError):
+            lf.filter('zz > 1')
+        with pytest.raises(ValueError):
+            lf.join(lf, on='k', how='outer')
+
+
+class TestScanCsv:
+    def test_projection_and_predicate_pushdown(self, csv_path):
+        lf = scan_csv(csv_path).filter('x >= 3').select('z', 'k')
+        plan = lf.explain()
+        assert 'columns=[k, z]' in plan
+        assert 'filter=x >= 3' in plan
+        assert lf.collect().rows() == [('w', 'a'), ('x', None), ('z', 'a')]
+
+    def test_chunks(self, csv_path):
+        lf = scan_csv(csv_path, chunksize=2)
+        expected = [row for chunk in read_csv_chunks(csv_path, 2)
+                    for row in chunk.rows()]
+        assert lf.collect().rows() == expected
+        assert lf.collect().dtypes.equals(Array([str, int, float, str]))
+        result = lf.filter("k == 'a'").select('x').collect()
+        assert result[:, 'x'].equals(Array([1, 3, 6]))
+        assert lf.head(3).collect().nrow == 3
+        assert lf.filter('x > 1').head(2).collect()[:, 'x'].equals(
+            Array([2, 3]))
+
+    def test_missing_in_first_chunk(self, tmpdir):
+        path = tmpdir.join('late.csv')
+        path.write('a,b\n1,\n2,\n3,4\n4,5\n')
+        df = scan_csv(str(path), chunksize=2).filter('a > 1').collect()
+        assert df.rows() == [(2, None), (3, 4), (4, 5)]
+
+    def test_unsupported_kwargs(self, csv_path):
+        with pytest.raises(ValueError):
+            scan_csv(csv_path, usecols=['x'])
+
+
+class TestGrouping:
+    def test_factorize(self):
+        codes, ngroups = grouping.factorize([Array([1, 2, 1, None]),
+                                             Array(['a', 'b', 'a', 'a'])])
+        assert codes.tolist() == [0, 1, 0, 2]
+        assert ngroups == 3
+
+    def test_join_int_and_float_keys(self):
+        left = DataFrame(OrderedDict([('k', [1, 2, None])]))
+        right = DataFrame(OrderedDict([('k', [2.0, None]), ('v', ['x', 'y'])]))
+        assert grouping.join(left, right, ['k']).rows() == [(2, 'x')]
+        assert grouping.join(left, right, ['k'], how='left').rows() == [
+            (1, None), (2, 'x'), (None, None)]
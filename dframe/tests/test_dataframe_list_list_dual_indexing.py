@@ -0,0 +1,83 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+import numpy as np
+from collections import OrderedDict
+from dframe import Array, DataFrame
+from dframe.array.array import _resolve_index
+
+
+class TestListListDualIndexing:
+    ''' Row keys that select many rows are resolved once for all columns '''
+    x = DataFrame(OrderedDict([('a', [1, 2, None, 4]),
+                               ('b', ['a', None, 'c', 'd']),
+                               ('c', [True, False, True, None])]))
+
+    def test_logical_row_key(self):
+        for mask in [[True, False, False, True],
+                     np.array([True, False, False, True]),
+                     Array([True, False, False, True])]:
+            y = self.x[mask, :]
+            assert y.shape == (2, 3)
+            assert y.rows() == [(1, 'a', True), (4, 'd', None)]
+            assert y.dtypes.equals(Array([int, str, bool]))
+
+    def test_int_row_key(self):
+        y = self.x[[3, 0, -2], ['c', 'a']]
+        assert y.names.equals(Array(['c', 'a']))
+        assert y.rows() == [(None, 4), (True, 1), (True, None)]
+        y = self.x[np.array([1, 1]), :]
+        assert y.rows() == [(2, None, False), (2, None, False)]
+
+    def test_slice_row_key(self):
+        y = self.x[1:3, :]
+        assert y.rows() == [(2, None, False), (None, 'c', True)]
+        assert self.x[::-2, 0:2].rows() == [(4, 'd'), (2, None)]
+
+    def test_all_missing_selection_is_none_type(self):
+        y = self.x[[False, True, False, False], ['a', 'b']]
+        assert y.dtypes.equals(Array([int, type(None)]))
+        assert self.x[[], :].dtypes.equals(Array([type(None)] * 3))
+
+    def test_selection_is_a_copy(self):
+        x = DataFrame(OrderedDict([('a', [1, 2, 3]), ('b', [4, 5, 6])]))
+        y = x[0:2, :]
+        y[0, 'a'] = 10
+        assert x[0, 'a'] == 1
+
+    def test_invalid_row_keys(self):
+        with pytest.raises(IndexError):
+            self.x[[True, False], :]
+        with pytest.raises(IndexError):
+            self.x[[True, None, False, True], :]
+        with pytest.raises(IndexError):
+            self.x[[0, 4], :]
+        with pytest.raises(IndexError):
+            self.x[[-5], :]
+        with pytest.raises(ValueError):
+            self.x[[True, 1, 0, 0], :]
+        with pytest.raises(ValueError):
+            self.x[[1, False], :]
+
+    def test_logical_array_is_resolved(self):
+        # Masks built by comparisons are converted to positions once, from
+        # their typed buffers
+        mask = self.x['a'] > 1
+        assert mask.dtype is bool
+        assert _resolve_index(Array([True, False, False, True]),
+                              4).tolist() == [0, 3]
+        with pytest.raises(IndexError):
+            _resolve_index(mask, 4)
+        y = DataFrame(OrderedDict([('a', [1, 5, 3]), ('b', ['x', 'y', 'z'])]))
+        assert y[y['a'] > 2, :].rows() == [(5, 'y'), (3, 'z')]
+
+    def test_int_array_is_resolved(self):
+        index = _resolve_index(Array([3, 0, -2]), 4)
+        assert index.dtype == np.int64
+        assert index.tolist() == [3, 0, 2]
+        assert self.x[Array([3, 0]), ['a']].rows() == [(4,), (1,)]
+        with pytest.raises(IndexError):
+            _resolve_index(Array([0, None]), 4)
+        with pytest.raises(IndexError):
+            self.x[Array([0, 4]), :]
@@ -0,0 +1,101 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame
+
+
+def make_df():
+    return DataFrame(OrderedDict([
+        ('region', ['n', 's', 'n', 'n', 's', None, 'n']),
+        ('product', ['a', 'b', 'b', 'a', None, 'a', 'c']),
+        ('year', [2019, 2019, 2020, 2020, 2020, 2019, 2019]),
+        ('sales', [1, 2, 3, 4, 5, 6, None])]))
+
+
+class TestPivotTable:
+    def test_sum(self):
+        table = make_df().pivot_table('region', 'product', 'sales', 'sum')
+        assert table.names.tolist() == ['region', 'a', 'b', 'c']
+        assert table.rows() == [('n', 5, 3, None),
+                                ('s', None, 2, None),
+                                (None, 6, None, None)]
+        assert table['a'].dtype is int
+        assert table['c'].dtype is type(None)
+
+    def test_fill_value(self):
+        table = make_df().pivot_table('region', 'product', 'sales', 'sum',
+                                      fill_value=0)
+        assert table.rows() == [('n', 5, 3, 0), ('s', 0, 2, 0),
+                                (None, 6, 0, 0)]
+        table = make_df().pivot_table('region', 'year', 'sales', 'mean',
+                                      fill_value=0)
+        assert table.rows() == [('n', 1.0, 3.5), ('s', 2.0, 5.0),
+                                (None, 6.0, 0.0)]
+        assert table['2019'].dtype is float
+
+    def test_aggregates(self):
+        df = make_df()
+        assert df.pivot_table('region', 'year', 'sales', 'max').rows() == [
+            ('n', 1, 4), ('s', 2, 5), (None, 6, None)]
+        assert df.pivot_table('region', 'year', 'product',
+                              'last').rows() == [
+            ('n', 'c', 'a'), ('s', 'b', None), (None, 'a', None)]
+        assert df.pivot_table('region', 'year', 'sales',
+                              'count').rows() == [
+            ('n', 1, 2), ('s', 1, 1), (None, 1, 0)]
+        with pytest.raises(ValueError):
+            df.pivot_table('region', 'year', 'sales', 'median')
+        with pytest.raises(ValueError):
+            df.pivot_table('region', 'year', aggfunc='sum')
+        with pytest.raises(TypeError):
+            df.pivot_table('region', 'year', 'product', 'sum')
+
+    def test_multiple_index_columns(self):
+        table = make_df().pivot_table(['region', 'year'], 'product', 'sales',
+                                      'sum')
+        assert table.names.tolist() == ['region', 'year', 'a', 'b', 'c']
+        assert table.rows() == [('n', 2019, 1, None, None),
+                                ('s', 2019, None, 2, None),
+                                ('n', 2020, 4, 3, None),
+                                (None, 2019, 6, None, None)]
+
+    def test_no_index_columns(self):
+        table = make_df().pivot_table([], 'year', 'sales', 'sum')
+        assert table.rows() == [(9, 12)]
+
+    def test_crosstab(self):
+        df = make_df()
+        table = df.crosstab('region', 'product')
+        assert table.rows() == [('n', 2, 1, 1), ('s', 0, 1, 0),
+                                (None, 1, 0, 0)]
+        assert table.equals(df.pivot_table('region', 'product'))
+        empty = df[[False] * 7, :].crosstab('region', 'product')
+        assert empty.shape == (0, 1)
+
+    def test_no_values(self):
+        df = make_df()
+        df['sales'] = [None] * 7
+        table = df.pivot_table('region', 'year', 'sales', 'sum')
+        assert table.rows() == [('n', None, None), ('s', None, None),
+                                (None, None, None)]
+        table = df.pivot_table('region', 'year', 'sales', 'max',
+                               fill_value=0)
+        assert table.rows() == [('n', 0, 0), ('s', 0, 0), (None, 0, 0)]
+        assert table['2019'].dtype is int
+        df['product'] = [None] * 7
+        assert df.pivot_table('region', 'product', 'sales',
+                              'sum').shape == (0, 1)
+        assert df.pivot_table('region', 'product', 'year',
+                              'mean').shape == (0, 1)
+
+    def test_value_named_like_an_index_column(self):
+        df = DataFrame(OrderedDict([('k', ['a', 'b', 'a']),
+                                    ('v', ['k', 'x', 'k'])]))
+        table = df.crosstab('k', 'v')
+        assert table.names.tolist() == ['k', 'k_v', 'x']
+        assert table.rows() == [('a', 2, 0), ('b', 0, 1)]
+        df = DataFrame(OrderedDict([('k', ['a', 'b']), ('v', ['k', 'k_v'])]))
+        with pytest.raises(ValueError):
+            df.crosstab('k', 'v')
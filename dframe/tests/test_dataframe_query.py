@@ -0,0 +1,103 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame
+
+
+class TestEval:
+    x = DataFrame(OrderedDict([('a', [1, 2, None, 4]),
+                               ('b', [0.5, 1.5, 2.5, None]),
+                               ('c', [True, False, True, None]),
+                               ('region', ['EU', 'US', 'EU', None])]))
+
+    def test_arithmetic(self):
+        assert self.x.eval('a * b + a').equals(Array([1.5, 5.0, None, None]))
+        assert self.x.eval('a + 1').equals(Array([2, 3, None, 5]))
+        assert self.x.eval('a / 2').equals(Array([0.5, 1.0, None, 2.0]))
+        assert self.x.eval('a // 2').equals(Array([0, 1, None, 2]))
+        assert self.x.eval('-a % 3').equals(Array([2, 1, None, 2]))
+        assert self.x.eval('a ** 2').equals(Array([1, 4, None, 16]))
+        assert self.x.eval('c + c').equals(Array([2, 0, 2, None]))
+
+    def test_comparisons(self):
+        assert self.x.eval('a > 1').equals(Array([False, True, None, True]))
+        assert self.x.eval('1 < a <= 2').equals(
+            Array([False, True, None, False]))
+        assert self.x.eval('a == b').equals(
+            Array([False, False, None, None]))
+        assert self.x.eval("region == 'EU'").equals(
+            Array([True, False, True, None]))
+        assert self.x.eval("region != 'EU'").equals(
+            Array([False, True, False, None]))
+
+    def test_logical(self):
+        assert self.x.eval('a > 1 and c').equals(
+            Array([False, False, None, None]))
+        assert self.x.eval('a > 1 or c').equals(
+            Array([True, True, None, None]))
+        assert self.x.eval('not c').equals(Array([False, True, False, None]))
+
+    def test_membership(self):
+        assert self.x.eval('a in [1, 4]').equals(
+            Array([True, False, None, True]))
+        assert self.x.eval("region not in ('US',)").equals(
+            Array([True, False, True, None]))
+        assert self.x.eval('1 < a in [2, 4]').equals(
+            Array([False, True, None, True]))
+        with pytest.raises(ValueError):
+            self.x.eval('a in [1, 2] == True')
+
+    def test_literals(self):
+        assert self.x.eval('1 + 2').equals(Array([3, 3, 3, 3]))
+        assert self.x.eval('a + None').equals(Array([None] * 4))
+
+    def test_string_concatenation(self):
+        assert self.x.eval("region + '!'").equals(
+            Array(['EU!', 'US!', 'EU!', None]))
+
+    def test_integer_overflow(self):
+        df = DataFrame(OrderedDict([('b', [2 ** 62, 1, None])]))
+        assert df.eval('b * 1').equals(df['b'])
+        for expr in ('b * 4', 'b + b + b', 'b ** 2', '-b - b - b'):
+            with pytest.raises(OverflowError):
+                df.eval(expr)
+        with pytest.raises(OverflowError):
+            df.query('b * 4 > 0')
+
+    def test_errors(self):
+        with pytest.raises(KeyError):
+            self.x.eval('zz + 1')
+        with pytest.raises(ZeroDivisionError):
+            self.x.eval('a / (a - 1)')
+        with pytest.raises(ValueError):
+            self.x.eval('a.sum()')
+        with pytest.raises(ValueError):
+            self.x.eval('a in b')
+        with pytest.raises(TypeError):
+            self.x.eval('a and c')
+        with pytest.raises(SyntaxError):
+            self.x.eval('a +')
+
+
+class TestQuery:
+    x = DataFrame(OrderedDict([('price', [5, 15, 20, None, 12]),
+                               ('region', ['EU', 'EU', 'US', 'EU', None])]))
+
+    def test_query(self):
+        y = self.x.query("price > 10 and region == 'EU'")
+        assert y.names.equals(self.x.names)
+        assert y.rows() == [(15, 'EU')]
+        y = self.x.query('price >= 12')
+        assert y.rows() == [(15, 'EU'), (20, 'US'), (12, None)]
+        assert y.dtypes.equals(Array([int, str]))
+
+    def test_query_no_rows(self):
+        y = self.x.query('price > 100')
+        assert y.shape == (0, 2)
+        assert self.x.query('None').shape == (0, 2)
+
+    def test_query_requires_bool(self):
+        with pytest.raises(TypeError):
+            self.x.query('price + 1')
@@ -0,0 +1,74 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from builtins import range
+
+import pytest
+from dframe import DataFrame
+
+
+class TestDataFrameRowIteration:
+    x = DataFrame.from_rows([[1, 'a', 3.4, True],
+                             [2, None, 5.3, False],
+                             [3, 'c', None, None]],
+                            ['a', 'b', 'c', 'not a name'])
+
+    def test_rows(self):
+        rows = self.x.rows()
+        assert isinstance(rows, list)
+        assert rows == [(1, 'a', 3.4, True),
+                        (2, None, 5.3, False),
+                        (3, 'c', None, None)]
+        rows = self.x.rows(rows_as_tuple=False)
+        assert rows == [[1, 'a', 3.4, True],
+                        [2, None, 5.3, False],
+                        [3, 'c', None, None]]
+
+    def test_rows_empty(self):
+        assert DataFrame().rows() == []
+        assert DataFrame.from_shape((0, 2)).rows() == []
+
+    def test_iterrows(self):
+        rows = list(self.x.iterrows())
+        assert rows == self.x.rows()
+        for i, row in enumerate(self.x.iterrows()):
+            for j in range(self.x.ncol):
+                assert row[j] == self.x[i, j]
+
+    def test_itertuples(self):
+        rows = list(self.x.itertuples())
+        assert len(rows) == 3
+        assert rows[0].a == 1
+        assert rows[1].b is None
+        assert rows[2].c is None
+        assert rows[0]._fields == ('a', 'b', 'c', '_3')
+        assert rows[0][3] is True
+        assert type(rows[0]).__name__ == 'Row'
+        rows = list(self.x.itertuples(named=False))
+        assert rows == self.x.rows()
+
+    def test_itertuples_non_ascii_names(self):
+        x = DataFrame.from_rows([[1, 2, 3]], [u'\xe9t\xe9 1', u'\xe9', u'b'])
+        rows = list(x.itertuples())
+        assert rows == [(1, 2, 3)]
+        assert rows[0]._fields[0] == '_0'
+        assert rows[0].b == 3
+
+    def test_iterrowchunks(self):
+        chunks = list(self.x.iterrowchunks(2))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert chunks[0] + chunks[1] == self.x.rows()
+        chunks = list(self.x.iterrowchunks(5, rows_as_tuple=False))
+        assert chunks == [self.x.rows(rows_as_tuple=False)]
+        assert list(DataFrame().iterrowchunks(2)) == []
+        with pytest.raises(ValueError):
+            list(self.x.iterrowchunks(0))
+
+    def test_iteration_across_internal_chunks(self):
+        df = DataFrame({'a': list(range(25)),
+                        'b': [str(i) for i in range(25)]})
+        df._iter_chunksize = 4
+        rows = list(df.iterrows())
+        assert len(rows) == 25
+        for i, row in enumerate(rows):
+            assert row[df.names.tolist().index('a')] == i
+        assert rows == df.rows()
@@ -0,0 +1,67 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame, vstack, rbind, hstack
+
+
+def make_df(a, b):
+    return DataFrame(OrderedDict([('a', a), ('b', b)]))
+
+
+class TestVstack:
+    def test_vstack(self):
+        x = make_df([1, None], ['x', 'y'])
+        y = DataFrame(OrderedDict([('c', [3]), ('d', [None])]))
+        y['d'] = ['z']
+        z = vstack([x, y])
+        assert z.names.equals(Array(['a', 'b']))
+        assert z.dtypes.equals(Array([int, str]))
+        assert z.rows() == [(1, 'x'), (None, 'y'), (3, 'z')]
+
+    def test_vstack_many_small_frames(self):
+        dfs = [make_df([i], [str(i)]) for i in range(300)]
+        z = vstack(dfs)
+        assert z.shape == (300, 2)
+        assert z[:, 'a'].equals(Array(list(range(300))))
+        assert z[:, 'b'].equals(Array([str(i) for i in range(300)]))
+
+    def test_vstack_does_not_share_data(self):
+        x = make_df([1, 2], ['x', 'y'])
+        z = vstack([x])
+        z[0, 'a'] = 10
+        assert x[0, 'a'] == 1
+
+    def test_vstack_errors(self):
+        x = make_df([1, 2], ['x', 'y'])
+        with pytest.raises(ValueError):
+            vstack([x, make_df(['1'], ['x'])])
+        with pytest.raises(ValueError):
+            vstack([x, DataFrame({'a': [1]})])
+        assert vstack([]).shape == (0, 0)
+
+
+class TestRbind:
+    def test_rbind_matches_names(self):
+        x = make_df([1, 2], ['x', 'y'])
+        y = DataFrame(OrderedDict([('b', ['z']), ('a', [3])]))
+        z = rbind([x, y])
+        assert z.names.equals(Array(['a', 'b']))
+        assert z.rows() == [(1, 'x'), (2, 'y'), (3, 'z')]
+
+    def test_rbind_errors(self):
+        x = make_df([1, 2], ['x', 'y'])
+        with pytest.raises(ValueError):
+            rbind([x, DataFrame(OrderedDict([('a', [1]), ('c', ['x'])]))])
+        with pytest.raises(ValueError):
+            rbind([x, DataFrame(OrderedDict([('b', [1]), ('a', ['x'])]))])
+
+
+class TestHstack:
+    def test_hstack(self):
+        x = make_df([1, 2], ['x', 'y'])
+        y = DataFrame({'c': [True, False]})
+        z = hstack([x, y])
+        assert z.names.equals(Array(['a', 'b', 'c']))
+        assert z.rows() == [(1, 'x', True), (2, 'y', False)]
@@ -0,0 +1,96 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame
+from dframe.dataframe import window
+
+
+def make_df():
+    return DataFrame(OrderedDict([
+        ('user', ['a', 'b', 'a', 'a', 'b', 'a', None]),
+        ('time', [3, 1, 1, 2, 5, 2, 4]),
+        ('amount', [10, 20, None, 5, 1, 7, 3]),
+        ('price', [1.5, None, 2.5, 0.5, 3.0, 1.0, 2.0])]))
+
+
+class TestWindow:
+    def test_row_number(self):
+        df = make_df()
+        w = df.window('user', 'time')
+        assert w.row_number().equals(Array([4, 1, 1, 2, 2, 3, 1]))
+        assert df.window().row_number().equals(Array(list(range(1, 8))))
+        assert df.window(order_by='time', ascending=False).row_number(
+            ).equals(Array([3, 6, 7, 4, 1, 5, 2]))
+
+    def test_rank(self):
+        df = make_df()
+        w = df.window('user', 'time')
+        assert w.rank().equals(Array([4, 1, 1, 2, 2, 2, 1]))
+        assert w.rank(dense=True).equals(Array([3, 1, 1, 2, 2, 2, 1]))
+        assert df.window('user').rank().equals(Array([1] * 7))
+        # None is ordered last
+        w = DataFrame({'x': [2, None, 1, 2]}).window(order_by='x')
+        assert w.rank().equals(Array([2, 4, 1, 2]))
+
+    def test_lag_lead(self):
+        w = make_df().window('user', 'time')
+        assert w.lag('amount').equals(Array([7, None, None, None, 20, 5,
+                                             None]))
+        assert w.lead('amount').equals(Array([None, 1, 5, 7, None, 10,
+                                              None]))
+        assert w.lag('time', 2).equals(Array([2, None, None, None, None,
+                                              1, None]))
+        assert w.lead('time', 0).equals(make_df()['time'])
+        assert w.lag('time', default=0).equals(Array([2, 0, 0, 1, 1, 2, 0]))
+        with pytest.raises(TypeError):
+            w.lag('time', default='x')
+        with pytest.raises(ValueError):
+            w.lag('time', 1.5)
+
+    def test_cumulative(self):
+        w = make_df().window('user', 'time')
+        assert w.cumsum('amount').equals(Array([22, 20, None, 5, 21, 12, 3]))
+        assert w.cumcount('amount').equals(Array([3, 1, 0, 1, 2, 2, 1]))
+        assert w.cummean('amount').equals(Array([22 / 3.0, 20.0, None, 5.0,
+                                                 10.5, 6.0, 3.0]))
+        assert w.cummin('price').equals(Array([0.5, None, 2.5, 0.5, 3.0,
+                                               0.5, 2.0]))
+        assert w.cummax('amount').equals(Array([10, 20, None, 5, 20, 7, 3]))
+        for func in (w.cumsum, w.cumcount, w.cummin, w.cummax):
+            assert func('amount').dtype is int
+        assert w.cummin('price').dtype is float
+        with pytest.raises(TypeError):
+            w.cumsum('user')
+
+    def test_later_changes_to_df(self):
+        df = make_df()
+        w = df.window('user', 'time')
+        del df[[0, 1], :]
+        df[0, 'amount'] = 100
+        assert w.row_number().equals(Array([4, 1, 1, 2, 2, 3, 1]))
+        assert w.cumsum('amount').equals(Array([22, 20, None, 5, 21, 12, 3]))
+
+    def test_multiple_order_columns(self):
+        df = DataFrame(OrderedDict([('g', [1, 1, 1, 1]),
+                                    ('x', [1, 1, 2, 2]),
+                                    ('y', ['b', 'a', 'a', 'b'])]))
+        w = df.window('g', ['x', 'y'], ascending=[False, True])
+        assert w.row_number().equals(Array([4, 3, 1, 2]))
+        with pytest.raises(ValueError):
+            df.window('g', ['x', 'y'], ascending=[True])
+
+    def test_lexsort(self, monkeypatch):
+        expected = make_df().window('user', ['time', 'amount']).row_number()
+        # Keys that do not fit in one mixed radix key
+        monkeypatch.setattr(window, '_MAX_CODES', 2)
+        w = make_df().window('user', ['time', 'amount'])
+        assert w.row_number().equals(expected)
+
+    def test_empty(self):
+        df = make_df()[[False] * 7, :]
+        w = df.window('user', 'time')
+        assert len(w.row_number()) == 0
+        assert len(w.lag('amount')) == 0
+        assert len(w.cumsum('amount')) == 0
@@ -0,0 +1,112 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame, read_binary, identical
+from dframe.io import binary
+
+
+@pytest.fixture
+def df():
+    return DataFrame(OrderedDict([('a', [1, 2, None, 4]),
+                                  ('b', ['x', None, 'zz', 'w']),
+                                  ('c', [1.5, None, -2.0, 1e300]),
+                                  ('d', [True, False, None, True]),
+                                  ('e', [None, None, None, None]),
+                                  ('f', [u'\xe9', u'b', None, u''])]))
+
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join('data.dframe'))
+
+
+class TestBinary:
+    def test_round_trip(self, df, path):
+        df.to_binary(path)
+        for mmap in [True, False]:
+            loaded = DataFrame.from_binary(path, mmap=mmap)
+            assert identical(loaded, df)
+            assert loaded.dtypes.equals(df.dtypes)
+            for j in range(df.ncol):
+                assert loaded[:, j].equals(df[:, j])
+
+    def test_lazy_columns(self, df, path):
+        df.to_binary(path)
+        loaded = read_binary(path)
+        assert loaded.shape == df.shape
+        assert loaded.dtypes.equals(df.dtypes)
+        column = loaded._data[0]
+        assert not column._is_loaded()
+        assert len(column) == 4
+        assert not column._is_loaded()
+        assert column.tolist() == [1, 2, None, 4]
+        assert column._is_loaded()
+        assert not loaded._data[1]._is_loaded()
+
+    def test_column_projection(self, df, path):
+        df.to_binary(path)
+        loaded = read_binary(path, names=['f', 'a'])
+        assert loaded.names.equals(Array(['f', 'a']))
+        assert loaded[:, 'a'].equals(df[:, 'a'])
+        assert loaded[:, 'f'].equals(df[:, 'f'])
+        with pytest.raises(KeyError):
+            read_binary(path, names=['zz'])
+
+    def test_empty(self, path):
+        df = DataFrame(OrderedDict([('a', []), ('b', [])]))
+        df.to_binary(path)
+        loaded = read_binary(path)
+        assert loaded.shape == (0, 2)
+        assert loaded.names.equals(Array(['a', 'b']))
+        DataFrame().to_binary(path)
+        assert read_binary(path).shape == (0, 0)
+
+    def test_all_missing_strings(self, path):
+        df = DataFrame(OrderedDict([('a', [1, 2]), ('b', ['x', 'y'])]))
+        df[:, 'b'] = [None, None]
+        df.to_binary(path)
+        loaded = read_binary(path)
+        assert loaded[:, 'b'].equals(df[:, 'b'])
+        assert loaded.dtypes.equals(df.dtypes)
+
+    def test_no_pickle(self, df, path):
+        with pytest.raises(TypeError):
+            DataFrame(OrderedDict([('g', [(1, 2), None])])).to_binary(path)
+        # A file whose float column claims to be pickled
+        df.to_binary(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        with open(path, 'wb') as f:
+            f.write(data.replace(b'"kind": "float"', b'"kind":"pickle"'))
+        assert read_binary(path, names=['a']).equals(df[:, ['a']])
+        for mmap in [True, False]:
+            with pytest.raises(ValueError):
+                read_binary(path, mmap=mmap)
+
+    def test_memory_map_is_closed(self, df, path, monkeypatch):
+        mapped_files = []
+        base = binary._MappedFile
+
+        class MappedFile(base):
+            def __init__(self, *args):
+                base.__init__(self, *args)
+                mapped_files.append(self)
+
+        monkeypatch.setattr(binary, '_MappedFile', MappedFile)
+        df.to_binary(path)
+        loaded = read_binary(path)
+        source = mapped_files[0].source
+        for j in range(df.ncol - 1):
+            assert loaded[:, j].equals(df[:, j])
+        assert len(source[:8]) == 8
+        assert loaded[:, df.ncol - 1].equals(df[:, df.ncol - 1])
+        with pytest.raises(ValueError):
+            source[:8]
+
+    def test_not_binary_file(self, tmpdir):
+        path = tmpdir.join('data.csv')
+        path.write('a,b\n1,2\n')
+        with pytest.raises(ValueError):
+            read_binary(str(path))
@@ -0,0 +1,215 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from builtins import range
+
+import io
+import gzip
+import pytest
+import pandas as pd
+from dframe.compat import lzma
+from dframe import Array, DataFrame, read_csv_chunks, read_csv_parallel
+from dframe.io import csv
+
+
+CSV = '''a,b,c,d
+1,x,1.5,True
+2,y,2.0,False
+3,,2.5,True
+,z,3.0,
+5,w,4,True
+'''
+
+
+@pytest.fixture
+def csv_path(tmpdir):
+    path = tmpdir.join('data.csv')
+    path.write(CSV)
+    return str(path)
+
+
+class TestReadCsvChunks:
+    def test_chunks(self, csv_path):
+        chunks = list(read_csv_chunks(csv_path, chunksize=2))
+        assert [chunk.nrow for chunk in chunks] == [2, 2, 1]
+        for chunk in chunks:
+            assert chunk.names.equals(Array(['a', 'b', 'c', 'd']))
+            assert chunk.dtypes.equals(Array([int, str, float, bool]))
+        assert chunks[1].rows() == [(3, None, 2.5, True),
+                                    (None, 'z', 3.0, None)]
+        assert chunks[2].rows() == [(5, 'w', 4.0, True)]
+
+    def test_chunks_match_full_read(self, csv_path):
+        full = DataFrame.from_csv(csv_path)
+        rows = []
+        for chunk in DataFrame.from_csv(csv_path, chunksize=3):
+            rows.extend(chunk.rows())
+        assert rows == full.rows()
+        chunks = list(DataFrame.from_csv(csv_path, iterator=True))
+        assert len(chunks) == 1
+        assert chunks[0].equals(full)
+
+    def test_inconsistent_dtypes(self, tmpdir):
+        path = tmpdir.join('bad.csv')
+        path.write('a\n1\n2\nx\n')
+        chunks = read_csv_chunks(str(path), chunksize=2)
+        next(chunks)
+        with pytest.raises(ValueError):
+            next(chunks)
+        chunks = list(read_csv_chunks(str(path), chunksize=2,
+                                      dtype={'a': str}))
+        assert [chunk.dtypes[0] for chunk in chunks] == [str, str]
+
+    def test_missing_in_first_chunk(self, tmpdir):
+        path = tmpdir.join('late.csv')
+        path.write('a,b\n1,\n2,\n3,4\n4,5\n')
+        chunks = list(read_csv_chunks(str(path), chunksize=2))
+        assert [chunk[:, 'b'].dtype for chunk in chunks] == [type(None), int]
+        assert chunks[1].rows() == [(3, 4), (4, 5)]
+
+    def test_invalid_chunksize(self, csv_path):
+        with pytest.raises(ValueError):
+            list(read_csv_chunks(csv_path, chunksize=0))
+
+    def test_errors_on_call(self, csv_path, tmpdir):
+        # Raised by the call itself, before any chunk is requested
+        with pytest.raises(ValueError):
+            read_csv_chunks(csv_path, chunksize=0)
+        with pytest.raises(TypeError):
+            read_csv_chunks(csv_path, no_such_argument=1)
+        with pytest.raises(IOError):
+            read_csv_chunks(str(tmpdir.join('missing.csv')))
+
+
+class TestReadCsvParallel:
+    def test_matches_from_csv(self, csv_path):
+        full = DataFrame.from_csv(csv_path)
+        for partsize in [1, 7, 20, 1000]:
+            df = read_csv_parallel(csv_path, nprocs=2, partsize=partsize)
+            assert df.equals(full)
+
+    def test_quoted_newlines(self, tmpdir):
+        lines = ['id,text,value']
+        for i in range(40):
+            lines.append('{},"line one\nline ""{}"" two, with comma",{}'
+                         .format(i, i, i * 0.5))
+        path = tmpdir.join('quoted.csv')
+        path.write('\n'.join(lines) + '\n')
+        full = DataFrame.from_csv(str(path))
+        df = read_csv_parallel(str(path), nprocs=3, partsize=50)
+        assert df.equals(full)
+        assert df['id'].equals(Array(list(range(40))))
+        assert df[3, 'text'] == 'line one\nline "3" two, with comma'
+
+    def test_mixed_types_across_ranges(self, tmpdir):
+        path = tmpdir.join('mixed.csv')
+        path.write('a,b\n' + ''.join('{},{}\n'.format(i, i) for i in range(20))
+                   + 'x,\n')
+        df = read_csv_parallel(str(path), nprocs=2, partsize=10)
+        assert df.dtypes.equals(Array([str, float]))
+        assert df['a'].equals(Array([str(i) for i in range(20)] + ['x']))
+        assert df[20, 'b'] is None
+
+    def test_usecols(self, tmpdir):
+        path = tmpdir.join('abc.csv')
+        path.write('a,b,c\n' + ''.join('{},{},{}\n'.format(i, i + 1, i + 2)
+                                        for i in range(1, 40, 3)))
+        for usecols in (['b', 'c'], ['c', 'a'], [2, 0], ['b']):
+            expected = pd.read_csv(str(path), usecols=usecols)
+            df = read_csv_parallel(str(path), nprocs=2, partsize=20,
+                                   usecols=usecols)
+            assert df.names.tolist() == list(expected.columns)
+            for name in expected.columns:
+                assert df[name].tolist() == expected[name].tolist()
+        df = read_csv_parallel(str(path), nprocs=2, partsize=20,
+                               usecols=['c', 'a'])
+        assert df[0, :].rows() == [(1, 3)]
+
+    def test_text_dtype(self):
+        names = ['a', 'b', 'c']
+        assert csv._text_dtype(None, names, ['a']) == {'a': str}
+        assert csv._text_dtype({'b': float}, names, ['a']) == {
+            'a': str, 'b': float}
+        assert csv._text_dtype(float, names, ['a']) == {
+            'a': str, 'b': float, 'c': float}
+
+    def test_header_only(self, tmpdir):
+        path = tmpdir.join('empty.csv')
+        path.write('a,b\n')
+        df = read_csv_parallel(str(path), nprocs=2)
+        assert df.shape == (0, 2)
+        assert df.names.equals(Array(['a', 'b']))
+
+    def test_invalid_arguments(self, csv_path):
+        with pytest.raises(ValueError):
+            read_csv_parallel(csv_path, nprocs=0)
+        with pytest.raises(ValueError):
+            read_csv_parallel(csv_path, header=None)
+        with pytest.raises(ValueError):
+            read_csv_parallel(csv_path, partsize=0)
+        for key, value in [('comment', '#'), ('escapechar', '\\')]:
+            with pytest.raises(ValueError):
+                read_csv_parallel(csv_path, **{key: value})
+
+
+class TestToCsv:
+    x = DataFrame.from_rows([[1, 'plain', 1.5, True],
+                             [2, 'with, comma', None, False],
+                             [3, 'with "quote"', 0.1, None],
+                             [4, 'two\nlines', 1e20, True],
+                             [5, None, -2.0, False]],
+                            ['a', 'b', 'c', 'd'])
+
+    def test_round_trip(self, tmpdir):
+        path = str(tmpdir.join('out.csv'))
+        for chunksize in [1, 2, 100]:
+            self.x.to_csv(path, chunksize=chunksize)
+            assert DataFrame.from_csv(path).equals(self.x)
+
+    def test_text(self):
+        buf = io.BytesIO()
+        self.x[0:3, :].to_csv(buf, na_rep='NA')
+        assert buf.getvalue() == (b'a,b,c,d\n'
+                                  b'1,plain,1.5,True\n'
+                                  b'2,"with, comma",NA,False\n'
+                                  b'3,"with ""quote""",0.1,NA\n')
+        buf = io.StringIO()
+        self.x[0:1, ['a', 'c']].to_csv(buf, sep=';', header=False,
+                                       line_terminator='\r\n')
+        assert buf.getvalue() == u'1;1.5\r\n'
+
+    def test_sep_in_numbers(self, tmpdir):
+        buf = io.BytesIO()
+        self.x[0:2, ['a', 'c']].to_csv(buf, sep='.', header=False)
+        assert buf.getvalue() == b'1."1.5"\n2.\n'
+        path = str(tmpdir.join('out.csv'))
+        self.x[:, ['a', 'c', 'd']].to_csv(path, sep='.')
+        df = DataFrame.from_csv(path, sep='.')
+        assert df.equals(self.x[:, ['a', 'c', 'd']])
+
+    def test_compression(self, tmpdir):
+        compressions = ['gzip', 'bz2'] + (['xz'] if lzma is not None else [])
+        for compression in compressions:
+            path = str(tmpdir.join('out.csv.' + compression))
+            self.x.to_csv(path, chunksize=2, compression=compression)
+            df = DataFrame.from_csv(path, compression=compression)
+            assert df.equals(self.x)
+        path = str(tmpdir.join('out.csv.gz'))
+        self.x.to_csv(path)
+        with gzip.open(path) as f:
+            assert f.readline() == b'a,b,c,d\n'
+
+    def test_empty(self, tmpdir):
+        buf = io.BytesIO()
+        DataFrame().to_csv(buf)
+        assert buf.getvalue() == b''
+        buf = io.BytesIO()
+        DataFrame.from_shape((0, 2)).to_csv(buf)
+        assert buf.getvalue() == b'C0,C1\n'
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            self.x.to_csv(io.BytesIO(), chunksize=0)
+        with pytest.raises(ValueError):
+            self.x.to_csv(io.BytesIO(), compression='zip')
+        with pytest.raises(ValueError):
+            self.x.to_csv(io.StringIO(), compression='gzip')
@@ -0,0 +1,113 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import gzip
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame, read_jsonl, identical
+
+
+JSONL = '''{"a": 1, "b": "x", "c": 1.5}
+{"a": 2, "c": 2.0, "d": true}
+
+{"b": "z", "a": null, "c": null}
+{"a": 4, "b": "w", "c": 3.0, "d": false}
+'''
+
+
+@pytest.fixture
+def jsonl_path(tmpdir):
+    path = tmpdir.join('data.jsonl')
+    path.write(JSONL)
+    return str(path)
+
+
+class TestReadJsonl:
+    def test_read(self, jsonl_path):
+        df = read_jsonl(jsonl_path)
+        assert df.names.equals(Array(['a', 'b', 'c', 'd']))
+        assert df.dtypes.equals(Array([int, str, float, bool]))
+        assert df.rows() == [(1, 'x', 1.5, None),
+                             (2, None, 2.0, True),
+                             (None, 'z', None, None),
+                             (4, 'w', 3.0, False)]
+
+    def test_chunks_have_stable_columns(self, jsonl_path):
+        chunks = list(read_jsonl(jsonl_path, chunksize=2))
+        assert [chunk.nrow for chunk in chunks] == [2, 2]
+        assert chunks[0].names.equals(Array(['a', 'b', 'c', 'd']))
+        assert chunks[1].names.equals(Array(['a', 'b', 'c', 'd']))
+        assert chunks[1].rows() == [(None, 'z', None, None),
+                                    (4, 'w', 3.0, False)]
+
+    def test_new_key_in_later_chunk(self, jsonl_path):
+        chunks = list(read_jsonl(jsonl_path, chunksize=1))
+        assert chunks[0].names.equals(Array(['a', 'b', 'c']))
+        assert chunks[1].names.equals(Array(['a', 'b', 'c', 'd']))
+        assert chunks[2].names.equals(Array(['a', 'b', 'c', 'd']))
+        assert chunks[2][:, 'd'].equals(Array([None]))
+
+    def test_names(self, jsonl_path):
+        df = read_jsonl(jsonl_path, names=['d', 'a'])
+        assert df.names.equals(Array(['d', 'a']))
+        assert df.rows() == [(None, 1), (True, 2), (None, None),
+                             (False, 4)]
+
+    def test_buffer_and_compression(self, tmpdir):
+        df = read_jsonl(io.BytesIO(JSONL.encode('utf-8')))
+        assert df.shape == (4, 4)
+        path = str(tmpdir.join('data.jsonl.gz'))
+        with gzip.open(path, 'wb') as f:
+            f.write(JSONL.encode('utf-8'))
+        assert identical(read_jsonl(path), df)
+
+    def test_type_conflict_across_chunks(self, tmpdir):
+        path = tmpdir.join('data.jsonl')
+        path.write('{"a": 1}\n{"a": "x"}\n')
+        chunks = read_jsonl(str(path), chunksize=1)
+        next(chunks)
+        with pytest.raises(ValueError):
+            next(chunks)
+
+    def test_invalid_lines(self, tmpdir):
+        path = tmpdir.join('data.jsonl')
+        path.write('{"a": 1}\n{"a": \n')
+        with pytest.raises(ValueError) as e:
+            read_jsonl(str(path))
+        assert 'line 2' in str(e.value)
+        path.write('{"a": 1}\n[1, 2]\n')
+        with pytest.raises(ValueError):
+            read_jsonl(str(path))
+
+    def test_lines_that_make_a_valid_batch(self, tmpdir):
+        # Joined into one JSON array, these lines would parse
+        path = tmpdir.join('data.jsonl')
+        path.write('{"a": 0}\n\n{"a": 1}, {"a": 2}\n')
+        with pytest.raises(ValueError) as e:
+            read_jsonl(str(path))
+        assert 'line 3' in str(e.value)
+        path.write('{"a": 1,\n"b": 2}\n')
+        with pytest.raises(ValueError) as e:
+            read_jsonl(str(path))
+        assert 'line 1' in str(e.value)
+
+
+class TestToJsonl:
+    def test_round_trip(self, tmpdir):
+        df = DataFrame(OrderedDict([('a', [1, None, 3]),
+                                    ('b', ['x', 'y"z', None]),
+                                    ('c', [1.5, None, 1e-300]),
+                                    ('d', [True, None, False]),
+                                    ('e', [None, None, None])]))
+        for name in ['data.jsonl', 'data.jsonl.bz2']:
+            path = str(tmpdir.join(name))
+            df.to_jsonl(path, chunksize=2)
+            assert identical(DataFrame.from_jsonl(path), df)
+
+    def test_format(self, tmpdir):
+        df = DataFrame(OrderedDict([('a', [1, None]), ('b%', [True, False])]))
+        path = tmpdir.join('data.jsonl')
+        df.to_jsonl(str(path))
+        assert path.read() == ('{"a": 1, "b%": true}\n'
+                               '{"a": null, "b%": false}\n')
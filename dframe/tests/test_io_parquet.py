@@ -0,0 +1,117 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+import datetime
+import pandas as pd
+from collections import OrderedDict
+from dframe import Array, DataFrame, read_parquet, identical
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+@pytest.fixture
+def df():
+    return DataFrame(OrderedDict([
+        ('a', [1, 2, None, 4, 5, 6]),
+        ('b', ['x', None, 'zz', 'w', 'v', 'u']),
+        ('c', [1.5, None, -2.0, 1e300, 0.0, 2.5]),
+        ('d', [True, False, None, True, True, False]),
+        ('e', [None, None, None, None, None, None])]))
+
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join('data.parquet'))
+
+
+class TestParquet:
+    def test_round_trip(self, df, path):
+        df.to_parquet(path)
+        loaded = DataFrame.from_parquet(path)
+        assert identical(loaded, df)
+        assert loaded.dtypes.equals(df.dtypes)
+
+    def test_round_trip_row_groups(self, df, path):
+        df.to_parquet(path, row_group_size=4)
+        assert pq.ParquetFile(path).num_row_groups == 2
+        loaded = DataFrame.from_parquet(path)
+        assert identical(loaded, df)
+
+    def test_large_integers_with_missing(self, path):
+        df = DataFrame({'a': [2 ** 62 + 1, None, -2 ** 62 - 1]})
+        df.to_parquet(path)
+        assert read_parquet(path)[:, 'a'].equals(df[:, 'a'])
+
+    def test_column_projection(self, df, path):
+        df.to_parquet(path)
+        loaded = read_parquet(path, names=['c', 'a'])
+        assert loaded.names.equals(Array(['c', 'a']))
+        assert loaded[:, 'a'].equals(df[:, 'a'])
+        assert loaded[:, 'c'].equals(df[:, 'c'])
+        with pytest.raises(KeyError):
+            read_parquet(path, names=['zz'])
+
+    def test_filters(self, df, path):
+        df.to_parquet(path, row_group_size=2)
+        loaded = read_parquet(path, names=['b'], filters=[('a', '>=', 4)])
+        assert loaded.names.equals(Array(['b']))
+        assert loaded[:, 'b'].equals(Array(['w', 'v', 'u']))
+        loaded = read_parquet(path, filters=[('a', '>', 1), ('d', '==', True)])
+        assert loaded[:, 'a'].equals(Array([4, 5]))
+        loaded = read_parquet(path, filters=[('b', 'in', ['x', 'u'])])
+        assert loaded[:, 'a'].equals(Array([1, 6]))
+        loaded = read_parquet(path, filters=[('a', '!=', 2)])
+        assert loaded[:, 'a'].equals(Array([1, 4, 5, 6]))
+        loaded = read_parquet(path, filters=[('a', '>', 100)])
+        assert loaded.shape == (0, 5)
+
+    def test_filters_skip_row_groups(self, df, path, monkeypatch):
+        df.to_parquet(path, row_group_size=2)
+        read = []
+        read_row_group = pq.ParquetFile.read_row_group
+
+        def spy(self, i, *args, **kwargs):
+            read.append(i)
+            return read_row_group(self, i, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_group', spy)
+        loaded = read_parquet(path, filters=[('a', '<', 2)])
+        assert loaded[:, 'a'].equals(Array([1]))
+        assert read == [0]
+
+    def test_non_ascii_string_filters(self, path):
+        df = DataFrame({'s': [u'\xe9', u'a', u'b']})
+        df.to_parquet(path)
+        value = read_parquet(path)[0, 's']
+        loaded = read_parquet(path, filters=[('s', '==', value)])
+        assert loaded[:, 's'].equals(Array([value]))
+
+    def test_written_by_pandas(self, path):
+        pa = pytest.importorskip('pyarrow')
+        times = [datetime.datetime(2020, 1, 1, 10), None,
+                 datetime.datetime(2021, 5, 6)]
+        dates = [datetime.date(2020, 1, 1), None, datetime.date(2020, 2, 3)]
+        frame = pd.DataFrame(OrderedDict([('t', pd.to_datetime(times)),
+                                          ('d', dates), ('x', [1, 2, 3])]))
+        frame.to_parquet(path, engine='pyarrow')
+        loaded = read_parquet(path)
+        assert loaded[:, 't'].equals(Array(times))
+        assert loaded[:, 'd'].equals(Array(dates))
+        assert loaded.dtypes.tolist() == [datetime.datetime, datetime.date,
+                                          int]
+        # Nanosecond timestamps
+        pq.write_table(pa.Table.from_pandas(frame), path, version='2.0')
+        assert read_parquet(path, names=['t'])[:, 't'].equals(Array(times))
+
+    def test_invalid_filters(self, df, path):
+        df.to_parquet(path)
+        with pytest.raises(ValueError):
+            read_parquet(path, filters=[('a', '=~', 1)])
+        with pytest.raises(ValueError):
+            read_parquet(path, filters=[('a', 1)])
+
+    def test_unsupported_column_type(self, path):
+        df = DataFrame({'a': [(1, 2), (3,)]})
+        with pytest.raises(ValueError):
+            df.to_parquet(path)
@@ -0,0 +1,164 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import sqlite3
+import pytest
+from collections import OrderedDict
+from dframe import Array, DataFrame, read_sql, identical
+from dframe.io import sql
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    yield connection
+    connection.close()
+
+
+class Connection(object):
+    # A sqlite3 connection that records calls to rollback
+    Error = sqlite3.Error
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self.connection.cursor()
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.connection.rollback()
+
+
+@pytest.fixture
+def df():
+    return DataFrame(OrderedDict([('a', [1, 2, None, 4, 5]),
+                                  ('b', ['x', None, 'zz', 'w', 'v']),
+                                  ('c', [1.5, None, -2.0, 1e300, 0.0]),
+                                  ('e', [None, None, None, None, None])]))
+
+
+class TestSql:
+    def test_round_trip(self, df, connection):
+        df.to_sql('t', connection, batchsize=2)
+        loaded = DataFrame.from_sql('SELECT * FROM t', connection)
+        assert identical(loaded, df)
+
+    def test_chunks(self, df, connection):
+        df.to_sql('t', connection)
+        chunks = list(read_sql('SELECT a, b FROM t ORDER BY a', connection,
+                               chunksize=2))
+        assert [chunk.nrow for chunk in chunks] == [2, 2, 1]
+        for chunk in chunks:
+            assert chunk.names.equals(Array(['a', 'b']))
+        assert chunks[0].rows() == [(None, 'zz'), (1, 'x')]
+
+    def test_params_and_empty_result(self, df, connection):
+        df.to_sql('t', connection)
+        loaded = read_sql('SELECT a FROM t WHERE a > ?', connection,
+                          params=(2,))
+        assert loaded[:, 'a'].equals(Array([4, 5]))
+        loaded = read_sql('SELECT a, b FROM t WHERE a > 100', connection)
+        assert loaded.shape == (0, 2)
+
+    def test_bool_column(self, connection):
+        df = DataFrame(OrderedDict([('d', [True, None, False])]))
+        df.to_sql('t', connection)
+        # SQLite stores booleans as integers
+        loaded = read_sql('SELECT d FROM t', connection)
+        assert loaded[:, 'd'].equals(Array([1, None, 0]))
+
+    def test_if_exists(self, df, connection):
+        df.to_sql('t', connection)
+        with pytest.raises(ValueError):
+            df.to_sql('t', connection)
+        df.to_sql('t', connection, if_exists='append')
+        assert read_sql('SELECT * FROM t', connection).nrow == 10
+        df.to_sql('t', connection, if_exists='replace')
+        assert read_sql('SELECT * FROM t', connection).nrow == 5
+        with pytest.raises(ValueError):
+            df.to_sql('t', connection, if_exists='merge')
+
+    def test_failed_write_is_rolled_back(self, connection):
+        connection.execute('CREATE TABLE t ("a" INTEGER NOT NULL)')
+        connection.commit()
+        df = DataFrame({'a': [1, 2, None]})
+        with pytest.raises(sqlite3.IntegrityError):
+            df.to_sql('t', connection, if_exists='append', batchsize=1)
+        assert read_sql('SELECT * FROM t', connection).nrow == 0
+
+    def test_table_probe(self, df, connection):
+        wrapped = Connection(connection)
+        df.to_sql('t', wrapped)
+        df.to_sql('t', wrapped, if_exists='append')
+        # Only the savepoint of the failed probe is rolled back
+        assert wrapped.rollbacks == 0
+        assert read_sql('SELECT * FROM t', connection).nrow == 10
+
+    def test_pending_changes_are_kept(self, df, connection):
+        connection.execute('CREATE TABLE u ("x" INTEGER)')
+        connection.commit()
+        connection.execute('INSERT INTO u VALUES (1)')
+        df.to_sql('t', connection)
+        assert read_sql('SELECT * FROM u', connection).nrow == 1
+        assert read_sql('SELECT * FROM t', connection).nrow == 5
+
+    def test_probe_in_savepoint(self):
+        class Error(Exception):
+            pass
+
+        class Cursor(object):
+            def __init__(self, tables):
+                self.tables = tables
+                self.statements = []
+
+            def execute(self, query):
+                self.statements.append(query.split(' FROM ')[0])
+                if query.startswith('SELECT') and '"t"' not in self.tables:
+                    raise Error('no such table')
+
+            def fetchall(self):
+                return []
+
+        class Driver(object):
+            pass
+
+        connection = Driver()
+        connection.Error = Error
+        cursor = Cursor([])
+        assert not sql._table_exists(connection, cursor, 't')
+        assert cursor.statements == ['SAVEPOINT dframe_probe', 'SELECT *',
+                                     'ROLLBACK TO SAVEPOINT dframe_probe',
+                                     'RELEASE SAVEPOINT dframe_probe']
+        cursor = Cursor(['"t"'])
+        assert sql._table_exists(connection, cursor, 't')
+        assert cursor.statements == ['SAVEPOINT dframe_probe', 'SELECT *',
+                                     'RELEASE SAVEPOINT dframe_probe']
+
+    def test_probe_raises_other_errors(self, df, connection):
+        class Cursor(object):
+            def __init__(self):
+                self.cursor = connection.cursor()
+
+            def execute(self, query, *args):
+                if query.startswith('SELECT'):
+                    raise RuntimeError('not a driver error')
+                return self.cursor.execute(query, *args)
+
+            def __getattr__(self, name):
+                return getattr(self.cursor, name)
+
+        wrapped = Connection(connection)
+        wrapped.cursor = Cursor
+        with pytest.raises(RuntimeError):
+            df.to_sql('t', wrapped)
+        assert wrapped.rollbacks == 1
+
+    def test_unsupported_column_type(self, connection):
+        df = DataFrame({'a': [(1, 2), (3,)]})
+        with pytest.raises(ValueError):
+            df.to_sql('t', connection)
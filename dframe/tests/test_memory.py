@@ -0,0 +1,102 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import gc
+import pytest
+from collections import OrderedDict
+from dframe import (Array, DataFrame, set_memory_budget, get_memory_budget,
+                    memory_stats, reset_memory_stats)
+
+
+@pytest.fixture(autouse=True)
+def no_budget():
+    reset_memory_stats()
+    yield
+    set_memory_budget(None)
+
+
+def make_df(n=1000):
+    return DataFrame(OrderedDict([
+        ('a', list(range(n))),
+        ('b', [i / 2.0 if i % 3 else None for i in range(n)]),
+        ('c', ['s{}'.format(i % 7) for i in range(n)]),
+        ('d', [i % 2 == 0 for i in range(n)])]))
+
+
+class TestMemoryBudget:
+    def test_budget(self):
+        assert get_memory_budget() is None
+        set_memory_budget(10)
+        assert get_memory_budget() == 10
+        with pytest.raises(ValueError):
+            set_memory_budget(-1)
+        with pytest.raises(ValueError):
+            set_memory_budget('1MB')
+
+    def test_spills_least_recently_used(self):
+        x, y, z = [Array(list(range(i, i + 1000))) for i in range(3)]
+        set_memory_budget(10 ** 9)
+        x._data
+        nbytes = memory_stats()['nbytes']
+        set_memory_budget(int(nbytes * 2.5))
+        for array in (x, y, z):
+            array._data
+        assert not x._is_loaded()
+        assert y._is_loaded() and z._is_loaded()
+        stats = memory_stats()
+        assert stats['spills'] == 1 and stats['faults'] == 0
+        assert stats['narrays'] == 2
+        assert stats['nbytes'] <= stats['budget']
+
+        # x is loaded back and y, now the least recently used, is spilled
+        assert x[999] == 999
+        assert x.tolist() == list(range(1000))
+        assert not y._is_loaded()
+        stats = memory_stats()
+        assert stats['spills'] == 2 and stats['faults'] == 1
+        assert stats['spilled_bytes'] > 0
+
+    def test_dataframe(self):
+        df, expected = make_df(), make_df()
+        set_memory_budget(0)
+        for name in df.names:
+            df[name]._data
+        assert memory_stats()['spills'] >= 3
+        assert df.equals(expected)
+        assert df[10:12, :].rows() == expected[10:12, :].rows()
+        assert df.query('a < 5 and d').rows() == [(0, None, 's0', True),
+                                                   (2, 1.0, 's2', True),
+                                                   (4, 2.0, 's4', True)]
+        df[0, 'c'] = 'x'
+        df['e'] = df['a'] * 2
+        assert df[0, :].rows() == [(0, None, 'x', True, 0)]
+        assert df['e'][999] == 1998
+        assert memory_stats()['faults'] > 0
+
+    def test_shared_data_is_counted_once(self):
+        set_memory_budget(10 ** 9)
+        x = Array(list(range(1000)))
+        x._data
+        nbytes = memory_stats()['nbytes']
+        y = Array(x)
+        y._data
+        assert memory_stats()['nbytes'] == nbytes
+        assert memory_stats()['narrays'] == 2
+        y[0] = 5
+        y._data
+        assert memory_stats()['nbytes'] == 2 * nbytes
+        del x, y
+        gc.collect()
+        assert memory_stats()['nbytes'] == 0
+        assert memory_stats()['narrays'] == 0
+
+    def test_no_budget(self):
+        set_memory_budget(0)
+        x = Array(['a', 'b', None])
+        x._data
+        set_memory_budget(None)
+        assert memory_stats()['narrays'] == 0
+        assert x.tolist() == ['a', 'b', None]
+        assert x._is_loaded()
+        x._data
+        assert memory_stats()['narrays'] == 0
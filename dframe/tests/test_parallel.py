@@ -0,0 +1,57 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import pytest
+import numpy as np
+import dframe
+from dframe import Array, DataFrame, vstack
+from dframe.parallel import map_columns
+
+
+@pytest.fixture
+def threads():
+    dframe.set_num_threads(4)
+    yield 4
+    dframe.set_num_threads(1)
+
+
+def make_df(nrow=1000, ncol=8):
+    values = np.arange(nrow * ncol, dtype=np.float64).reshape(nrow, ncol)
+    return DataFrame.from_numpy(values)
+
+
+class TestParallel:
+    def test_set_num_threads(self, threads):
+        assert dframe.get_num_threads() == threads
+        dframe.set_num_threads(2)
+        assert dframe.get_num_threads() == 2
+        with pytest.raises(ValueError):
+            dframe.set_num_threads(0)
+        with pytest.raises(ValueError):
+            dframe.set_num_threads(1.5)
+
+    def test_map_columns(self, threads):
+        assert map_columns(lambda x: x * 2, range(10)) == list(range(0, 20, 2))
+        # Nested calls run in the worker thread
+        assert map_columns(lambda x: map_columns(abs, [-x, x]),
+                           [1, 2, 3]) == [[1, 1], [2, 2], [3, 3]]
+
+        def fail(x):
+            raise KeyError(x)
+        with pytest.raises(KeyError):
+            map_columns(fail, [1, 2])
+
+    def test_same_results(self, threads):
+        df = make_df()
+        dframe.set_num_threads(1)
+        expected = [df.query('C0 > 4000'), df[::3, :], vstack([df, df]),
+                    df.to_numpy()]
+        dframe.set_num_threads(threads)
+        assert df.query('C0 > 4000').equals(expected[0])
+        assert df[::3, :].equals(expected[1])
+        assert vstack([df, df]).equals(expected[2])
+        np.testing.assert_array_equal(df.to_numpy(), expected[3])
+        del df[[0, 1], :]
+        assert df.nrow == 998
+        assert df[0, :].rows() == [tuple(range(16, 24))]
+        assert df.to_pandas().shape == (998, 8)
@@ -0,0 +1,77 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import os
+import pytest
+import datetime
+from collections import OrderedDict
+from dframe import Array, DataFrame, map_partitions
+from dframe.parallel import partition
+
+
+def make_df(nrow=100):
+    return DataFrame(OrderedDict([
+        ('x', list(range(nrow))),
+        ('s', ['r{}'.format(i) if i % 7 else None for i in range(nrow)])]))
+
+
+def add_features(df):
+    x = df['x']
+    return DataFrame(OrderedDict([
+        ('x', x.tolist()),
+        ('square', [e * e for e in x]),
+        ('pid', [os.getpid()] * df.nrow)]))
+
+
+class TestMapPartitions:
+    def test_processes(self):
+        df = make_df()
+        result = map_partitions(df, add_features, npartitions=4, nprocs=2)
+        assert result.nrow == 100
+        assert result['x'].equals(df['x'])
+        assert result['square'].tolist() == [i * i for i in range(100)]
+        assert os.getpid() not in result['pid'].tolist()
+        assert len(result['x'].chunks) == 4
+
+    def test_lambda_and_strings(self):
+        df = make_df()
+        result = df.map_partitions(lambda part: part[part['x'] > 50, :],
+                                   npartitions=3, nprocs=3)
+        assert result.equals(df[df['x'] > 50, :])
+
+    def test_dates(self):
+        df = make_df(10)
+        df['day'] = [datetime.date(2020, 1, 1 + i) for i in range(10)]
+
+        def add_week(part):
+            return DataFrame(OrderedDict([
+                ('day', part['day'].tolist()),
+                ('week', [day + datetime.timedelta(7)
+                          for day in part['day']])]))
+
+        result = map_partitions(df, add_week, npartitions=3, nprocs=2)
+        assert result.equals(map_partitions(df, add_week, nprocs=1))
+        assert result['week'][9] == datetime.date(2020, 1, 17)
+        assert result['week'].dtype is datetime.date
+
+    def test_single_process(self):
+        df = make_df(10)
+        result = map_partitions(df, add_features, npartitions=3, nprocs=1)
+        assert result['pid'].tolist() == [os.getpid()] * 10
+        assert result['square'].tolist() == [i * i for i in range(10)]
+
+    def test_empty(self):
+        df = make_df(0)
+        assert map_partitions(df, add_features, nprocs=2).nrow == 0
+
+    def test_errors(self):
+        df = make_df()
+        with pytest.raises(TypeError):
+            map_partitions(df, lambda part: part.nrow, nprocs=2)
+        with pytest.raises(ValueError):
+            map_partitions(df, add_features, nprocs=0)
+
+    def test_files_are_removed(self, monkeypatch, tmpdir):
+        monkeypatch.setattr(partition, '_SHARED_MEMORY_DIR', str(tmpdir))
+        map_partitions(make_df(), add_features, nprocs=2)
+        assert tmpdir.listdir() == []
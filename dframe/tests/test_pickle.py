@@ -0,0 +1,135 @@
+from __future__ import print_function
+from __future__ import absolute_import
+
+import copy
+import pickle
+import datetime
+import threading
+import pytest
+import numpy as np
+from collections import OrderedDict
+from dframe import Array, DataFrame
+from dframe.compat import PickleBuffer
+
+PROTOCOLS = list(range(pickle.HIGHEST_PROTOCOL + 1))
+
+
+def make_df():
+    return DataFrame(OrderedDict([
+        ('a', [1, None, 3, 4]),
+        ('b', [0.5, 1.5, None, 2.5]),
+        ('c', [True, False, None, True]),
+        ('d', ['x', None, 'zz', '']),
+        ('e', [None] * 4),
+        ('f', [datetime.date(2020, 1, i) for i in range(1, 5)])]))
+
+
+@pytest.fixture(params=PROTOCOLS)
+def protocol(request):
+    return request.param
+
+
+class TestPickle:
+    def test_array(self, protocol):
+        for x in make_df().values():
+            y = pickle.loads(pickle.dumps(x, protocol=protocol))
+            assert y.equals(x)
+            assert y.dtype is x.dtype
+
+    def test_array_is_decoded_on_access(self):
+        x = pickle.loads(pickle.dumps(Array([1, 2, None]), protocol=2))
+        assert not x._is_loaded()
+        assert x.dtype is int
+        assert len(x) == 3
+        assert x.tolist() == [1, 2, None]
+
+    def test_all_missing_strings(self, protocol):
+        x = Array(['a', 'b'])
+        x[0] = None
+        x[1] = None
+        y = pickle.loads(pickle.dumps(x, protocol=protocol))
+        assert y.dtype is type(None)
+        assert y.tolist() == [None, None]
+
+    def test_dataframe(self, protocol):
+        df = make_df()
+        df2 = pickle.loads(pickle.dumps(df, protocol=protocol))
+        assert df2.equals(df)
+        assert df2.names.tolist() == df.names.tolist()
+        empty = DataFrame()
+        assert pickle.loads(pickle.dumps(empty, protocol=protocol)).equals(
+            empty)
+
+    def test_chunked_and_lazy(self, protocol):
+        x = Array.from_chunks([Array([1, 2]), Array([None, 4])])
+        y = pickle.loads(pickle.dumps(x, protocol=protocol))
+        assert y.equals(Array([1, 2, None, 4]))
+        z = pickle.loads(pickle.dumps(y, protocol=protocol))
+        assert z.equals(y)
+
+    def test_index_kind(self):
+        df = make_df()
+        df.create_index('a', kind='sorted')
+        df2 = pickle.loads(pickle.dumps(df, protocol=2))
+        assert df2.indexes() == {'a': 'sorted'}
+        assert df2.query('a == 3').rows() == df.query('a == 3').rows()
+
+    def test_no_boxed_elements(self):
+        # Typed buffers, not the object Series of the Array
+        data = pickle.dumps(make_df(), protocol=2)
+        assert b'pandas' not in data
+        assert b'datetime' in data  # an element of a 'pickle' column
+
+    @pytest.mark.skipif(PickleBuffer is None,
+                        reason='requires pickle protocol 5')
+    def test_out_of_band(self):
+        df = make_df()
+        buffers = []
+        data = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) > 0
+        assert df.equals(pickle.loads(data, buffers=buffers))
+        values = np.arange(1000)
+        buffers = []
+        pickle.dumps(Array.from_numpy(values), protocol=5,
+                     buffer_callback=buffers.append)
+        assert sum(buffer.raw().nbytes for buffer in buffers) == 8000
+
+
+class Box(object):
+    def __init__(self, value):
+        self.value = value
+
+
+class Holder(Box):
+    # An element that cannot be pickled
+    def __init__(self, value):
+        Box.__init__(self, value)
+        self.lock = threading.Lock()
+
+
+class TestCopy:
+    def test_copy(self):
+        holder = Holder(1)
+        x = Array([holder, None])
+        y = copy.copy(x)
+        assert y[0] is holder
+        y[1] = Holder(2)
+        assert x[1] is None
+        df = make_df()
+        df.create_index('a', kind='sorted')
+        df2 = copy.copy(df)
+        assert df2.equals(df) and df2.indexes() == {'a': 'sorted'}
+        df2[0, 'a'] = 100
+        assert df[0, 'a'] == 1
+
+    def test_deepcopy(self):
+        box = Box([1])
+        x = Array([box, box, None])
+        y = copy.deepcopy(x)
+        assert y[0] is not box and y[0].value == [1]
+        assert y[0] is y[1]
+        assert y.dtype is Box
+        df = make_df()
+        df2 = copy.deepcopy(df)
+        assert df2.equals(df)
+        assert df2.names.tolist() == df.names.tolist()
@@ -13,8 +13,9 @@ setup(name='dframe',
       keywords='dataframe indexless',
       license='',
       packages=['dframe', 'dframe.array', 'dframe.compat',
-                'dframe.dataframe', 'dframe.dtypes', 'dframe.missing',
-                'dframe.scalar'],
+                'dframe.dataframe', 'dframe.dtypes', 'dframe.general',
+                'dframe.io', 'dframe.memory', 'dframe.missing',
+                'dframe.parallel', 'dframe.scalar'],
       install_requires=[
           'future',
           'pandas',
@@ -22,6 +23,7 @@ setup(name='dframe',
           'prettytable',
           'python-dateutil'
       ],
+      extras_require={'parquet': ['pyarrow']},
       setup_requires=['pytest-runner'],
       tests_require=['pytest'],
       zip_safe=False)